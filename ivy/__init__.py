@@ -9,6 +9,7 @@ import sys
 
 import ivy.utils.backend.handler
 from ivy._version import __version__ as __version__
+from ivy.utils.context import ContextStack
 
 _not_imported_backends = list(ivy.utils.backend.handler._backend_dict.keys())
 try:
@@ -436,11 +437,11 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = list()
-array_decimal_values_stack = list()
-warning_level_stack = list()
-nan_policy_stack = list()
-dynamic_backend_stack = list()
+array_significant_figures_stack = ContextStack("array_significant_figures_stack")
+array_decimal_values_stack = ContextStack("array_decimal_values_stack")
+warning_level_stack = ContextStack("warning_level_stack")
+nan_policy_stack = ContextStack("nan_policy_stack")
+dynamic_backend_stack = ContextStack("dynamic_backend_stack")
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -860,6 +861,7 @@ from ivy.utils.backend import (
     backend_stack,
     choose_random_backend,
     unset_backend,
+    BackendPool,
 )
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
@@ -868,6 +870,7 @@ from . import functional
 from .functional import *
 from . import stateful
 from .stateful import *
+from . import data
 from ivy.utils.inspection import fn_array_spec, add_array_specs
 
 add_array_specs()
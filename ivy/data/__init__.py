@@ -0,0 +1,2 @@
+from . import loader
+from .loader import Loader
@@ -0,0 +1,316 @@
+# global
+import multiprocessing
+import traceback
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Optional
+
+import numpy as np
+
+# local
+import ivy
+from ivy.data_classes.container.checkpoint import _align
+from ivy.utils.backend.handler import _to_numpy_without_copy
+
+
+def _batch_items(batch):
+    # (key chain, numpy array or other value) for each leaf of the batch in order
+    if not isinstance(batch, ivy.Container):
+        batch = ivy.Container(batch)
+    return [
+        (kc, _to_numpy_without_copy(v) if ivy.is_array(v) else v)
+        for kc, v in batch.cont_to_iterator()
+    ]
+
+
+def _batch_nbytes(items):
+    return sum(_align(v.nbytes) for _, v in items if isinstance(v, np.ndarray))
+
+
+def _write_slot(buffer, slot_offset, items):
+    # the arrays are copied into the slot at aligned offsets, and the entries describe
+    # them to the consumer, with the other values sent as they are
+    entries = list()
+    offset = slot_offset
+    for key_chain, value in items:
+        if isinstance(value, np.ndarray):
+            dst = np.ndarray(value.shape, value.dtype, buffer=buffer, offset=offset)
+            np.copyto(dst, value)
+            entries.append((key_chain, value.dtype.str, value.shape, offset))
+            offset += _align(value.nbytes)
+        else:
+            entries.append((key_chain, value))
+    return entries
+
+
+def _worker_loop(producer, worker_idx, num_workers, num_batches, ready, free):
+    # produces the batches worker_idx, worker_idx + num_workers and so on into the
+    # slots of the ring buffer, which are handed back on the free queue once the
+    # consumer no longer uses them
+    shm = None
+    try:
+        batch_idx = worker_idx
+        while num_batches is None or batch_idx < num_batches:
+            batch = producer(batch_idx)
+            if batch is None:
+                break
+            items = _batch_items(batch)
+            nbytes = _batch_nbytes(items)
+            if shm is None:
+                ready.put(("buffer", nbytes))
+                name, slot_size = free.get()
+                shm = SharedMemory(name)
+            elif nbytes > slot_size:
+                raise ivy.utils.exceptions.IvyException(
+                    "batch {} takes {} bytes, which is more than the {} bytes of each "
+                    "slot, set slot_size to fit the largest batch".format(
+                        batch_idx, nbytes, slot_size
+                    )
+                )
+            slot = free.get()
+            entries = _write_slot(shm.buf, slot * slot_size, items)
+            ready.put(("batch", slot, entries))
+            batch_idx += num_workers
+        ready.put(("end",))
+    except Exception:
+        ready.put(("error", traceback.format_exc()))
+    finally:
+        if shm is not None:
+            shm.close()
+
+
+class _SlotHolder:
+    # exposes a slot of the ring buffer through the array interface, such that it's
+    # the base of every array viewing the slot, and is only finalized once they are
+    # all gone
+    def __init__(self, buffer, start, size):
+        self._buffer = buffer
+        self.__array_interface__ = {
+            "shape": (size,),
+            "typestr": "|u1",
+            "data": (buffer.ctypes.data + start, False),
+            "version": 3,
+        }
+
+
+def _release_slot(free, slot):
+    try:
+        free.put(slot)
+    except (ValueError, OSError):
+        # the loader was closed
+        pass
+
+
+class Loader:
+    """
+    A pipeline of worker processes producing containers, which are prefetched into
+    shared memory ring buffers.
+
+    Each worker produces the batches whose index modulo ``num_workers`` is its own,
+    and copies the arrays of each into a free slot of its ring buffer, of which there
+    are ``prefetch``, such that each worker runs at most that many batches ahead of
+    the consumer. Only the key chains, dtypes, shapes and offsets of the arrays are
+    sent between processes, rather than pickled arrays. Batches are returned in order,
+    as containers whose leaves are views of their slot, through :func:`ivy.transfer`
+    to the current backend, which copies for backends that can't share host memory.
+    A slot is reused once none of the leaves of its batch are referenced any more, so
+    holding on to batches stalls the workers.
+
+    Parameters
+    ----------
+    producer
+        picklable function from the index of a batch to the batch, as a container or
+        dict of arrays, or to None once there are no more batches. All arrays must be
+        in host memory.
+    num_batches
+        the number of batches, or None to produce batches until the producer returns
+        None.
+    num_workers
+        the number of worker processes.
+    prefetch
+        the number of slots of the ring buffer of each worker, at least 2.
+    slot_size
+        the size of each slot in bytes. Default is ``None``, which sizes the slots to
+        the first batch of each worker.
+    timeout
+        the number of seconds to wait for each batch. Default is ``None``, which uses
+        :func:`ivy.get_queue_timeout`.
+    start_method
+        the multiprocessing start method of the workers, such as ``"spawn"``.
+        Default is ``None``, for the default of the platform.
+
+    Examples
+    --------
+    >>> def producer(i):
+    ...     return {"x": np.full((2, 3), i, np.float32), "y": np.array([i, i])}
+    >>> with ivy.data.Loader(producer, num_batches=4, num_workers=2) as loader:
+    ...     for batch in loader:
+    ...         print(batch.y)
+    ivy.array([0, 0])
+    ivy.array([1, 1])
+    ivy.array([2, 2])
+    ivy.array([3, 3])
+    """
+
+    def __init__(
+        self,
+        producer: Callable,
+        /,
+        *,
+        num_batches: Optional[int] = None,
+        num_workers: int = 1,
+        prefetch: int = 2,
+        slot_size: Optional[int] = None,
+        timeout: Optional[float] = None,
+        start_method: Optional[str] = None,
+    ):
+        self._workers = list()
+        self._ready = list()
+        self._free = list()
+        self._buffers = list()
+        ivy.utils.assertions.check_true(
+            num_workers > 0, message="num_workers must be positive"
+        )
+        # the previous batch is usually still referenced while the next is loaded,
+        # so a single slot would stall the worker
+        ivy.utils.assertions.check_true(
+            prefetch > 1, message="prefetch must be at least 2"
+        )
+        self._producer = producer
+        self._num_batches = num_batches
+        self._num_workers = num_workers
+        self._prefetch = prefetch
+        self._slot_size = slot_size
+        self._timeout = timeout
+        self._context = multiprocessing.get_context(start_method)
+
+    def __len__(self):
+        ivy.utils.assertions.check_true(
+            self._num_batches is not None,
+            message="the number of batches of the loader is not known",
+        )
+        return self._num_batches
+
+    def __iter__(self):
+        self.close()
+        self._start()
+        timeout = ivy.default(self._timeout, ivy.get_queue_timeout())
+        batch_idx = 0
+        while self._num_batches is None or batch_idx < self._num_batches:
+            worker_idx = batch_idx % self._num_workers
+            message = self._ready[worker_idx].get(timeout=timeout)
+            if message[0] == "buffer":
+                self._create_buffer(worker_idx, message[1])
+                message = self._ready[worker_idx].get(timeout=timeout)
+            if message[0] == "error":
+                self.close()
+                raise ivy.utils.exceptions.IvyException(
+                    "worker {} of the loader failed:\n{}".format(worker_idx, message[1])
+                )
+            if message[0] == "end":
+                break
+            yield self._build_batch(worker_idx, *message[1:])
+            batch_idx += 1
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def _start(self):
+        for worker_idx in range(self._num_workers):
+            ready = self._context.Queue()
+            free = self._context.Queue()
+            worker = self._context.Process(
+                target=_worker_loop,
+                args=(
+                    self._producer,
+                    worker_idx,
+                    self._num_workers,
+                    self._num_batches,
+                    ready,
+                    free,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+            self._ready.append(ready)
+            self._free.append(free)
+            self._buffers.append(None)
+
+    def _create_buffer(self, worker_idx, nbytes):
+        slot_size = _align(max(ivy.default(self._slot_size, 0), nbytes, 1))
+        shm = SharedMemory(create=True, size=slot_size * self._prefetch)
+        self._buffers[worker_idx] = (
+            shm,
+            slot_size,
+            np.frombuffer(shm.buf, dtype=np.uint8),
+        )
+        free = self._free[worker_idx]
+        free.put((shm.name, slot_size))
+        for slot in range(self._prefetch):
+            free.put(slot)
+
+    def _build_batch(self, worker_idx, slot, entries):
+        shm, slot_size, buffer = self._buffers[worker_idx]
+        # the leaves are views of an array of the slot whose base is the holder, and
+        # the slot is released once the holder is finalized
+        holder = _SlotHolder(buffer, slot * slot_size, slot_size)
+        weakref.finalize(holder, _release_slot, self._free[worker_idx], slot)
+        view = np.asarray(holder)
+        del holder
+        container_dict = dict()
+        for entry in entries:
+            if len(entry) == 4:
+                key_chain, dtype, shape, offset = entry
+                dtype = np.dtype(dtype)
+                start = offset - slot * slot_size
+                nbytes = dtype.itemsize * int(np.prod(shape))
+                value = view[start : start + nbytes].view(dtype).reshape(shape)
+                value = ivy.transfer(value, backend=ivy)
+            else:
+                key_chain, value = entry
+            keys = key_chain.split("/")
+            sub_dict = container_dict
+            for key in keys[:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[keys[-1]] = value
+        return ivy.Container(container_dict, alphabetical_keys=False)
+
+    def close(self):
+        """
+        Stop the workers and free the ring buffers.
+
+        The leaves of batches which are still referenced stay valid.
+        """
+        for worker in self._workers:
+            worker.terminate()
+            worker.join()
+        for q in self._ready + self._free:
+            q.close()
+        buffers = self._buffers
+        self._buffers = list()
+        while buffers:
+            buffer = buffers.pop()
+            if buffer is None:
+                continue
+            shm = buffer[0]
+            # the array of the whole buffer is also referenced by the holders of the
+            # batches which are still in use
+            del buffer
+            try:
+                shm.close()
+            except BufferError:
+                # views of the buffer are still referenced, and the memory is only
+                # unmapped once they are gone
+                pass
+            shm.unlink()
+        self._workers = list()
+        self._ready = list()
+        self._free = list()
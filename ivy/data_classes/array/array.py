@@ -8,6 +8,12 @@ from typing import Optional
 
 # local
 import ivy
+from ivy.utils.backend import handler as backend_handler
+from ivy.utils.backend.handler import (
+    _array_registry,
+    _native_array_reduce_args,
+    _rebuild_native_array,
+)
 from .conversions import args_to_native, to_ivy
 from .activations import _ArrayWithActivations
 from .creation import _ArrayWithCreation
@@ -53,6 +59,19 @@ from .experimental import (
 )
 
 
+def _rebuild_array(backend_str, data, device_str, dynamic_backend):
+    # as Array._init, with the backend of the pickled array rather than the global one
+    ret = Array.__new__(Array)
+    ret._data = _rebuild_native_array(backend_str, data, device_str)
+    ret._clear_metadata()
+    ret.backend = backend_str
+    ret._dynamic_backend = dynamic_backend
+    if backend_handler._tracking_dynamic_backend and dynamic_backend:
+        _array_registry[id(ret)] = ret
+    ret._view_attributes(None)
+    return ret
+
+
 class Array(
     _ArrayWithActivations,
     _ArrayWithCreation,
@@ -94,46 +113,29 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    # the mixins only contribute methods, so instances only carry these slots
+    __slots__ = (
+        "_data",
+        "_size",
+        "_itemsize",
+        "_strides",
+        "_dtype",
+        "_device",
+        "backend",
+        "_backend",
+        "_dynamic_backend",
+        "_base",
+        "_view_refs",
+        "_manipulation_stack",
+        "_torch_base",
+        "_torch_view_refs",
+        "_torch_manipulation",
+        "__weakref__",
+    )
+
+    _pre_repr = "ivy.array"
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
         self._view_attributes(data)
 
@@ -148,24 +150,23 @@ class Array(
             raise ivy.utils.exceptions.IvyException(
                 "data must be ivy array, native array or ndarray"
             )
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._itemsize = ivy.itemsize(self._data)
-        self._strides = ivy.strides(self._data)
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy.array"
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
+        self._clear_metadata()
         self.backend = ivy.current_backend_str()
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        # only tracked once the backend has been changed dynamically
+        if backend_handler._tracking_dynamic_backend and self._dynamic_backend:
+            _array_registry[id(self)] = self
+
+    def _clear_metadata(self):
+        # computed from the native array on first access, see the properties below
+        self._size = None
+        self._itemsize = None
+        self._strides = None
+        self._dtype = None
+        self._device = None
 
     def _view_attributes(self, data):
         self._base = None
@@ -185,7 +186,10 @@ class Array(
     @dynamic_backend.setter
     def dynamic_backend(self, value):
         from ivy.functional.ivy.gradients import _variable
-        from ivy.utils.backend.handler import _determine_backend_from_args
+        from ivy.utils.backend.handler import (
+            _determine_backend_from_args,
+            _update_dynamic_backend_registry,
+        )
 
         if value == False:
             self._backend = _determine_backend_from_args(self)
@@ -207,8 +211,10 @@ class Array(
             else:
                 np_data = to_numpy(self.data)
                 self._data = ivy.array(np_data).data
+            self._clear_metadata()
 
         self._dynamic_backend = value
+        _update_dynamic_backend_registry(self)
 
     @property
     def data(self) -> ivy.NativeArray:
@@ -218,11 +224,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
+        if self._dtype is None:
+            self._dtype = ivy.dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = ivy.dev(self._data)
         return self._device
 
     @property
@@ -254,16 +264,23 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
     def itemsize(self) -> Optional[int]:
         """Size of array elements in bytes."""
+        if self._itemsize is None:
+            self._itemsize = ivy.itemsize(self._data)
         return self._itemsize
 
     @property
     def strides(self) -> Optional[int]:
         """Get strides across each dimension."""
+        if self._strides is None:
+            self._strides = ivy.strides(self._data)
         return self._strides
 
     @property
@@ -285,6 +302,11 @@ class Array(
         """Original array referenced by view."""
         return self._base
 
+    @property
+    def _post_repr(self) -> str:
+        dev_str = ivy.as_ivy_dev(self.device)
+        return ", dev={})".format(dev_str) if "gpu" in dev_str else ")"
+
     # Setters #
     # --------#
 
@@ -354,7 +376,7 @@ class Array(
             # from the currently set backend
             backend = ivy.with_backend(self.backend, cached=True)
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
         with np.printoptions(precision=dec_vals):
             repr = rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
             return (
@@ -366,10 +388,10 @@ class Array(
     def __dir__(self):
         return self._data.__dir__()
 
-    def __getattribute__(self, item):
-        return super().__getattribute__(item)
-
     def __getattr__(self, item):
+        if item == "_data":
+            # not yet initialized, there is no native array to delegate to
+            raise AttributeError(item)
         try:
             attr = self._data.__getattribute__(item)
         except AttributeError:
@@ -389,11 +411,20 @@ class Array(
             self._data.__setitem__(query, val)
         except:
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._clear_metadata()
 
     def __contains__(self, key):
         return self._data.__contains__(key)
 
+    def __reduce_ex__(self, protocol):
+        # the native array is pickled as a numpy array sharing its memory where
+        # possible, whose buffer numpy pickles out-of-band with protocol 5, and the
+        # array is rebuilt without setting its backend globally
+        args = _native_array_reduce_args(self._data, self.backend)
+        if args is None:
+            return super().__reduce_ex__(protocol)
+        return _rebuild_array, (*args, self._dynamic_backend)
+
     def __getstate__(self):
         data_dict = dict()
 
@@ -417,10 +448,9 @@ class Array(
             else ivy.current_backend(state["data"])
         )
         ivy_array = ivy.array(state["data"])
+        self.__init__(ivy_array, ivy_array.dynamic_backend)
         ivy.previous_backend()
 
-        self.__dict__ = ivy_array.__dict__
-
         # TODO: what about placement of the array on the right device ?
         # device = backend.as_native_dev(state["device_str"])
         # backend.to_device(self, device)
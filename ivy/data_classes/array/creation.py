@@ -1,7 +1,8 @@
 # global
 import abc
 from numbers import Number
-from typing import Optional, Union, List
+from types import ModuleType
+from typing import Any, Optional, Union, List
 
 # local
 import ivy
@@ -12,6 +13,8 @@ import ivy
 
 
 class _ArrayWithCreation(abc.ABC):
+    __slots__ = ()
+
     def asarray(
         self: ivy.Array,
         /,
@@ -363,9 +366,61 @@ class _ArrayWithCreation(abc.ABC):
         """
         return ivy.from_dlpack(self._data, out=out)
 
+    def to_dlpack(self: ivy.Array, /) -> Any:
+        """
+        ivy.Array instance method variant of ivy.to_dlpack. This method simply wraps
+        the function, and so the docstring for ivy.to_dlpack also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array.
+
+        Returns
+        -------
+        ret
+            a DLPack capsule wrapping the data of ``self``.
+        """
+        return ivy.to_dlpack(self._data)
+
     # Extra #
     # ----- #
 
+    def transfer(
+        self: ivy.Array,
+        /,
+        *,
+        backend: Union[str, ModuleType],
+    ) -> Union[ivy.Array, ivy.NativeArray]:
+        """
+        ivy.Array instance method variant of ivy.transfer. This method simply wraps
+        the function, and so the docstring for ivy.transfer also applies to this
+        method with minimal changes.
+
+        Parameters
+        ----------
+        self
+            input array.
+        backend
+            the backend to move the array to, either as the name of the backend, or
+            as an ivy instance, such as a local one returned by
+            :func:`ivy.with_backend`, whose backend is used.
+
+        Returns
+        -------
+        ret
+            a native array of the backend if given by name, otherwise an array of the
+            ivy instance.
+
+        Examples
+        --------
+        >>> x = ivy.array([1., 2., 3.])
+        >>> print(type(x.transfer(backend="torch")))
+        <class 'torch.Tensor'>
+        """
+        return ivy.transfer(self._data, backend=backend)
+
     def copy_array(
         self: ivy.Array,
         /,
@@ -3,4 +3,4 @@ import abc
 
 
 class _ArrayWithDeviceExperimental(abc.ABC):
-    pass
+    __slots__ = ()
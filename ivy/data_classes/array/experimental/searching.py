@@ -7,6 +7,8 @@ import ivy
 
 
 class _ArrayWithSearchingExperimental(abc.ABC):
+    __slots__ = ()
+
     def unravel_index(
         self: ivy.Array,
         shape: Tuple[int],
@@ -12,6 +12,8 @@ import ivy
 
 
 class _ArrayWithLayers(abc.ABC):
+    __slots__ = ()
+
     def linear(
         self: ivy.Array,
         weight: Union[ivy.Array, ivy.NativeArray],
@@ -245,6 +247,7 @@ class _ArrayWithLayers(abc.ABC):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         """
@@ -274,6 +277,9 @@ class _ArrayWithLayers(abc.ABC):
             The mask input array. The mask to apply to the query-key values.
             Default is None. The shape of mask input should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at a time, with an online softmax.
+            Default is ``None``.
         out
             optional output array, for writing the result to. It must have a shape
             that the inputs broadcast to.
@@ -313,6 +319,7 @@ class _ArrayWithLayers(abc.ABC):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             out=out,
         )
 
@@ -330,6 +337,7 @@ class _ArrayWithLayers(abc.ABC):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         out: Optional[ivy.Array] = None,
     ) -> ivy.Array:
         return ivy.multi_head_attention(
@@ -344,6 +352,7 @@ class _ArrayWithLayers(abc.ABC):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             out=out,
         )
 
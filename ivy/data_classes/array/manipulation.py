@@ -12,6 +12,8 @@ from ivy import handle_view
 
 
 class _ArrayWithManipulation(abc.ABC):
+    __slots__ = ()
+
     def view(
         self: ivy.Array,
         /,
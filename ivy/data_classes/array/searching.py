@@ -8,6 +8,8 @@ import ivy
 
 
 class _ArrayWithSearching(abc.ABC):
+    __slots__ = ()
+
     def argmax(
         self: ivy.Array,
         /,
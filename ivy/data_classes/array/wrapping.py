@@ -8,10 +8,87 @@ from types import ModuleType
 TO_IGNORE = ["shape"]
 
 
+# the names of the instance methods generated for each class, so that they can be
+# re-bound to the functions of the new backend whenever the backend changes
+_instance_methods = dict()
+
+# the trampoline factories generated for each function, keyed by function name
+_trampolines = dict()
+
+
+def _data_slot(array_spec):
+    # the position and name of the parameter to pass the array data to, if the
+    # array is passed as a top-level argument, otherwise None
+    if not array_spec:
+        return None
+    (position, name), *path = array_spec[0]
+    if path not in ([], ["optional"]):
+        return None
+    return position, name
+
+
+def _make_trampoline(array_spec) -> Callable:
+    # generate a factory which binds a function to an instance method passing the
+    # data of the array in the slot given by the array spec of the function
+    slot = _data_slot(array_spec)
+
+    if slot is None:
+
+        def factory(function):
+            def new_function(self, *args, **kwargs):
+                # gives us the position and name of the array argument
+                data_idx = function.array_spec[0]
+                if len(args) >= data_idx[0][0]:
+                    args = ivy.copy_nest(args, to_mutable=True)
+                    data_idx = [data_idx[0][0]] + [
+                        0 if idx is int else idx for idx in data_idx[1:]
+                    ]
+                    ivy.insert_into_nest_at_index(args, data_idx, self._data)
+                else:
+                    kwargs = ivy.copy_nest(kwargs, to_mutable=True)
+                    data_idx = [data_idx[0][1]] + [
+                        0 if idx is int else idx for idx in data_idx[1:]
+                    ]
+                    ivy.insert_into_nest_at_index(kwargs, data_idx, self._data)
+                return function(*args, **kwargs)
+
+            return new_function
+
+    elif slot[0] == 0:
+
+        def factory(function):
+            def new_function(self, *args, **kwargs):
+                return function(self._data, *args, **kwargs)
+
+            return new_function
+
+    else:
+        position, name = slot
+
+        def factory(function):
+            def new_function(self, *args, **kwargs):
+                if len(args) >= position:
+                    return function(
+                        *args[:position], self._data, *args[position:], **kwargs
+                    )
+                kwargs[name] = self._data
+                return function(*args, **kwargs)
+
+            return new_function
+
+    return factory
+
+
 def _wrap_function(function_name: str) -> Callable:
     """
     Wrap the function called `function_name`.
 
+    The returned instance method is bound to the function currently in the ivy
+    namespace, and passes the data of the array directly as the argument given by the
+    array spec of the function. The code of the method is generated only once per
+    function, and is re-bound to the functions of the new backend by
+    ``_rebind_ivy_array_instance_methods`` whenever the backend changes.
+
     Parameters
     ----------
     function_name
@@ -31,33 +108,20 @@ def _wrap_function(function_name: str) -> Callable:
     >>> print(absolute(x))
     ivy.array([1])
     """
+    function = ivy.__dict__[function_name]
+    if function_name not in _trampolines:
+        _trampolines[function_name] = _make_trampoline(
+            getattr(function, "array_spec", None)
+        )
+    return _trampolines[function_name](function)
 
-    def new_function(self, *args, **kwargs):
-        """
-        Add the data of the current array from which the instance function is invoked as
-        the first arg parameter or kwarg parameter.
-
-        Return the new function with the name function_name and the new
-        args variable or kwargs as the new inputs.
-        """
-        function = ivy.__dict__[function_name]
-        # gives us the position and name of the array argument
-        data_idx = function.array_spec[0]
-        if len(args) >= data_idx[0][0]:
-            args = ivy.copy_nest(args, to_mutable=True)
-            data_idx = [data_idx[0][0]] + [
-                0 if idx is int else idx for idx in data_idx[1:]
-            ]
-            ivy.insert_into_nest_at_index(args, data_idx, self._data)
-        else:
-            kwargs = ivy.copy_nest(kwargs, to_mutable=True)
-            data_idx = [data_idx[0][1]] + [
-                0 if idx is int else idx for idx in data_idx[1:]
-            ]
-            ivy.insert_into_nest_at_index(kwargs, data_idx, self._data)
-        return function(*args, **kwargs)
-
-    return new_function
+
+def _rebind_ivy_array_instance_methods():
+    # bind the generated instance methods to the functions now in the ivy namespace
+    for cls, keys in _instance_methods.items():
+        for key in keys:
+            if key in ivy.__dict__:
+                setattr(cls, key, _wrap_function(key))
 
 
 def add_ivy_array_instance_methods(
@@ -106,4 +170,5 @@ def add_ivy_array_instance_methods(
             try:
                 setattr(cls, key, _wrap_function(key))
             except AttributeError:
-                pass
+                continue
+            _instance_methods.setdefault(cls, set()).add(key)
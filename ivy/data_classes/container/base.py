@@ -11,15 +11,25 @@ import numpy as np
 import json
 
 from ivy.utils.exceptions import IvyBackendException, IvyException
-
-
-try:
-    # noinspection PyPackageRequirements
-    import h5py
-except ModuleNotFoundError:
-    h5py = None
+from ivy.utils.backend import handler as backend_handler
+from ivy.utils.backend.handler import (
+    _container_registry,
+    _determine_backend_from_args,
+    _native_array_reduce_args,
+    _NativeArrayReducer,
+    _to_numpy_without_copy,
+    _update_dynamic_backend_registry,
+)
+from ivy.utils.dynamic_import import LazyModule, is_importable
+from ivy.data_classes.container.flat import FlatContainer, _build
+from ivy.data_classes.container.checkpoint import load_checkpoint, save_checkpoint
+
+import os
 import pickle
 import random
+import struct
+import tempfile
+import zipfile
 from operator import mul
 from functools import reduce
 from typing import Union, Tuple
@@ -28,10 +38,127 @@ from builtins import set
 # local
 import ivy
 
+# noinspection PyPackageRequirements
+h5py = LazyModule("h5py")
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
+def _h5_dataset_to_numpy(dataset, slice_obj, mmap):
+    # contiguous datasets without filters are stored as raw bytes in the file, which
+    # are memory-mapped copy-on-write, and the others are read directly into numpy
+    if mmap and dataset.chunks is None and dataset.size > 0:
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            return np.memmap(
+                dataset.file.filename,
+                dtype=dataset.dtype,
+                mode="c",
+                offset=offset,
+                shape=dataset.shape,
+            )[slice_obj]
+    return dataset[slice_obj]
+
+
+def _npz_member_to_numpy(npz_file, filepath, name, mmap):
+    # stored members of the zip file are raw npy files, which are memory-mapped
+    # copy-on-write after their local file header and npy header
+    info = npz_file.zip.getinfo(name + ".npy")
+    if mmap and info.compress_type == zipfile.ZIP_STORED:
+        with open(filepath, "rb") as f:
+            f.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", f.read(30)[26:])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(f)
+            else:
+                header = np.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+            offset = f.tell()
+        if not dtype.hasobject and np.prod(shape) > 0:
+            return np.memmap(
+                filepath,
+                dtype=dtype,
+                mode="c",
+                offset=offset,
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return npz_file[name]
+
+
+def _h5_datasets(h5_obj):
+    datasets = list()
+    for value in h5_obj.values():
+        if isinstance(value, h5py.Group):
+            datasets += _h5_datasets(value)
+        elif isinstance(value, h5py.Dataset):
+            datasets.append(value)
+        else:
+            raise ivy.utils.exceptions.IvyException(
+                "Item found inside h5_obj which was neither a Group nor a Dataset."
+            )
+    return datasets
+
+
+def _h5_shuffle_plans(datasets, max_memory):
+    # datasets with the same number of rows are shuffled with the same plan, such that
+    # they stay aligned, which is None if the rows of each fit in memory at once, and
+    # otherwise the number of rows of each block and of blocks shuffled together
+    row_bytes = dict()
+    chunk_rows = dict()
+    for dataset in datasets:
+        num_rows = dataset.shape[0]
+        this_row_bytes = dataset.dtype.itemsize * int(np.prod(dataset.shape[1:]))
+        row_bytes[num_rows] = max(row_bytes.get(num_rows, 1), this_row_bytes)
+        this_chunk_rows = dataset.chunks[0] if dataset.chunks else 1
+        chunk_rows[num_rows] = max(chunk_rows.get(num_rows, 1), this_chunk_rows)
+    plans = dict()
+    for num_rows in row_bytes:
+        # the rows read, their permuted copy and the int64 indices of the permutation
+        # are held in memory together
+        rows_budget = max(1, max_memory // (2 * row_bytes[num_rows] + 8))
+        if num_rows <= rows_budget:
+            plans[num_rows] = None
+            continue
+        # each group mixes the rows of at least 64 blocks, which are aligned to the
+        # chunks of the datasets where they fit
+        block_rows = max(1, rows_budget // 64)
+        if chunk_rows[num_rows] <= block_rows:
+            block_rows -= block_rows % chunk_rows[num_rows]
+        plans[num_rows] = (block_rows, max(1, rows_budget // block_rows))
+    return plans
+
+
+def _shuffle_h5_dataset(src, dst, seed_value, plan):
+    num_rows = src.shape[0]
+    if plan is None:
+        # the same permutation as random.shuffle of the rows with the seed, of an
+        # index array rather than a list, whose python ints would exceed the budget
+        random.seed(seed_value)
+        indices = np.arange(num_rows)
+        random.shuffle(indices)
+        dst[...] = src[()][indices]
+        return
+    # the blocks are permuted, and the rows of each group of consecutive blocks in
+    # this permutation are read together, permuted in memory, and written in order
+    block_rows, blocks_per_group = plan
+    rng = np.random.default_rng(seed_value)
+    num_blocks = -(-num_rows // block_rows)
+    block_order = rng.permutation(num_blocks)
+    start = 0
+    for i in range(0, num_blocks, blocks_per_group):
+        data = np.concatenate(
+            [
+                src[block * block_rows : (block + 1) * block_rows]
+                for block in np.sort(block_order[i : i + blocks_per_group])
+            ]
+        )
+        dst[start : start + len(data)] = data[rng.permutation(len(data))]
+        start += len(data)
+
+
 def _is_jsonable(x):
     try:
         json.dumps(x)
@@ -137,6 +264,9 @@ class ContainerBase(dict, abc.ABC):
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        # only tracked once the backend has been changed dynamically
+        if backend_handler._tracking_dynamic_backend and self._dynamic_backend:
+            _container_registry[id(self)] = self
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -705,6 +835,12 @@ class ContainerBase(dict, abc.ABC):
             container0,
             message="No containers found in the inputs to ivy.Container.cont_multi_map",
         )
+        if key_chains is None and key_chain == "" and not prune_unapplied:
+            ret = ivy.Container._cont_multi_map_flat(
+                func, containers, container0, config, map_nests
+            )
+            if ret is not None:
+                return ret
         if not ivy.exists(config):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
@@ -779,6 +915,30 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_multi_map_flat(func, containers, container0, config, map_nests):
+        # maps over the leaves of containers with identical structures in a single
+        # loop, returning None for the recursive map to handle any other inputs
+        if any(isinstance(cont, (list, tuple)) for cont in containers):
+            return None
+        values = [
+            cont.cont_flatten() if isinstance(cont, ivy.Container) else cont
+            for cont in containers
+        ]
+        flats = [v for v in values if isinstance(v, FlatContainer)]
+        if not all(flats[0].identical_structure(flat) for flat in flats[1:]):
+            return None
+        if map_nests and any(
+            isinstance(x, (list, tuple)) for flat in flats for x in flat.leaves
+        ):
+            return None
+        flat = FlatContainer.multi_map(func, values)
+        template = container0 if config is None else ivy.Container(**config)
+        # sub-containers left empty are dropped, as by the recursive map
+        return _build(
+            flat._skeleton, flat._nodes, flat.leaves, template, prune_empty=True
+        )
+
     @staticmethod
     def cont_common_key_chains(containers):
         """
@@ -1095,12 +1255,19 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        mmap=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
         filepath.
 
+        Each dataset is read directly into a numpy array, which the arrays of the
+        backend then share the memory of where the backend supports it.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1113,13 +1280,18 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        mmap
+            Whether to memory-map the datasets stored contiguously and uncompressed,
+            such that each is only read from disk when first accessed, and writes to
+            the arrays don't change the file. Chunked and compressed datasets are read
+            as usual. Default is ``False``.
 
         Returns
         -------
             Container loaded from disk
         """
-        ivy.utils.assertions.check_exists(
-            h5py,
+        ivy.utils.assertions.check_true(
+            is_importable("h5py"),
             message=(
                 "You must install python package h5py in order to load hdf5 "
                 "files from disk into a container."
@@ -1134,11 +1306,16 @@ class ContainerBase(dict, abc.ABC):
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value,
+                    slice_obj,
+                    alphabetical_keys=alphabetical_keys,
+                    ivyh=ivyh,
+                    mmap=mmap,
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
+                container_dict[key] = ivy.transfer(
+                    _h5_dataset_to_numpy(value, slice_obj, mmap),
+                    backend=ivy.default(ivyh, ivy),
                 )
             else:
                 raise ivy.utils.exceptions.IvyException(
@@ -1169,6 +1346,109 @@ class ContainerBase(dict, abc.ABC):
             ivyh=ivyh,
         ).to_ivy()
 
+    @staticmethod
+    def cont_from_disk_as_npz(
+        npz_filepath, alphabetical_keys=True, ivyh=None, mmap=False
+    ):
+        """
+        Load container object from disk, as an npz file saved with
+        :meth:`cont_to_disk_as_npz`, at the specified filepath.
+
+        Parameters
+        ----------
+        npz_filepath
+            Filepath where the container object is saved to disk.
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, or preserve the order
+            they were saved in. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        mmap
+            Whether to memory-map the arrays of uncompressed files, such that each is
+            only read from disk when first accessed, and writes to the arrays don't
+            change the file. Default is ``False``.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        container_dict = dict()
+        with np.load(npz_filepath) as npz_file:
+            for key_chain in npz_file.files:
+                value = ivy.transfer(
+                    _npz_member_to_numpy(npz_file, npz_filepath, key_chain, mmap),
+                    backend=ivy.default(ivyh, ivy),
+                )
+                keys = key_chain.split("/")
+                sub_dict = container_dict
+                for key in keys[:-1]:
+                    sub_dict = sub_dict.setdefault(key, dict())
+                sub_dict[keys[-1]] = value
+        return ivy.Container(
+            container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh
+        )
+
+    @staticmethod
+    def cont_from_disk_as_checkpoint(
+        checkpoint_dir,
+        key_chains=None,
+        alphabetical_keys=True,
+        ivyh=None,
+        mmap=True,
+        num_workers=None,
+    ):
+        """
+        Load container object from disk, as a sharded checkpoint saved with
+        :meth:`cont_to_disk_as_checkpoint`, at the specified directory.
+
+        Each array is a view of its shard, which is memory-mapped copy-on-write or
+        read into memory, and the arrays of the backend then share the memory of
+        these views where the backend supports it.
+
+        Parameters
+        ----------
+        checkpoint_dir
+            Directory where the container object is saved to disk.
+        key_chains
+            Key chain or list of key chains, such that only the leaves at these key
+            chains or below them are loaded. Default is ``None``, which loads all
+            leaves. Shards without any of these leaves are not read.
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, or preserve the order
+            they were saved in. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        mmap
+            Whether to memory-map the shards, such that each array is only read from
+            disk when first accessed, and writes to the arrays don't change the file.
+            Otherwise the shards are read into memory. Default is ``True``.
+        num_workers
+            Number of threads to read the shards with in parallel. Default is
+            ``None``, which reads them one after another.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        if isinstance(key_chains, str):
+            key_chains = [key_chains]
+        container_dict = dict()
+        for key_chain, value in load_checkpoint(
+            checkpoint_dir, key_chains, mmap, num_workers
+        ):
+            if isinstance(value, np.ndarray):
+                value = ivy.transfer(value, backend=ivy.default(ivyh, ivy))
+            keys = key_chain.split("/")
+            sub_dict = container_dict
+            for key in keys[:-1]:
+                sub_dict = sub_dict.setdefault(key, dict())
+            sub_dict[keys[-1]] = value
+        return ivy.Container(
+            container_dict, alphabetical_keys=alphabetical_keys, ivyh=ivyh
+        )
+
     @staticmethod
     def cont_from_disk_as_json(json_filepath, ivyh=None):
         """
@@ -1204,8 +1484,8 @@ class ContainerBase(dict, abc.ABC):
         -------
             Size of h5 file contents, and batch size.
         """
-        ivy.utils.assertions.check_exists(
-            h5py,
+        ivy.utils.assertions.check_true(
+            is_importable("h5py"),
             message=(
                 "You must install python package h5py in order to determine "
                 "the size of hdf5 files."
@@ -1233,20 +1513,36 @@ class ContainerBase(dict, abc.ABC):
         return size, batch_size
 
     @staticmethod
-    def shuffle_h5_file(h5_obj_or_filepath, seed_value=0):
+    def shuffle_h5_file(
+        h5_obj_or_filepath, seed_value=0, out_filepath=None, max_memory=2**28
+    ):
         """
         Shuffle entries in all datasets of h5 file, such that they are still aligned
         along axis 0.
 
+        Datasets whose rows fit in the memory budget are read and shuffled at once.
+        Larger datasets are shuffled out-of-core, by permuting blocks of rows, and
+        reading each group of consecutive blocks in this permutation, permuting its
+        rows in memory, and writing them out sequentially. Datasets with the same
+        number of rows are always shuffled with the same permutation.
+
         Parameters
         ----------
         h5_obj_or_filepath
             Filepath where the container object is saved to disk, or h5 object.
         seed_value
             random seed to use for array shuffling (Default value = 0)
+        out_filepath
+            Filepath of a new h5 file to write the shuffled datasets to, leaving the
+            original unchanged. Default is ``None``, which shuffles the datasets in
+            place, through a temporary file for those larger than the memory budget.
+        max_memory
+            Memory budget in bytes for the rows held in memory at once, including
+            their permuted copy and the indices of the permutation.
+            Default is 256 MiB.
         """
-        ivy.utils.assertions.check_exists(
-            h5py,
+        ivy.utils.assertions.check_true(
+            is_importable("h5py"),
             message=(
                 "You must install python package h5py in order to shuffle "
                 "hdf5 files on disk."
@@ -1255,21 +1551,49 @@ class ContainerBase(dict, abc.ABC):
         if seed_value is None:
             seed_value = random.randint(0, 1000)
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, "a")
+            h5_obj = h5py.File(h5_obj_or_filepath, "r" if out_filepath else "a")
         else:
             h5_obj = h5_obj_or_filepath
 
-        for key, value in h5_obj.items():
-            if isinstance(value, h5py.Group):
-                ivy.Container.shuffle_h5_file(value, seed_value)
-            elif isinstance(value, h5py.Dataset):
-                random.seed(seed_value)
-                # noinspection PyTypeChecker
-                random.shuffle(value)
-            else:
-                raise ivy.utils.exceptions.IvyException(
-                    "Item found inside h5_obj which was neither a Group nor a Dataset."
+        datasets = _h5_datasets(h5_obj)
+        plans = _h5_shuffle_plans([d for d in datasets if d.ndim > 0], max_memory)
+        out_file = h5py.File(out_filepath, "w") if out_filepath else None
+        for dataset in datasets:
+            if out_file is not None:
+                dst = out_file.create_dataset(
+                    dataset.name[len(h5_obj.name) :].lstrip("/"),
+                    shape=dataset.shape,
+                    dtype=dataset.dtype,
+                    maxshape=dataset.maxshape,
+                    chunks=dataset.chunks,
+                    compression=dataset.compression,
+                    compression_opts=dataset.compression_opts,
                 )
+                if dataset.ndim == 0:
+                    dst[()] = dataset[()]
+                else:
+                    _shuffle_h5_dataset(
+                        dataset, dst, seed_value, plans[dataset.shape[0]]
+                    )
+            elif dataset.ndim == 0:
+                continue
+            elif plans[dataset.shape[0]] is None:
+                _shuffle_h5_dataset(dataset, dataset, seed_value, None)
+            else:
+                # shuffled into a temporary file, and copied back sequentially
+                plan = plans[dataset.shape[0]]
+                tmp_dir = os.path.dirname(os.path.abspath(dataset.file.filename))
+                with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp_dirpath:
+                    with h5py.File(os.path.join(tmp_dirpath, "shuffle.h5"), "w") as f:
+                        tmp = f.create_dataset(
+                            "data", shape=dataset.shape, dtype=dataset.dtype
+                        )
+                        _shuffle_h5_dataset(dataset, tmp, seed_value, plan)
+                        copy_rows = plan[0] * plan[1]
+                        for i in range(0, dataset.shape[0], copy_rows):
+                            dataset[i : i + copy_rows] = tmp[i : i + copy_rows]
+        if out_file is not None:
+            out_file.close()
         if isinstance(h5_obj, h5py.File):
             h5_obj.close()
 
@@ -1588,6 +1912,28 @@ class ContainerBase(dict, abc.ABC):
 
         self._config = new_config
 
+    def _cont_new(self, dict_in):
+        # a container with the config of this one, around a dict of entries which are
+        # already containers or leaves, skipping cont_inplace_update for each entry
+        if self._config.keys() != self._config_in.keys():
+            # the config was partially updated, and the missing entries take defaults
+            return ivy.Container(dict_in, **self._config)
+        ret = dict.__new__(ivy.Container)
+        dict.update(ret, dict_in)
+        state = ret.__dict__
+        state["_queues"] = None
+        state["_container_combine_method"] = "list_join"
+        state["_dynamic_backend"] = ivy.get_dynamic_backend()
+        # each container has its own config dicts, as when constructed, since they
+        # are updated inplace
+        state["_config_in"] = dict(self._config)
+        state["_config"] = dict(self._config)
+        for k, v in self._config.items():
+            state["_local_ivy" if k == "ivyh" else "_" + k] = v
+        if backend_handler._tracking_dynamic_backend and state["_dynamic_backend"]:
+            _container_registry[id(ret)] = ret
+        return ret
+
     def cont_inplace_update(
         self, dict_in: Union[ivy.Container, dict], **config
     ) -> ivy.Container:
@@ -1949,7 +2295,15 @@ class ContainerBase(dict, abc.ABC):
         )
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        resizable=True,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
@@ -1967,9 +2321,23 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        resizable
+            Whether the datasets created can later be resized along all dimensions,
+            which requires them to be chunked. Datasets which are neither resizable,
+            chunked nor compressed are stored contiguously, and can be memory-mapped
+            when loading. Default is ``True``.
+        chunks
+            The chunk shape of the datasets created, or ``True`` for h5py to pick it.
+            Default is ``None``, which only chunks resizable or compressed datasets.
+        compression
+            The compression filter of the datasets created, such as ``"gzip"`` or
+            ``"lzf"``. Default is ``None``, for no compression.
+        compression_opts
+            Options of the compression filter, such as the gzip level.
+            Default is ``None``.
         """
-        ivy.utils.assertions.check_exists(
-            h5py,
+        ivy.utils.assertions.check_true(
+            is_importable("h5py"),
             message=(
                 "You must install python package h5py in order to save "
                 "containers to disk as hdf5 files."
@@ -1986,19 +2354,32 @@ class ContainerBase(dict, abc.ABC):
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    resizable,
+                    chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
-                value_as_np = self._cont_ivy.to_numpy(value)
+                value_as_np = _to_numpy_without_copy(value)
                 value_shape = value_as_np.shape
                 this_batch_size = value_shape[0]
                 if not max_batch_size:
                     max_batch_size = starting_index + this_batch_size
                 if key not in h5_obj.keys():
                     dataset_shape = [max_batch_size] + list(value_shape[1:])
-                    maxshape = [None for _ in dataset_shape]
+                    maxshape = [None for _ in dataset_shape] if resizable else None
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
                 space_left = max_batch_size - starting_index
                 amount_to_write = min(this_batch_size, space_left)
@@ -2017,6 +2398,43 @@ class ContainerBase(dict, abc.ABC):
         """
         pickle.dump(self.to_native().cont_to_dict(), open(pickle_filepath, "wb"))
 
+    def cont_to_disk_as_npz(self, npz_filepath, compress=False):
+        """
+        Save container object to disk, as an npz file with an array for each key
+        chain, at the specified filepath.
+
+        Parameters
+        ----------
+        npz_filepath
+            Filepath for where to save the container to disk.
+        compress
+            Whether to compress the arrays, in which case they can't be memory-mapped
+            when loading. Default is ``False``.
+        """
+        arrays = {kc: _to_numpy_without_copy(v) for kc, v in self.cont_to_iterator()}
+        (np.savez_compressed if compress else np.savez)(npz_filepath, **arrays)
+
+    def cont_to_disk_as_checkpoint(self, checkpoint_dir, shard_size=2**30):
+        """
+        Save container object to disk, as a sharded checkpoint in the specified
+        directory.
+
+        Each shard is a file with a header of the key chain, dtype, shape and offset
+        of each of its leaves, followed by the raw bytes of the arrays, aligned such
+        that they can be memory-mapped when loading. Leaves which are not arrays must
+        be json serializable, and are stored in the header.
+
+        Parameters
+        ----------
+        checkpoint_dir
+            Directory for where to save the container to disk. Shards of a previous
+            checkpoint in the directory are removed.
+        shard_size
+            Maximum size of the arrays of each shard in bytes, unless a single array
+            is larger. Default is 1 GiB.
+        """
+        save_checkpoint(self, checkpoint_dir, shard_size)
+
     def cont_to_jsonable(self, return_dict=None):
         """
 
@@ -2188,6 +2606,33 @@ class ContainerBase(dict, abc.ABC):
         """
         return list([item for key, item in self.cont_to_iterator()])
 
+    def cont_flatten(self):
+        """
+        Return a flat view of the container, holding its leaves in order with the key
+        chain of each, which can be mapped over without building intermediate
+        containers.
+
+        Returns
+        -------
+        ret
+            the flat container.
+
+        Examples
+        --------
+        >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3.])})
+        >>> flat = x.cont_flatten()
+        >>> print(flat.key_chains)
+        ['a', 'b/c']
+        >>> print(flat.map(lambda v, kc: v + 1).to_container())
+        {
+            a: ivy.array([2., 3.]),
+            b: {
+                c: ivy.array([4.])
+            }
+        }
+        """
+        return FlatContainer.from_container(self)
+
     def cont_from_flat_list(self, flat_list):
         """
         Return new container object with the same hierarchy, but with values replaced
@@ -3171,6 +3616,13 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if (
+            key_chains is None
+            and key_chain == ""
+            and not (prune_unapplied or map_sequences or inplace)
+        ):
+            # map over the leaves in a single loop, and build the nested container once
+            return self.cont_flatten().map(func).to_container()
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = (
@@ -4045,23 +4497,15 @@ class ContainerBase(dict, abc.ABC):
         elif ivy.exists(self._queues):
             ret = self._get_queue_item(query)
             return ret
-        return_dict = dict()
-        for key, value in self.items():
-            if isinstance(value, ivy.Container):
-                return_dict[key] = value[query]
-            else:
-                # noinspection PyBroadException
-                if isinstance(value, list) or isinstance(value, tuple):
-                    if len(value) == 0:
-                        return_dict[key] = value
-                    else:
-                        return_dict[key] = value[query]
-                elif value is None or hasattr(value, "shape") and value.shape == ():
-                    return_dict[key] = value
-                else:
-                    return_dict[key] = value[query]
-        ret = ivy.Container(return_dict, **self._config)
-        return ret
+
+        def _slice(value, _):
+            if isinstance(value, (list, tuple)):
+                return value if len(value) == 0 else value[query]
+            elif value is None or hasattr(value, "shape") and value.shape == ():
+                return value
+            return value[query]
+
+        return self.cont_flatten().map(_slice).to_container()
 
     def __setitem__(self, query, val):
         """
@@ -4119,6 +4563,7 @@ class ContainerBase(dict, abc.ABC):
             def _set_dyn_backend(obj, val):
                 if isinstance(obj, ivy.Array):
                     obj._dynamic_backend = val
+                    _update_dynamic_backend_registry(obj)
                     return
 
                 if isinstance(obj, ivy.Container):
@@ -4126,6 +4571,7 @@ class ContainerBase(dict, abc.ABC):
                         _set_dyn_backend(item, val)
 
                     obj._dynamic_backend = val
+                    _update_dynamic_backend_registry(obj)
 
             _set_dyn_backend(self, val)
             return
@@ -4143,6 +4589,26 @@ class ContainerBase(dict, abc.ABC):
         else:
             return dict.__contains__(self, key)
 
+    def __reduce_ex__(self, protocol):
+        # native arrays at the leaves are pickled as numpy arrays, as those of
+        # ivy.Array are, such that their buffers are out-of-band with protocol 5
+        ret = super().__reduce_ex__(protocol)
+        if len(ret) < 5 or ret[4] is None:
+            return ret
+        return ret[:4] + (self._cont_reduce_items(),) + ret[5:]
+
+    def _cont_reduce_items(self):
+        for key, value in dict.items(self):
+            if not isinstance(value, (ivy.Array, ivy.Container, np.generic)):
+                backend = _determine_backend_from_args(value)
+                if backend is not None and backend.is_native_array(value):
+                    args = _native_array_reduce_args(
+                        value, backend.current_backend_str()
+                    )
+                    if args is not None:
+                        value = _NativeArrayReducer(args)
+            yield key, value
+
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
         state_dict["_local_ivy"] = (
@@ -4269,3 +4735,4 @@ class ContainerBase(dict, abc.ABC):
     @dynamic_backend.setter
     def dynamic_backend(self, value):
         self._dynamic_backend = value
+        _update_dynamic_backend_registry(self)
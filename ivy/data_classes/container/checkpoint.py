@@ -0,0 +1,167 @@
+"""Sharded checkpoint format for containers, with memory-mappable leaves.
+
+A checkpoint is a directory of shard files, ``shard_00000.ivy``,
+``shard_00001.ivy`` and so on. Each shard starts with the 8 byte magic
+``b"IVYCKPT\\x00"``, followed by the length of its header as a little-endian
+uint64, and the header itself, a json object of the shard index, the number of
+shards, and a list of the entries of the shard in order. Each entry holds the key
+chain of a leaf, and either its json value, or the numpy dtype, shape and offset of
+its array. The raw bytes of the arrays follow the header, each starting at an offset
+aligned to ``_ALIGNMENT`` bytes from the start of the file, such that they can be
+viewed in a memory-mapped shard without copying.
+"""
+
+# global
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# local
+import ivy
+from ivy.utils.backend.handler import _to_numpy_without_copy
+
+_MAGIC = b"IVYCKPT\x00"
+_ALIGNMENT = 64
+
+
+def _align(offset):
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _shard_path(directory, shard_idx):
+    return os.path.join(directory, "shard_{:05d}.ivy".format(shard_idx))
+
+
+def _split_into_shards(container, shard_size):
+    # lists of (key chain, numpy array or json value) in order, with a new shard
+    # started once the arrays of the current one would exceed the shard size
+    shards = [[]]
+    size = 0
+    for key_chain, value in container.cont_to_iterator():
+        if ivy.is_array(value):
+            value = np.require(_to_numpy_without_copy(value), requirements="C")
+            if value.dtype.hasobject:
+                raise ivy.utils.exceptions.IvyException(
+                    "arrays of dtype object can't be saved to a checkpoint, but found"
+                    " one at key chain {}".format(key_chain)
+                )
+            nbytes = _align(value.nbytes)
+            if shards[-1] and size + nbytes > shard_size:
+                shards.append([])
+                size = 0
+            size += nbytes
+        else:
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                raise ivy.utils.exceptions.IvyException(
+                    "only arrays and json serializable values can be saved to a"
+                    " checkpoint, but found {} at key chain {}".format(
+                        type(value), key_chain
+                    )
+                )
+        shards[-1].append((key_chain, value))
+    return shards
+
+
+def _save_shard(filepath, shard_idx, num_shards, items):
+    entries = list()
+    offset = 0
+    for key_chain, value in items:
+        if isinstance(value, np.ndarray):
+            entries.append(
+                {
+                    "key_chain": key_chain,
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape),
+                    "offset": offset,
+                }
+            )
+            offset = _align(offset + value.nbytes)
+        else:
+            entries.append({"key_chain": key_chain, "value": value})
+    header = json.dumps(
+        {"shard": shard_idx, "num_shards": num_shards, "entries": entries}
+    ).encode("utf-8")
+    data_start = _align(len(_MAGIC) + 8 + len(header))
+    # the offsets in the header are relative to the start of the data, which is only
+    # known once the header is encoded
+    with open(filepath, "wb") as f:
+        f.write(_MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for entry, (_, value) in zip(entries, items):
+            if "offset" in entry:
+                f.seek(data_start + entry["offset"])
+                value.tofile(f)
+        f.truncate(max(f.tell(), data_start))
+
+
+def _read_header(filepath):
+    with open(filepath, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ivy.utils.exceptions.IvyException(
+                "{} is not a shard of an ivy checkpoint".format(filepath)
+            )
+        (header_length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    header["data_start"] = _align(len(_MAGIC) + 8 + header_length)
+    return header
+
+
+def _matches(key_chain, key_chains):
+    return key_chains is None or any(
+        key_chain == kc or key_chain.startswith(kc + "/") for kc in key_chains
+    )
+
+
+def _load_shard(filepath, key_chains, mmap):
+    # the shard is memory-mapped copy-on-write, or read into memory, and each array is
+    # a view of it, so writes to the arrays don't change the file
+    header = _read_header(filepath)
+    entries = [e for e in header["entries"] if _matches(e["key_chain"], key_chains)]
+    if not any("offset" in e for e in entries):
+        buffer = None
+    elif mmap:
+        buffer = np.memmap(filepath, dtype=np.uint8, mode="c")
+    else:
+        buffer = np.fromfile(filepath, dtype=np.uint8)
+    ret = list()
+    for entry in entries:
+        if "offset" in entry:
+            dtype = np.dtype(entry["dtype"])
+            shape = tuple(entry["shape"])
+            start = header["data_start"] + entry["offset"]
+            nbytes = dtype.itemsize * int(np.prod(shape))
+            value = buffer[start : start + nbytes].view(dtype).reshape(shape)
+        else:
+            value = entry["value"]
+        ret.append((entry["key_chain"], value))
+    return ret
+
+
+def save_checkpoint(container, directory, shard_size):
+    shards = _split_into_shards(container, shard_size)
+    os.makedirs(directory, exist_ok=True)
+    # shards of a previous checkpoint in the directory would otherwise be loaded too
+    for filename in os.listdir(directory):
+        if filename.startswith("shard_") and filename.endswith(".ivy"):
+            os.remove(os.path.join(directory, filename))
+    for shard_idx, items in enumerate(shards):
+        _save_shard(_shard_path(directory, shard_idx), shard_idx, len(shards), items)
+
+
+def load_checkpoint(directory, key_chains, mmap, num_workers):
+    num_shards = _read_header(_shard_path(directory, 0))["num_shards"]
+    filepaths = [_shard_path(directory, i) for i in range(num_shards)]
+    if num_workers and num_workers > 1 and num_shards > 1:
+        with ThreadPoolExecutor(min(num_workers, num_shards)) as executor:
+            shards = list(
+                executor.map(lambda fp: _load_shard(fp, key_chains, mmap), filepaths)
+            )
+    else:
+        shards = [_load_shard(fp, key_chains, mmap) for fp in filepaths]
+    return [item for shard in shards for item in shard]
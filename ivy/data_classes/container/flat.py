@@ -0,0 +1,245 @@
+"""Flat view of the leaves of a container."""
+
+# local
+import ivy
+
+
+def _flatten(cont, key_chain, key_chains, leaves, nodes, index):
+    # appends the leaves of the container in order, with the index of each in the
+    # leaves by key chain, and returns its skeleton, a tuple of its keys and of the
+    # skeleton of each sub-container, or None for each leaf
+    nodes.append(cont)
+    keys = list()
+    children = list()
+    for key, value in dict.items(cont):
+        this_key_chain = key if key_chain == "" else (str(key_chain) + "/" + str(key))
+        keys.append(key)
+        if isinstance(value, ivy.Container):
+            children.append(
+                _flatten(value, this_key_chain, key_chains, leaves, nodes, index)
+            )
+        else:
+            index[this_key_chain] = len(leaves)
+            key_chains.append(this_key_chain)
+            leaves.append(value)
+            children.append(None)
+    return tuple(keys), tuple(children)
+
+
+def _build_node(node_skeleton, nodes, leaves, template, prune_empty, dict_types):
+    node = next(nodes)
+    if template is not None:
+        node = template
+    nest_types = tuple(node._types_to_iteratively_nest)
+    return_dict = dict()
+    for key, child in zip(*node_skeleton):
+        if child is None:
+            value = next(leaves)
+            # nested values returned for leaves are turned into containers, as when
+            # constructing a container
+            if (
+                isinstance(value, dict_types)
+                and (
+                    not isinstance(value, ivy.Container)
+                    or node._rebuild_child_containers
+                )
+            ) or isinstance(value, nest_types):
+                value = ivy.Container(value, **node._config)
+        else:
+            value = _build_node(child, nodes, leaves, template, prune_empty, dict_types)
+            if prune_empty and not value:
+                continue
+            if node._rebuild_child_containers:
+                value = ivy.Container(value, **node._config)
+        return_dict[key] = value
+    if node._alphabetical_keys and len(return_dict) > 1:
+        return_dict = dict(sorted(return_dict.items()))
+    return node._cont_new(return_dict)
+
+
+def _build(skeleton, nodes, leaves, template=None, prune_empty=False):
+    # sub-containers are built with the config of the template if given, otherwise
+    # with the config of the sub-containers they were flattened from. The nodes are
+    # built by a function of the module rather than a closure, which would reference
+    # itself and keep the containers alive until the garbage collector runs
+    dict_types = tuple([dict] + ivy.container_types())
+    return _build_node(
+        skeleton, iter(nodes), iter(leaves), template, prune_empty, dict_types
+    )
+
+
+class FlatContainer:
+    """
+    Flat view of a container, with its leaves in order and the key chain of each.
+
+    The leaves are held in a list, next to the key chains, the index of each leaf by
+    key chain and a skeleton of the nested structure computed once when flattening,
+    such that mapping over the leaves is a single loop which doesn't build any
+    intermediate containers, and a leaf is looked up by its key chain with a single
+    dict lookup. The nested container is only built when it is first requested, and
+    the flat containers returned by maps share the key chains, the index and the
+    skeleton of this one.
+
+    Flat containers are created with :meth:`ivy.Container.cont_flatten`.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3.])})
+    >>> flat = x.cont_flatten()
+    >>> print(flat.key_chains)
+    ['a', 'b/c']
+    >>> print(flat["b/c"])
+    ivy.array([3.])
+    >>> y = flat.map(lambda v, kc: v * 2).to_container()
+    >>> print(y)
+    {
+        a: ivy.array([2., 4.]),
+        b: {
+            c: ivy.array([6.])
+        }
+    }
+    """
+
+    __slots__ = (
+        "_key_chains",
+        "_leaves",
+        "_index",
+        "_skeleton",
+        "_nodes",
+        "_container",
+    )
+
+    def __init__(self, key_chains, leaves, index, skeleton, nodes):
+        self._key_chains = key_chains
+        self._leaves = leaves
+        self._index = index
+        self._skeleton = skeleton
+        self._nodes = nodes
+        self._container = None
+
+    @staticmethod
+    def from_container(cont):
+        """
+        Flatten a container into its leaves, key chains and nested structure.
+
+        Parameters
+        ----------
+        cont
+            the container to flatten.
+
+        Returns
+        -------
+        ret
+            the flat view of the container.
+        """
+        key_chains, leaves, nodes, index = list(), list(), list(), dict()
+        skeleton = _flatten(cont, "", key_chains, leaves, nodes, index)
+        return FlatContainer(key_chains, leaves, index, skeleton, nodes)
+
+    @property
+    def key_chains(self):
+        return self._key_chains
+
+    @property
+    def leaves(self):
+        return self._leaves
+
+    def __len__(self):
+        return len(self._leaves)
+
+    def __contains__(self, key_chain):
+        return key_chain in self._index
+
+    def __getitem__(self, key_chain):
+        """
+        Return the leaf at a key chain.
+
+        Parameters
+        ----------
+        key_chain
+            the key chain of the leaf, with its keys separated by ``"/"``.
+
+        Returns
+        -------
+        ret
+            the leaf, looked up in the index of the leaves by key chain.
+        """
+        try:
+            return self._leaves[self._index[key_chain]]
+        except KeyError as e:
+            raise ivy.utils.exceptions.IvyException(repr(e))
+
+    def items(self):
+        return zip(self._key_chains, self._leaves)
+
+    def identical_structure(self, other):
+        """Return whether the other flat container has the same nested structure."""
+        return self._skeleton is other._skeleton or self._skeleton == other._skeleton
+
+    def map(self, func):
+        """
+        Apply a function to each leaf, in a single loop over the leaves.
+
+        Parameters
+        ----------
+        func
+            function to apply to each leaf, called with the leaf and its key chain.
+
+        Returns
+        -------
+        ret
+            a flat container with the same structure and the mapped leaves.
+        """
+        return FlatContainer(
+            self._key_chains,
+            [func(x, kc) for x, kc in zip(self._leaves, self._key_chains)],
+            self._index,
+            self._skeleton,
+            self._nodes,
+        )
+
+    @staticmethod
+    def multi_map(func, values):
+        """
+        Apply a function to the leaves of several flat containers, in a single loop.
+
+        Parameters
+        ----------
+        func
+            function to apply, called with the list of the leaves at each key chain
+            and the key chain.
+        values
+            flat containers with identical structures, and other values which are
+            passed to the function as they are.
+
+        Returns
+        -------
+        ret
+            a flat container with the structure of the first flat container.
+        """
+        flat0 = [v for v in values if isinstance(v, FlatContainer)][0]
+        leaves = [
+            v._leaves if isinstance(v, FlatContainer) else [v] * len(flat0)
+            for v in values
+        ]
+        return FlatContainer(
+            flat0._key_chains,
+            [func(list(xs), kc) for xs, kc in zip(zip(*leaves), flat0._key_chains)],
+            flat0._index,
+            flat0._skeleton,
+            flat0._nodes,
+        )
+
+    def to_container(self):
+        """
+        Build the nested container, with the config of each of the original
+        sub-containers.
+
+        Returns
+        -------
+        ret
+            the nested container, built once and reused by later calls.
+        """
+        if self._container is None:
+            self._container = _build(self._skeleton, self._nodes, self._leaves)
+        return self._container
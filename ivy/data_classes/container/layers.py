@@ -636,6 +636,7 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -669,6 +670,9 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at a time, with an online softmax.
+            Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -731,6 +735,7 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -746,6 +751,7 @@ class _ContainerWithLayers(ContainerBase):
         /,
         *,
         mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -779,6 +785,9 @@ class _ContainerWithLayers(ContainerBase):
             The mask input array/container. The mask to apply to the query-key values.
             Default is None. The shape of mask input array leaves should be in
             *[batch_shape,num_queries,num_keys]*.
+        chunk_size
+            The number of keys to attend to at a time, with an online softmax.
+            Default is ``None``.
         key_chains
             The key-chains to apply or not apply the method to. Default is ``None``.
         to_apply
@@ -839,6 +848,7 @@ class _ContainerWithLayers(ContainerBase):
             v,
             scale,
             mask=mask,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -861,6 +871,7 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -880,6 +891,7 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -901,6 +913,7 @@ class _ContainerWithLayers(ContainerBase):
         to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        chunk_size: Optional[int] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -919,6 +932,7 @@ class _ContainerWithLayers(ContainerBase):
             to_q_v=to_q_v,
             to_kv_v=to_kv_v,
             to_out_v=to_out_v,
+            chunk_size=chunk_size,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
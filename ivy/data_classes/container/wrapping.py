@@ -8,10 +8,26 @@ from types import ModuleType
 TO_IGNORE = ["is_ivy_array", "is_native_array", "is_array", "shape"]
 
 
+def _data_slot(array_spec):
+    # the position and name of the parameter to pass the container to, if it is
+    # passed as a top-level argument, otherwise None
+    if not array_spec:
+        return None
+    (position, name), *path = array_spec[0]
+    if path not in ([], ["optional"]):
+        return None
+    return position, name
+
+
 def _wrap_function(function_name: str, static: bool) -> Callable:
     """
     Wrap the function called `function_name`.
 
+    The position of the container argument is resolved once from the array spec of
+    the function, and instance methods pass the container directly in that slot. The
+    function itself is still looked up by name when called, such that containers can
+    map the function of their own backend.
+
     Parameters
     ----------
     function_name
@@ -24,6 +40,51 @@ def _wrap_function(function_name: str, static: bool) -> Callable:
     new_function
         the wrapped function.
     """
+    slot = None
+    if not static:
+        slot = _data_slot(getattr(ivy.__dict__[function_name], "array_spec", None))
+
+    if static:
+
+        def rearrange(args, kwargs):
+            return args, kwargs
+
+    elif slot is not None:
+        position, name = slot
+
+        def rearrange(args, kwargs):
+            # if the method has been called as an instance method, place self in the
+            # slot of the container argument
+            if not args or not ivy.is_ivy_container(args[0]):
+                return args, kwargs
+            if len(args) > position:
+                return (*args[1 : position + 1], args[0], *args[position + 1 :]), kwargs
+            kwargs[name] = args[0]
+            return args[1:], kwargs
+
+    else:
+
+        def rearrange(args, kwargs):
+            data_idx = ivy.__dict__[function_name].array_spec[0]
+            if args and ivy.is_ivy_container(args[0]):
+                # if the method has been called as an instance method, then we need
+                # to re-arrange and place self in the correct location in the args
+                # or kwargs
+                self = args[0]
+                args = args[1:]
+                if len(args) > data_idx[0][0]:
+                    args = ivy.copy_nest(args, to_mutable=True)
+                    data_idx = [data_idx[0][0]] + [
+                        0 if idx is int else idx for idx in data_idx[1:]
+                    ]
+                    ivy.insert_into_nest_at_index(args, data_idx, self)
+                else:
+                    kwargs = ivy.copy_nest(kwargs, to_mutable=True)
+                    data_idx = [data_idx[0][1]] + [
+                        0 if idx is int else idx for idx in data_idx[1:]
+                    ]
+                    ivy.insert_into_nest_at_index(kwargs, data_idx, self)
+            return args, kwargs
 
     def new_function(
         *args,
@@ -34,32 +95,7 @@ def _wrap_function(function_name: str, static: bool) -> Callable:
         out: Optional[ivy.Container] = None,
         **kwargs
     ):
-        function = ivy.__dict__[function_name]
-        data_idx = function.array_spec[0]
-        if (
-            not (data_idx[0][0] == 0 and len(data_idx[0]) == 1)
-            and args
-            and ivy.is_ivy_container(args[0])
-            and not static
-        ):
-            # if the method has been called as an instance method, and self should not
-            # be the first positional arg, then we need to re-arrange and place self
-            # in the correct location in the args or kwargs
-            self = args[0]
-            args = args[1:]
-            if len(args) > data_idx[0][0]:
-                args = ivy.copy_nest(args, to_mutable=True)
-                data_idx = [data_idx[0][0]] + [
-                    0 if idx is int else idx for idx in data_idx[1:]
-                ]
-                ivy.insert_into_nest_at_index(args, data_idx, self)
-            else:
-                kwargs = ivy.copy_nest(kwargs, to_mutable=True)
-                data_idx = [data_idx[0][1]] + [
-                    0 if idx is int else idx for idx in data_idx[1:]
-                ]
-                ivy.insert_into_nest_at_index(kwargs, data_idx, self)
-
+        args, kwargs = rearrange(args, kwargs)
         # return function multi-mapped across the corresponding leaves of the containers
         return ivy.ContainerBase.cont_multi_map_in_function(
             function_name,
@@ -352,43 +352,87 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+def _is_array_like_annotation(parameter: str, annotation) -> bool:
+    annotation_str = str(annotation)
+    return (
+        ("rray" in annotation_str or "Tensor" in annotation_str)
+        and parameter != "out"
+        and all(
+            sq not in annotation_str
+            for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+        )
+    )
+
+
+def _get_array_like_params(fn: Callable):
+    """
+    Get the positional indices and keyword names of the array-like parameters of
+    `fn`, as inferred from its type annotations.
+
+    Parameters
+    ----------
+    fn
+        the function to inspect.
+
+    Returns
+    -------
+    ret
+        a tuple ``(positions, names)``, or ``None`` if the signature of `fn` can't
+        be inspected.
+    """
+    try:
+        parameters = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    positions = []
+    names = []
+    for i, (parameter, param) in enumerate(parameters.items()):
+        if not _is_array_like_annotation(parameter, param.annotation):
+            continue
+        if param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+            positions.append(i)
+        if param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+            names.append(parameter)
+    return tuple(positions), tuple(names)
+
+
+def _has_array_like_params(fn: Callable) -> bool:
+    array_like_params = _get_array_like_params(fn)
+    return array_like_params is not None and any(array_like_params)
+
+
+def _requires_array_conversion(arg) -> bool:
+    # Fix for ellipsis, slices for numpy's __getitem__
+    # No need to try and convert them into arrays
+    # since asarray throws unpredictable bugs
+    # Containers are left for handle_nestable, or for the function itself to map
+    return not (
+        arg is None
+        or ivy.is_array(arg)
+        or isinstance(arg, ivy.Container)
+        or _check_in_nested_sequence(arg, value=Ellipsis, _type=slice)
+    )
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    array_like_params = _get_array_like_params(fn)
+    if array_like_params is None:
+        positions, names = (), ()
+    else:
+        positions, names = array_like_params
+
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
-        args = list(args)
         num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
-            return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
-
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
-                if i < num_args:
-                    # Fix for ellipsis, slices for numpy's __getitem__
-                    # No need to try and convert them into arrays
-                    # since asarray throws unpredictable bugs
-                    if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
-                        continue
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
-                        kwargs[parameter] = ivy.array(kwarg)
-
+        args = list(args)
+        for i in positions:
+            if i >= num_args:
+                break
+            if _requires_array_conversion(args[i]):
+                args[i] = ivy.array(args[i])
+        for parameter in names:
+            if parameter in kwargs and _requires_array_conversion(kwargs[parameter]):
+                kwargs[parameter] = ivy.array(kwargs[parameter])
         return fn(*args, **kwargs)
 
     _handle_array_like_without_promotion.handle_array_like_without_promotion = True
@@ -871,6 +915,19 @@ def _update_torch_references(x, visited_view=None):
 
 def handle_nestable(fn: Callable) -> Callable:
     fn_name = fn.__name__
+    cont_fn = None
+
+    def _get_cont_fn():
+        # the container dispatch is resolved once, on the first container call
+        nonlocal cont_fn
+        if cont_fn is None:
+            if hasattr(ivy.Container, "_static_" + fn_name):
+                cont_fn = getattr(ivy.Container, "_static_" + fn_name)
+            else:
+                cont_fn = functools.partial(
+                    ivy.Container.cont_multi_map_in_function, fn
+                )
+        return cont_fn
 
     @functools.wraps(fn)
     def _handle_nestable(*args, **kwargs):
@@ -894,17 +951,10 @@ def handle_nestable(fn: Callable) -> Callable:
         # if any of the arguments or keyword arguments passed to the function contains
         # a container, get the container's version of the function and call it using
         # the passed arguments.
-        if hasattr(ivy.Container, "_static_" + fn_name):
-            cont_fn = getattr(ivy.Container, "_static_" + fn_name)
-        else:
-            cont_fn = lambda *args, **kwargs: ivy.Container.cont_multi_map_in_function(
-                fn, *args, **kwargs
-            )
         if ivy.get_nestable_mode() and (
-            ivy.nested_any(args, ivy.is_ivy_container, check_nests=True)
-            or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+            _contains_container(args) or _contains_container(kwargs)
         ):
-            return cont_fn(*args, **kwargs)
+            return _get_cont_fn()(*args, **kwargs)
 
         # if the passed arguments does not contain a container, the function using
         # the passed arguments, returning an ivy or a native array.
@@ -914,6 +964,117 @@ def handle_nestable(fn: Callable) -> Callable:
     return _handle_nestable
 
 
+# Fused Dispatch #
+# ---------------#
+
+# decorators which are pure pass-throughs unless the call carries the input they
+# handle, these can be skipped on a per-call basis by the fused dispatcher
+_CALL_DEPENDENT_DECORATORS = (
+    "handle_array_function",
+    "handle_out_argument",
+    "handle_nestable",
+    "handle_nans",
+)
+
+
+def _contains_container(x) -> bool:
+    # shallow type scan, equivalent to
+    # ivy.nested_any(x, ivy.is_ivy_container, check_nests=True) but only recursing
+    # into the sequences and dicts actually present in x
+    if isinstance(x, ivy.Container):
+        return True
+    if isinstance(x, (list, tuple)):
+        items = x
+    elif isinstance(x, dict):
+        items = x.values()
+    else:
+        return False
+    for item in items:
+        if isinstance(item, ivy.Container):
+            return True
+        if isinstance(item, (list, tuple, dict)) and _contains_container(item):
+            return True
+    return False
+
+
+def _overrides_array_function(x) -> bool:
+    # containers are excluded before the attribute lookup, which they would
+    # otherwise map onto their leaves
+    return (
+        x is not None
+        and not isinstance(x, (ivy.Array, ivy.NativeArray, ivy.Container))
+        and hasattr(x, "__ivy_array_function__")
+    )
+
+
+def _fuse_decorators(fn: Callable, decorators: list) -> Callable:
+    """
+    Wrap `fn` with `decorators` (applied in the given order) behind a single
+    dispatcher.
+
+    Two chains are built once at wrapping time, the full chain with every decorator
+    and a lean chain without the decorators listed in `_CALL_DEPENDENT_DECORATORS`.
+    Each call does a single scan of its arguments and only goes through the full
+    chain if it carries a container, an `out` argument, an object overriding
+    `__ivy_array_function__`, or if a nan policy other than "nothing" is set.
+    `handle_array_like_without_promotion` is dropped altogether when the signature
+    of `fn` has no array-like parameters, as it is a no-op for such functions.
+
+    Parameters
+    ----------
+    fn
+        the function to wrap.
+    decorators
+        names of the decorators in `FN_DECORATORS` to apply to `fn`.
+
+    Returns
+    -------
+    ret
+        the dispatcher, carrying the attributes of the fully wrapped function.
+    """
+    flags = list(decorators)
+    if "handle_array_like_without_promotion" in decorators and not (
+        _has_array_like_params(fn)
+    ):
+        decorators = [
+            attr for attr in decorators if attr != "handle_array_like_without_promotion"
+        ]
+    skippable = [attr for attr in decorators if attr in _CALL_DEPENDENT_DECORATORS]
+    full = fn
+    for attr in decorators:
+        full = getattr(ivy, attr)(full)
+    if not skippable:
+        for attr in flags:
+            setattr(full, attr, True)
+        return full
+    lean = fn
+    for attr in decorators:
+        if attr not in skippable:
+            lean = getattr(ivy, attr)(lean)
+    check_out = "handle_out_argument" in skippable
+    check_nans = "handle_nans" in skippable
+    check_containers = "handle_nestable" in skippable
+    check_overrides = "handle_array_function" in skippable
+
+    @functools.wraps(full)
+    def _fused_dispatcher(*args, **kwargs):
+        if (check_out and kwargs.get("out") is not None) or (
+            check_nans and ivy.get_nan_policy() != "nothing"
+        ):
+            return full(*args, **kwargs)
+        if check_containers or check_overrides:
+            for arg in args + tuple(kwargs.values()):
+                if (check_containers and _contains_container(arg)) or (
+                    check_overrides and _overrides_array_function(arg)
+                ):
+                    return full(*args, **kwargs)
+        return lean(*args, **kwargs)
+
+    for attr in flags:
+        setattr(_fused_dispatcher, attr, True)
+    return _fused_dispatcher
+
+
 # Functions #
 
 
@@ -987,9 +1148,12 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        decorators = [
+            attr
+            for attr in FN_DECORATORS
+            if hasattr(original, attr) and not hasattr(to_wrap, attr)
+        ]
+        to_wrap = _fuse_decorators(to_wrap, decorators)
     return to_wrap
 
 
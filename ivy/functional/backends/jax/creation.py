@@ -139,8 +139,15 @@ def eye(
 
 
 def from_dlpack(x, /, *, out: Optional[JaxArray] = None) -> JaxArray:
-    capsule = jax.dlpack.to_dlpack(x)
-    return jax.dlpack.from_dlpack(capsule)
+    if isinstance(x, JaxArray):
+        x = jax.dlpack.to_dlpack(x)
+    elif hasattr(x, "__dlpack__"):
+        x = x.__dlpack__()
+    return jax.dlpack.from_dlpack(x)
+
+
+def to_dlpack(x: JaxArray, /):
+    return jax.dlpack.to_dlpack(x)
 
 
 def full(
@@ -370,3 +370,41 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return jnp.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: JaxArray,
+    init_h: JaxArray,
+    init_c: JaxArray,
+    kernel: JaxArray,
+    recurrent_kernel: JaxArray,
+    /,
+    *,
+    bias: Optional[JaxArray] = None,
+    recurrent_bias: Optional[JaxArray] = None,
+) -> Tuple[JaxArray, JaxArray]:
+    out_channels = recurrent_kernel.shape[0]
+    # input kernel, with both biases folded in once for all timesteps
+    Wi_x = jnp.matmul(x, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    # all four gates are activated by a single tanh, using
+    # sigmoid(x) = (tanh(x / 2) + 1) / 2 for the input, forget and output gates
+    gate_scale = jnp.full(4 * out_channels, 0.5, dtype=Wi_x.dtype)
+    gate_scale = gate_scale.at[2 * out_channels : 3 * out_channels].set(1)
+
+    def _lstm_step(carry, Wi_xt):
+        htm1, ctm1 = carry
+        gates = jnp.tanh((Wi_xt + jnp.matmul(htm1, recurrent_kernel)) * gate_scale)
+        sig = gates * 0.5 + 0.5
+        it, ft, _, ot = jnp.split(sig, 4, axis=-1)
+        gt = gates[..., 2 * out_channels : 3 * out_channels]
+        ct = ft * ctm1 + it * gt
+        ht = ot * jnp.tanh(ct)
+        return (ht, ct), ht
+
+    # the time dimension is scanned natively rather than unrolled
+    (_, ct), hts = jlax.scan(_lstm_step, (init_h, init_c), jnp.moveaxis(Wi_x, -2, 0))
+    return jnp.moveaxis(hts, 0, -2), ct
@@ -105,6 +105,10 @@ def from_dlpack(
     raise IvyNotImplementedException()
 
 
+def to_dlpack(x: Union[(None, mx.ndarray.NDArray)], /):
+    raise IvyNotImplementedException()
+
+
 def full(
     shape: Union[(ivy.NativeShape, Sequence[int])],
     fill_value: Union[(int, float, bool)],
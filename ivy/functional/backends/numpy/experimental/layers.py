@@ -1,5 +1,6 @@
 # global
 
+import itertools
 import math
 import numpy as np
 from typing import Optional, Union, Tuple, Literal
@@ -7,7 +8,6 @@ from typing import Optional, Union, Tuple, Literal
 # local
 import ivy
 from ivy.functional.ivy.layers import _handle_padding, _get_num_padded_values
-from ivy.functional.backends.numpy.layers import _add_dilations
 from ivy.functional.ivy.experimental.layers import _padding_ceil_mode
 
 
@@ -43,6 +43,91 @@ def _determine_depth_max_pooling(x, kernel, strides, dims):
     return x, kernel, strides, depth_pooling
 
 
+def _pool_reduce(
+    x, kernel, strides, pad_list, dims, reduce_fn, init, dilation=None, out=None
+):
+    """
+    Reduce the sliding windows of a channel last input one kernel offset at a time.
+
+    Rather than materialising the B x O1 .. Od x K1 .. Kd x C windows, every kernel
+    offset contributes a strided slice of the unpadded input to the output, which is
+    clipped to the outputs whose window covers that offset. The padded positions
+    therefore never exist and contribute ``init``, the identity of ``reduce_fn``.
+    The output is accumulated in ``out`` if it has the output shape and the dtype of
+    ``init``.
+    """
+    dilation = [1] * dims if dilation is None else dilation
+    in_sizes = x.shape[1:-1]
+    out_sizes = [
+        (in_sizes[i] + sum(pad_list[i]) - (kernel[i] - 1) * dilation[i] - 1)
+        // strides[i]
+        + 1
+        for i in range(dims)
+    ]
+    out_shape = (x.shape[0], *out_sizes, x.shape[-1])
+    if out is not None and out.shape == out_shape and out.dtype == init.dtype:
+        res = out
+        res.fill(init)
+    else:
+        res = np.full(out_shape, init)
+    for offsets in itertools.product(*[range(k) for k in kernel]):
+        res_slices, x_slices = [slice(None)], [slice(None)]
+        for i in range(dims):
+            start = offsets[i] * dilation[i] - pad_list[i][0]
+            # the first and last outputs whose window position lies in the input
+            first = max(0, -(start // strides[i]))
+            last = min(out_sizes[i] - 1, (in_sizes[i] - 1 - start) // strides[i])
+            if last < first:
+                break
+            res_slices.append(slice(first, last + 1))
+            x_start = first * strides[i] + start
+            x_slices.append(
+                slice(x_start, x_start + (last - first) * strides[i] + 1, strides[i])
+            )
+        else:
+            res_view = res[tuple(res_slices)]
+            reduce_fn(res_view, x[tuple(x_slices)], out=res_view)
+    return res
+
+
+def _pool_out(res, out):
+    # writes the result to out, unless it was already accumulated in it
+    if out is None:
+        return res
+    if not np.may_share_memory(res, out):
+        np.copyto(out, res, casting="unsafe")
+    return out
+
+
+def _max_pool_init(dtype):
+    if np.issubdtype(dtype, np.integer):
+        return np.array(np.iinfo(dtype).min, dtype=dtype)
+    return np.array(-np.inf, dtype=dtype)
+
+
+def _avg_pool_dtype(dtype):
+    # the accumulation and result dtypes matching np.mean
+    if np.issubdtype(dtype, np.floating):
+        return np.promote_types(dtype, np.float32), dtype
+    return np.dtype(np.float64), np.dtype(np.float64)
+
+
+def _channel_last_out(out, data_format, dims):
+    if out is None or data_format[-1] == "C":
+        return out
+    return np.moveaxis(out, 1, -1)
+
+
+def _pad_list(x_shape, kernel, strides, padding, dims):
+    if isinstance(padding, str):
+        pad_specific = [
+            _handle_padding(x_shape[i], strides[i], kernel[i], padding)
+            for i in range(dims)
+        ]
+        return [(pad // 2, pad - pad // 2) for pad in pad_specific]
+    return list(padding)
+
+
 def max_pool1d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int], Tuple[int, int]],
@@ -66,36 +151,25 @@ def max_pool1d(
     if data_format == "NCW":
         x = np.swapaxes(x, 1, 2)
 
-    pad_w = _handle_padding(x.shape[1], strides[0], kernel[0], padding)
-    x = np.pad(
+    pad_list = _pad_list(x.shape[1:2], kernel, strides, padding, 1)
+    # B x OW x I
+    res = _pool_reduce(
         x,
-        [
-            (0, 0),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "edge",
-    )
-
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
+        kernel,
+        strides,
+        pad_list,
+        1,
+        np.maximum,
+        _max_pool_init(x.dtype),
+        out=_channel_last_out(out, data_format, 1),
     )
 
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
+    if data_format == "NCW":
+        res = res.swapaxes(1, 2)
+    return _pool_out(res, out)
 
-    res = sub_matrices.max(axis=(2))
 
-    if data_format == "NCW":
-        return res.swapaxes(1, 2)
-    return res
+max_pool1d.support_native_out = True
 
 
 def max_pool2d(
@@ -142,68 +216,39 @@ def max_pool2d(
         x, kernel, strides, 2
     )
     x_shape = list(x.shape[1:3])
-    filters = np.ones((list(kernel)), dtype=x.dtype)
-    if not depth_pooling:
-        for j in range(2):
-            if dilation[j] > 1:
-                filters = _add_dilations(filters, dilation[j], axis=j, values=0)
-        kernel = list(filters.shape)
-        pad_list = padding
-        if isinstance(padding, str):
-            pad_h = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-            pad_w = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-            pad_list = [
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-            ]
-        pad_list = list(pad_list)
+    pad_list = [(0, 0)] * 2
+    if depth_pooling:
+        dilation = [1] * 2
+    else:
+        dilated_kernel = [(kernel[i] - 1) * dilation[i] + 1 for i in range(2)]
+        pad_list = _pad_list(x_shape, dilated_kernel, strides, padding, 2)
         if ceil_mode:
             for i in range(2):
                 pad_list[i] = _padding_ceil_mode(
-                    x_shape[i], kernel[i], pad_list[i], strides[i]
+                    x_shape[i], dilated_kernel[i], pad_list[i], strides[i]
                 )
 
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                *pad_list,
-                (0, 0),
-            ],
-            "constant",
-            constant_values=-math.inf,
-        )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.where(
-        filters.reshape([1] * 3 + list(kernel) + [1]), sub_matrices, -math.inf
-    )
-
     # B x OH x OW x O
-    res = sub_matrices.max(axis=(3, 4))
+    res = _pool_reduce(
+        x,
+        kernel,
+        strides,
+        pad_list,
+        2,
+        np.maximum,
+        _max_pool_init(x.dtype),
+        dilation=dilation,
+        out=None if depth_pooling else _channel_last_out(out, data_format, 2),
+    )
 
     if depth_pooling:
         res = np.transpose(res, (0, 2, 3, 1))
     if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
+        res = np.transpose(res, (0, 3, 1, 2))
+    return _pool_out(res, out)
+
+
+max_pool2d.support_native_out = True
 
 
 def max_pool3d(
@@ -229,48 +274,25 @@ def max_pool3d(
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
 
-    x_shape = list(x.shape[1:4])
-    pad_d = _handle_padding(x_shape[0], strides[0], kernel[0], padding)
-    pad_h = _handle_padding(x_shape[1], strides[1], kernel[1], padding)
-    pad_w = _handle_padding(x_shape[2], strides[2], kernel[2], padding)
-
-    x = np.pad(
+    pad_list = _pad_list(x.shape[1:4], kernel, strides, padding, 3)
+    # B x OD x OH x OW x O
+    res = _pool_reduce(
         x,
-        [
-            (0, 0),
-            (pad_d // 2, pad_d - pad_d // 2),
-            (pad_h // 2, pad_h - pad_h // 2),
-            (pad_w // 2, pad_w - pad_w // 2),
-            (0, 0),
-        ],
-        "edge",
-    )
-
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
+        kernel,
+        strides,
+        pad_list,
+        3,
+        np.maximum,
+        _max_pool_init(x.dtype),
+        out=_channel_last_out(out, data_format, 3),
     )
 
-    # B x OH x OW x O
-    res = sub_matrices.max(axis=(4, 5, 6))
     if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
+        res = np.transpose(res, (0, 4, 1, 2, 3))
+    return _pool_out(res, out)
+
+
+max_pool3d.support_native_out = True
 
 
 def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
@@ -297,6 +319,101 @@ def _get_padded_values(x_shape, kernel, strides, padding, ceil_mode, dim):
     return padding, pad_specific, c
 
 
+def _avg_pool_num_padded_values(
+    res_shape, x_shape, kernel, strides, pad_specific, c, count_include_pad, dims
+):
+    # the number of padded values in each window along each spatial dimension
+    if not count_include_pad:
+        return [
+            np.array(
+                ivy.map(
+                    _get_num_padded_values,
+                    constant={
+                        "p": pad_specific[i],
+                        "n": x_shape[i],
+                        "k": kernel[i],
+                        "s": strides[i],
+                    },
+                    unique={
+                        "i": np.arange(res_shape[i + 1]),
+                    },
+                ),
+            )
+            for i in range(dims)
+        ]
+    num_padded_values = []
+    for i in range(dims):
+        num_pad = np.zeros(res_shape[i + 1])
+        num_pad[-1] = c[i]
+        num_padded_values.append(num_pad)
+    return num_padded_values
+
+
+def _avg_pool(
+    x,
+    kernel,
+    strides,
+    padding,
+    dims,
+    data_format,
+    count_include_pad,
+    ceil_mode,
+    divisor_override,
+    out,
+):
+    if data_format[1] == "C":
+        x = np.moveaxis(x, 1, -1)
+    x_shape = list(x.shape[1:-1])
+    padding, pad_specific, c = _get_padded_values(
+        x_shape, kernel, strides, padding, ceil_mode, dims
+    )
+    acc_dtype, dtype = _avg_pool_dtype(x.dtype)
+
+    # B x O1 .. Od x C window sums
+    res = _pool_reduce(
+        x,
+        kernel,
+        strides,
+        padding,
+        dims,
+        np.add,
+        np.array(0, dtype=acc_dtype),
+        out=_channel_last_out(out, data_format, dims),
+    )
+
+    kernel_mul = np.prod(kernel)
+    if divisor_override is not None:
+        res /= divisor_override
+    elif (not count_include_pad or ceil_mode) and any(pad_specific):
+        num_padded_values = _avg_pool_num_padded_values(
+            res.shape,
+            x_shape,
+            kernel,
+            strides,
+            pad_specific,
+            c,
+            count_include_pad,
+            dims,
+        )
+        # the number of padded values in each window, by inclusion-exclusion over
+        # the padded values along each of the spatial dimensions
+        num_valid_values = np.ones([1] * dims)
+        for i in range(dims):
+            shape = [1] * dims
+            shape[i] = -1
+            num_valid_values = num_valid_values * (
+                kernel[i] - num_padded_values[i].reshape(shape)
+            )
+        res /= np.expand_dims(num_valid_values, -1)
+    else:
+        res /= kernel_mul
+    if data_format[1] == "C":
+        res = np.moveaxis(res, -1, 1)
+    if out is None:
+        return res.astype(dtype, copy=False)
+    return _pool_out(res, out)
+
+
 def avg_pool1d(
     x: np.ndarray,
     kernel: Union[int, Tuple[int]],
@@ -319,64 +436,21 @@ def avg_pool1d(
     elif len(strides) == 1:
         strides = [strides[0]]
 
-    if data_format == "NCW":
-        x = np.swapaxes(x, 1, 2)
-    x_shape = x.shape[1:-1]
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 1
-    )
-
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
+        kernel,
+        strides,
+        padding,
+        1,
+        data_format,
+        count_include_pad,
+        ceil_mode,
+        None,
+        out,
     )
 
-    x_shape = x.shape
-    new_w = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w, kernel[0]] + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
 
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-
-    res = np.mean(sub_matrices, axis=2)
-
-    if (not count_include_pad or ceil_mode) and any(pad_specific):
-        if not count_include_pad:
-            num_padded_values = np.array(
-                ivy.map(
-                    _get_num_padded_values,
-                    constant={
-                        "p": pad_specific[0],
-                        "n": x.shape[1] - pad_specific[0],
-                        "k": kernel[0],
-                        "s": strides[0],
-                    },
-                    unique={
-                        "i": np.arange(res.shape[1]),
-                    },
-                ),
-                dtype=res.dtype,
-            )
-        else:
-            num_padded_values = np.zeros(res.shape[1], dtype=res.dtype)
-            num_padded_values[-1] = c[0]
-        res = (kernel[0] * res) / (kernel[0] - num_padded_values[:, None])
-
-    if data_format == "NCW":
-        return res.swapaxes(1, 2)
-    return res
+avg_pool1d.support_native_out = True
 
 
 def avg_pool2d(
@@ -402,88 +476,21 @@ def avg_pool2d(
     elif len(strides) == 1:
         strides = [strides[0]] * 2
 
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
-
-    x_shape = list(x.shape[1:3])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 2
-    )
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
-    )
-
-    x_shape = x.shape
-    new_h = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_w = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
+        kernel,
+        strides,
+        padding,
+        2,
+        data_format,
+        count_include_pad,
+        ceil_mode,
+        divisor_override,
+        out,
     )
 
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(3, 4)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(3, 4))
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(2)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(2):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0][:, None]
-        num_padded_values2 = num_padded_values[1][None, :]
-        num_padded_values = (
-            num_padded_values1 * kernel[1]
-            + num_padded_values2 * kernel[0]
-            - num_padded_values1 * num_padded_values2
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
 
-    if data_format == "NCHW":
-        return np.transpose(res, (0, 3, 1, 2))
-    return res
+avg_pool2d.support_native_out = True
 
 
 def avg_pool3d(
@@ -509,97 +516,21 @@ def avg_pool3d(
     elif len(strides) == 1:
         strides = [strides[0]] * 3
 
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
-
-    x_shape = list(x.shape[1:4])
-    padding, pad_specific, c = _get_padded_values(
-        x_shape, kernel, strides, padding, ceil_mode, 3
-    )
-
-    x = np.pad(
+    return _avg_pool(
         x,
-        [
-            (0, 0),
-            *padding,
-            (0, 0),
-        ],
-        constant_values=0.0,
+        kernel,
+        strides,
+        padding,
+        3,
+        data_format,
+        count_include_pad,
+        ceil_mode,
+        divisor_override,
+        out,
     )
 
-    x_shape = x.shape
-    new_d = (x_shape[1] - kernel[0]) // strides[0] + 1
-    new_h = (x_shape[2] - kernel[1]) // strides[1] + 1
-    new_w = (x_shape[3] - kernel[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + list(kernel) + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
 
-    # B x OH x OW x O
-    if divisor_override is not None:
-        res = np.sum(sub_matrices, axis=(4, 5, 6)) / divisor_override
-    else:
-        res = np.mean(sub_matrices, axis=(4, 5, 6))
-
-    if (
-        (not count_include_pad or ceil_mode)
-        and any(pad_specific)
-        and not divisor_override
-    ):
-        if not count_include_pad:
-            num_padded_values = [
-                np.array(
-                    ivy.map(
-                        _get_num_padded_values,
-                        constant={
-                            "p": pad_specific[i],
-                            "n": x.shape[i + 1] - pad_specific[i],
-                            "k": kernel[i],
-                            "s": strides[i],
-                        },
-                        unique={
-                            "i": np.arange(res.shape[i + 1]),
-                        },
-                    ),
-                    dtype=res.dtype,
-                )
-                for i in range(3)
-            ]
-        else:
-            num_padded_values = []
-            for i in range(3):
-                num_pad = np.zeros(res.shape[i + 1], dtype=res.dtype)
-                num_pad[-1] = c[i]
-                num_padded_values.append(num_pad)
-        num_padded_values1 = num_padded_values[0].reshape((-1, 1, 1))
-        num_padded_values2 = num_padded_values[1].reshape((1, -1, 1))
-        num_padded_values3 = num_padded_values[2].reshape((1, 1, -1))
-        num_padded_values = (
-            num_padded_values1 * kernel[1] * kernel[2]
-            + num_padded_values2 * kernel[0] * kernel[2]
-            + num_padded_values3 * kernel[0] * kernel[1]
-            + num_padded_values1 * num_padded_values2 * num_padded_values3
-            - num_padded_values1 * num_padded_values2 * kernel[2]
-            - num_padded_values1 * num_padded_values3 * kernel[1]
-            - num_padded_values2 * num_padded_values3 * kernel[0]
-        )
-        kernel_mul = np.prod(kernel)
-        res = (kernel_mul * res) / (kernel_mul - np.expand_dims(num_padded_values, -1))
-    if data_format == "NCDHW":
-        return np.transpose(res, (0, 4, 1, 2, 3))
-    return res
+avg_pool3d.support_native_out = True
 
 
 def fft(
@@ -1,6 +1,9 @@
 """Collection of Numpy network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import os
+import time
+from collections import OrderedDict
 import numpy as np
 from typing import Union, Tuple, Optional, Sequence
 
@@ -23,13 +26,17 @@ def _add_dilations(x, dilations, axis, values=0):
     )
 
 
-def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
-    for j in range(dims):
-        if dilations[j] > 1:
-            filters = _add_dilations(filters, dilations[j], axis=j)
+def _pad_conv(x, filter_shape, strides, padding, dims, dilations):
+    # pads the channel last input for a convolution with a filter of the given
+    # spatial shape, the filter dilations only affect the effective filter size
     if isinstance(padding, str):
         pad_specific = [
-            _handle_padding(x.shape[1 + i], strides[i], filters.shape[i], padding)
+            _handle_padding(
+                x.shape[1 + i],
+                strides[i],
+                (filter_shape[i] - 1) * dilations[i] + 1,
+                padding,
+            )
             for i in range(dims)
         ]
         pad_list = [
@@ -40,15 +47,258 @@ def _dilate_pad_conv(x, filters, strides, padding, dims, dilations):
         pad_list = [(padding, padding)] * dims
     else:
         pad_list = [(_p, _p) if isinstance(_p, int) else _p for _p in padding]
-
+    if all(pad == (0, 0) for pad in map(tuple, pad_list)):
+        return x
     pad_width = [(0, 0), *pad_list, (0, 0)]
+    return np.pad(x, pad_width=pad_width, mode="constant")
+
+
+def _conv_windows(x, filter_shape, strides, dilations, dims):
+    # zero-copy view of the sliding windows of a padded channel last input,
+    # with shape B x O1 .. Od x K1 .. Kd x I
+    out_shape = [
+        (x.shape[i + 1] - (filter_shape[i] - 1) * dilations[i] - 1) // strides[i] + 1
+        for i in range(dims)
+    ]
+    window_strides = (
+        x.strides[0],
+        *[x.strides[i + 1] * strides[i] for i in range(dims)],
+        *[x.strides[i + 1] * dilations[i] for i in range(dims)],
+        x.strides[-1],
+    )
+    return np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], *out_shape, *filter_shape, x.shape[-1]],
+        window_strides,
+        writeable=False,
+    )
+
+
+def _conv_gemm(x, filters, strides, dilations, dims, feature_group_count=1):
+    """
+    Convolve a padded channel last input with a K1 .. Kd x I x O filter by lowering
+    the sliding windows to a single matrix multiplication (im2col + GEMM), so the
+    largest intermediate is the B x O1 .. Od x K1 .. Kd x I window matrix rather
+    than an additional copy of it for every output channel.
+    """
+    windows = _conv_windows(x, filters.shape[:dims], strides, dilations, dims)
+    if feature_group_count == 1:
+        res = np.tensordot(windows, filters, axes=dims + 1)
+    else:
+        # the groups become a batch dimension of the contraction, which also covers
+        # depthwise convolutions where every group holds a single input channel
+        input_dim, output_dim = filters.shape[-2:]
+        windows = windows.reshape(windows.shape[:-1] + (feature_group_count, input_dim))
+        filters = filters.reshape(
+            filters.shape[:-1]
+            + (feature_group_count, output_dim // feature_group_count)
+        )
+        spatial = "abcdef"[:dims]
+        kernel = "pqrstu"[:dims]
+        res = np.einsum(
+            "n{0}{1}zi,{1}izo->n{0}zo".format(spatial, kernel),
+            windows,
+            filters,
+            optimize=True,
+        )
+        res = res.reshape(res.shape[: dims + 1] + (output_dim,))
+    return res
+
+
+# Winograd F(2x2, 3x3) filter transform
+_WINOGRAD_G = np.array(
+    [[1, 0, 0], [0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0, 0, 1]], dtype=np.float64
+)
+
+
+def _winograd_input_transform(d, out):
+    # B^T d for the 4 rows of d, the 0 and +-1 entries of B^T reduce it to additions
+    np.subtract(d[0], d[2], out=out[0])
+    np.add(d[1], d[2], out=out[1])
+    np.subtract(d[2], d[1], out=out[2])
+    np.subtract(d[1], d[3], out=out[3])
 
+
+def _winograd_output_transform(m, out):
+    # A^T m for the 4 rows of m
+    np.add(m[0], m[1], out=out[0])
+    out[0] += m[2]
+    np.subtract(m[1], m[2], out=out[1])
+    out[1] -= m[3]
+
+
+def _conv_winograd(x, filters, strides, dilations, dims, feature_group_count=1):
+    """
+    Convolve a padded NHWC input with a 3 x 3 x I x O filter at stride 1 using the
+    Winograd F(2x2, 3x3) algorithm, which computes every 2 x 2 output tile from a
+    4 x 4 input tile with 16 instead of 36 multiplications per channel pair.
+    """
+    batch_size, in_h, in_w, input_dim = x.shape
+    out_h, out_w = in_h - 2, in_w - 2
+    tiles_h, tiles_w = -(-out_h // 2), -(-out_w // 2)
     x = np.pad(
         x,
-        pad_width=pad_width,
+        [(0, 0), (0, 2 * tiles_h - out_h), (0, 2 * tiles_w - out_w), (0, 0)],
         mode="constant",
     )
-    return x, filters
+    # B x TH x TW x 4 x 4 x I overlapping input tiles
+    tiles = np.lib.stride_tricks.as_strided(
+        x,
+        [batch_size, tiles_h, tiles_w, 4, 4, input_dim],
+        (
+            x.strides[0],
+            x.strides[1] * 2,
+            x.strides[2] * 2,
+            x.strides[1],
+            x.strides[2],
+            x.strides[3],
+        ),
+        writeable=False,
+    )
+    dtype = np.result_type(x, filters)
+    # 4 x 4 x B x TH x TW x I transformed input tiles
+    rows = np.empty((4, batch_size, tiles_h, tiles_w, 4, input_dim), dtype)
+    _winograd_input_transform([tiles[:, :, :, j] for j in range(4)], rows)
+    v = np.empty((4, 4, batch_size, tiles_h, tiles_w, input_dim), dtype)
+    for i in range(4):
+        _winograd_input_transform([rows[i, ..., k, :] for k in range(4)], v[i])
+    # 4 x 4 x I x O transformed filters
+    g = _WINOGRAD_G.astype(dtype)
+    u = np.einsum("ij,jkco,lk->ilco", g, filters, g, optimize=True)
+    # 16 independent channel contractions, one per tile position
+    m = np.matmul(v.reshape(16, -1, input_dim), u.reshape(16, input_dim, -1))
+    m = m.reshape(4, 4, batch_size, tiles_h, tiles_w, -1)
+    # B x TH x 2 x TW x 2 x O output tiles
+    rows = np.empty((2, 4) + m.shape[2:], dtype)
+    _winograd_output_transform(m, rows)
+    res = np.empty((batch_size, tiles_h, 2, tiles_w, 2, m.shape[-1]), dtype)
+    for a in range(2):
+        _winograd_output_transform(rows[a], np.moveaxis(res[:, :, a], 3, 0))
+    res = res.reshape(batch_size, 2 * tiles_h, 2 * tiles_w, -1)
+    return res[:, :out_h, :out_w]
+
+
+def _conv_fft(x, filters, strides, dilations, dims, feature_group_count=1):
+    """
+    Convolve a padded channel last input with a K1 .. Kd x I x O filter as a
+    product in the frequency domain, whose cost does not grow with the kernel size.
+    """
+    for i in range(dims):
+        if dilations[i] > 1:
+            filters = _add_dilations(filters, dilations[i], axis=i)
+    spatial_shape = x.shape[1:-1]
+    filter_shape = filters.shape[:dims]
+    axes = tuple(range(1, dims + 1))
+    # the cross-correlation is a convolution with the flipped filters
+    x_freq = np.fft.rfftn(x, s=spatial_shape, axes=axes)
+    filters_freq = np.fft.rfftn(
+        np.flip(filters, tuple(range(dims))), s=spatial_shape, axes=tuple(range(dims))
+    )
+    freq_shape = x_freq.shape[1:-1]
+    # one channel contraction per frequency, F x B x I @ F x I x O
+    res_freq = np.matmul(
+        np.moveaxis(x_freq.reshape(x.shape[0], -1, x.shape[-1]), 1, 0),
+        filters_freq.reshape(-1, *filters.shape[-2:]),
+    )
+    res_freq = np.moveaxis(res_freq, 0, 1).reshape(
+        x.shape[0], *freq_shape, filters.shape[-1]
+    )
+    res = np.fft.irfftn(res_freq, s=spatial_shape, axes=axes)
+    # the valid outputs are the ones without any circular wrap around
+    res = res[
+        (slice(None),)
+        + tuple(slice(filter_shape[i] - 1, None, strides[i]) for i in range(dims))
+    ]
+    return res.astype(np.result_type(x, filters), copy=False)
+
+
+_conv_algorithms = {
+    "gemm": _conv_gemm,
+    "winograd": _conv_winograd,
+    "fft": _conv_fft,
+}
+
+# the fastest algorithm measured for the most recently used convolution
+# configurations, least recently used first
+_conv_algorithm_cache = OrderedDict()
+_CONV_ALGORITHM_CACHE_SIZE = 256
+_CONV_AUTOTUNE_REPEATS = 2
+
+# whether to autotune the convolution algorithm, otherwise im2col + GEMM is always
+# used, whose results don't depend on which algorithm was measured fastest, which
+# is set with IVY_NUMPY_CONV_AUTOTUNE=0 or by setting this to False
+_conv_autotune = os.environ.get("IVY_NUMPY_CONV_AUTOTUNE", "1") != "0"
+
+
+def _conv_algorithm_key(x, filters, strides, dilations, groups):
+    # the batch size is left out, since the fastest algorithm hardly depends on it,
+    # and inputs with varying batch sizes would each be autotuned otherwise
+    return (
+        x.shape[1:],
+        filters.shape,
+        x.dtype,
+        filters.dtype,
+        tuple(strides),
+        tuple(dilations),
+        groups,
+    )
+
+
+def _conv_algorithm_candidates(x, filters, strides, dilations, dims, groups):
+    candidates = ["gemm"]
+    if groups != 1 or x.dtype not in (np.float32, np.float64):
+        return candidates
+    filter_shape = filters.shape[:dims]
+    if (
+        dims == 2
+        and tuple(filter_shape) == (3, 3)
+        and tuple(strides) == (1, 1)
+        and tuple(dilations) == (1, 1)
+    ):
+        candidates.append("winograd")
+    if max(filter_shape) >= 5 and all(s == 1 for s in strides):
+        candidates.append("fft")
+    return candidates
+
+
+def _conv_autotuned(x, filters, strides, dilations, dims, feature_group_count=1):
+    """
+    Convolve a padded channel last input with the fastest applicable algorithm.
+
+    The first call for each combination of input shape without the batch size,
+    filter shape, dtypes, strides, dilations and groups runs every applicable
+    algorithm once to warm it up, and then times it over a few more runs. The
+    fastest one is cached and used for all later calls with the same combination,
+    for the most recently used combinations.
+    """
+    if not _conv_autotune:
+        return _conv_gemm(x, filters, strides, dilations, dims, feature_group_count)
+    key = _conv_algorithm_key(x, filters, strides, dilations, feature_group_count)
+    algorithm = _conv_algorithm_cache.get(key)
+    if algorithm is not None:
+        _conv_algorithm_cache.move_to_end(key)
+        return _conv_algorithms[algorithm](
+            x, filters, strides, dilations, dims, feature_group_count
+        )
+    candidates = _conv_algorithm_candidates(
+        x, filters, strides, dilations, dims, feature_group_count
+    )
+    best_time, res = None, None
+    for candidate in candidates:
+        fn = _conv_algorithms[candidate]
+        candidate_res = fn(x, filters, strides, dilations, dims, feature_group_count)
+        elapsed = None
+        for _ in range(_CONV_AUTOTUNE_REPEATS):
+            start = time.perf_counter()
+            fn(x, filters, strides, dilations, dims, feature_group_count)
+            this_elapsed = time.perf_counter() - start
+            elapsed = this_elapsed if elapsed is None else min(elapsed, this_elapsed)
+        if best_time is None or elapsed < best_time:
+            best_time, res, algorithm = elapsed, candidate_res, candidate
+    _conv_algorithm_cache[key] = algorithm
+    if len(_conv_algorithm_cache) > _CONV_ALGORITHM_CACHE_SIZE:
+        _conv_algorithm_cache.popitem(last=False)
+    return res
 
 
 def _dilate_pad_conv_tranpose(
@@ -117,34 +367,9 @@ def conv1d(
     if data_format == "NCW":
         x = np.transpose(x, (0, 2, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv(x, filters.shape[:1], strides, padding, 1, dilations)
     # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv_gemm(x, filters, strides, dilations, 1)
 
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -194,37 +419,9 @@ def conv2d(
     if data_format == "NCHW":
         x = np.transpose(x, (0, 2, 3, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
+    x = _pad_conv(x, filters.shape[:2], strides, padding, 2, dilations)
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv_gemm(x, filters, strides, dilations, 2)
 
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -271,47 +468,22 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    x = _pad_conv(x, filters.shape[:2], strides, padding, 2, dilations)
+    # B x OH x OW x C, with every input channel forming its own group
+    res = _conv_gemm(
+        x,
+        np.expand_dims(filters, -2),
+        strides,
+        dilations,
+        2,
+        feature_group_count=filters.shape[-1],
+    )
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -330,40 +502,9 @@ def conv3d(
     if data_format == "NCDHW":
         x = np.transpose(x, (0, 2, 3, 4, 1))
 
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    x = _pad_conv(x, filters.shape[:3], strides, padding, 3, dilations)
+    # B x OD x OH x OW x O
+    res = _conv_gemm(x, filters, strides, dilations, 3)
 
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -421,48 +562,9 @@ def conv_general_dilated(
     for j in range(dims):
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
-    x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    x = _pad_conv(x, filters.shape[:dims], strides, padding, dims, dilations)
+    # B x O1 .. Od x O
+    res = _conv_autotuned(x, filters, strides, dilations, dims, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -518,3 +620,47 @@ def conv_general_transpose(
     if data_format == "channel_first":
         return np.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def lstm_update(
+    x: np.ndarray,
+    init_h: np.ndarray,
+    init_c: np.ndarray,
+    kernel: np.ndarray,
+    recurrent_kernel: np.ndarray,
+    /,
+    *,
+    bias: Optional[np.ndarray] = None,
+    recurrent_bias: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    out_channels = recurrent_kernel.shape[0]
+    # input kernel, with both biases folded in once for all timesteps
+    Wi_x = np.matmul(x, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    # all four gates are activated by a single tanh, using
+    # sigmoid(x) = (tanh(x / 2) + 1) / 2 for the input, forget and output gates
+    gate_scale = np.full(4 * out_channels, 0.5, dtype=Wi_x.dtype)
+    gate_scale[2 * out_channels : 3 * out_channels] = 1
+    sigmoid_gates = np.ones(4 * out_channels, dtype=bool)
+    sigmoid_gates[2 * out_channels : 3 * out_channels] = False
+
+    # preallocated outputs, the hidden state of each step is written to its slot
+    hts = np.empty(Wi_x.shape[:-1] + (out_channels,), dtype=Wi_x.dtype)
+    ht = init_h
+    ct = init_c
+    for t in range(x.shape[-2]):
+        gates = np.matmul(ht, recurrent_kernel)
+        gates += Wi_x[..., t, :]
+        gates *= gate_scale
+        np.tanh(gates, out=gates)
+        np.multiply(gates, 0.5, out=gates, where=sigmoid_gates)
+        np.add(gates, 0.5, out=gates, where=sigmoid_gates)
+        it, ft, gt, ot = np.split(gates, 4, axis=-1)
+        ct = ft * ct + it * gt
+        ht = hts[..., t, :]
+        np.tanh(ct, out=ht)
+        ht *= ot
+    return hts, ct
@@ -225,8 +225,15 @@ def eye(
 
 
 def from_dlpack(x, /, *, out: Optional[paddle.Tensor] = None):
-    x_d = paddle.utils.dlpack.to_dlpack(x)
-    return paddle.utils.dlpack.from_dlpack(x_d)
+    if isinstance(x, paddle.Tensor):
+        x = paddle.utils.dlpack.to_dlpack(x)
+    elif hasattr(x, "__dlpack__"):
+        x = x.__dlpack__()
+    return paddle.utils.dlpack.from_dlpack(x)
+
+
+def to_dlpack(x: paddle.Tensor, /):
+    return paddle.utils.dlpack.to_dlpack(x)
 
 
 @with_unsupported_device_and_dtypes(
@@ -231,8 +231,17 @@ def from_dlpack(
 ) -> Union[tf.Tensor, tf.Variable]:
     if isinstance(x, tf.Variable):
         x = x.read_value()
-    dlcapsule = tf.experimental.dlpack.to_dlpack(x)
-    return tf.experimental.dlpack.from_dlpack(dlcapsule)
+    if isinstance(x, tf.Tensor):
+        x = tf.experimental.dlpack.to_dlpack(x)
+    elif hasattr(x, "__dlpack__"):
+        x = x.__dlpack__()
+    return tf.experimental.dlpack.from_dlpack(x)
+
+
+def to_dlpack(x: Union[tf.Tensor, tf.Variable], /):
+    if isinstance(x, tf.Variable):
+        x = x.read_value()
+    return tf.experimental.dlpack.to_dlpack(x)
 
 
 def full(
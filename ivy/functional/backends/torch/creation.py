@@ -264,10 +264,16 @@ eye.support_native_out = True
 
 
 def from_dlpack(x, /, *, out: Optional[torch.Tensor] = None):
-    x = x.detach() if x.requires_grad else x
+    if isinstance(x, torch.Tensor) and x.requires_grad:
+        x = x.detach()
     return torch.utils.dlpack.from_dlpack(x)
 
 
+def to_dlpack(x: torch.Tensor, /):
+    x = x.detach() if x.requires_grad else x
+    return torch.utils.dlpack.to_dlpack(x)
+
+
 def full(
     shape: Union[ivy.NativeShape, Sequence[int]],
     fill_value: Union[int, float, bool],
@@ -479,3 +479,42 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@handle_mixed_function(
+    lambda x, *args, **kwargs: x.device.type != "cpu"
+    or x.dtype not in (torch.float16, torch.bfloat16)
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    batch_shape = x.shape[:-2]
+    out_channels = recurrent_kernel.shape[0]
+    # the native kernel expects a single batch dimension and one layer of states
+    x = x.reshape(-1, *x.shape[-2:])
+    init_h = init_h.reshape(1, -1, out_channels)
+    init_c = init_c.reshape(1, -1, out_channels)
+    # torch stores the gate weights transposed, with the same i, f, g, o order
+    params = [kernel.t(), recurrent_kernel.t()]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        zeros = torch.zeros(4 * out_channels, dtype=x.dtype, device=x.device)
+        params += [
+            bias if bias is not None else zeros,
+            recurrent_bias if recurrent_bias is not None else zeros,
+        ]
+    hts, _, c_n = torch._VF.lstm(
+        x, (init_h, init_c), params, has_biases, 1, 0.0, False, False, True
+    )
+    return (
+        hts.reshape(*batch_shape, *hts.shape[-2:]),
+        c_n[0].reshape(*batch_shape, out_channels),
+    )
@@ -12,8 +12,10 @@ def scaled_dot_product_attention(
     /,
     *,
     mask=None,
+    chunk_size=None,
     out=None,
 ):
+    # memory_efficient_attention already attends to blocks of keys at a time
     if isinstance(mask, torch.Tensor):
         mask = torch.where(mask == 0, -torch.inf, 0)
     return xops.memory_efficient_attention(q, k, v, scale=scale, attn_bias=mask)
@@ -9,12 +9,13 @@ versions = {
 
 import importlib
 
-from . import numpy
-from . import jax
-from . import paddle
-from . import scipy
-from . import tensorflow
-from . import torch
+
+def __getattr__(name):
+    # the frontends are imported when first used, rather than with the package, such
+    # that using one frontend doesn't import all the others
+    if name in versions:
+        return importlib.import_module("." + name, __name__)
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
 
 
 def fn_name_from_version_specific_fn_name(name, version):
@@ -95,11 +96,3 @@ def set_frontend_to_specific_version(frontend):
             orig_name = fn_name_from_version_specific_fn_name(i, f_version)
             if orig_name:
                 frontend.__dict__[orig_name] = frontend.__dict__[i]
-
-
-set_frontend_to_specific_version(torch)
-set_frontend_to_specific_version(tensorflow)
-set_frontend_to_specific_version(jax)
-set_frontend_to_specific_version(numpy)
-set_frontend_to_specific_version(scipy)
-set_frontend_to_specific_version(paddle)
@@ -1,3 +1,4 @@
+import sys
 from . import config
 from . import devicearray
 from .devicearray import DeviceArray
@@ -9,3 +10,8 @@ from . import _src
 from ._src import tree_util
 
 _frontend_array = numpy.array
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
@@ -1,3 +1,4 @@
+import sys
 import ivy
 from ivy.utils.exceptions import handle_exceptions
 from typing import Union, Iterable, Tuple
@@ -703,3 +704,8 @@ conj = ufunc("_conj")
 rint = ufunc("_rint")
 nextafter = ufunc("_nextafter")
 conjugate = ufunc("_conjugate")
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
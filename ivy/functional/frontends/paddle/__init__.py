@@ -2,6 +2,7 @@ import ivy
 from ivy.utils.exceptions import handle_exceptions
 
 # global
+import sys
 from numbers import Number
 from typing import Union, Tuple, Iterable
 
@@ -233,3 +234,8 @@ from .tensor.tensor import Tensor
 
 
 _frontend_array = Tensor
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
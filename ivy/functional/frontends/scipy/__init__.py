@@ -1,4 +1,5 @@
 # global
+import sys
 
 # local
 from . import cluster
@@ -22,3 +23,8 @@ import ivy.functional.frontends.numpy as np
 
 
 array = _frontend_array = np.array
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
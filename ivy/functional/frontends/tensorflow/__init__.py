@@ -2,6 +2,7 @@
 from ivy.utils.exceptions import handle_exceptions
 import ivy
 from numbers import Number
+import sys
 from typing import Union, Tuple, Iterable
 from .dtypes import DType
 
@@ -106,3 +107,8 @@ from . import signal
 from . import sparse
 
 _frontend_array = constant
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
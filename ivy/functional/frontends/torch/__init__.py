@@ -1,3 +1,4 @@
+import sys
 import ivy
 from ivy.utils.exceptions import handle_exceptions
 
@@ -298,3 +299,8 @@ from . import func
 from .func import *
 
 _frontend_array = tensor
+
+
+from .. import set_frontend_to_specific_version
+
+set_frontend_to_specific_version(sys.modules[__name__])
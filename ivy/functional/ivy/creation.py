@@ -1,8 +1,10 @@
 # global
 from __future__ import annotations
 import functools
+from types import ModuleType
 from numbers import Number
 from typing import (
+    Any,
     Union,
     Tuple,
     Optional,
@@ -18,6 +20,11 @@ import numpy as np
 import ivy
 from ivy import to_ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.backend.handler import (
+    _determine_backend_from_args,
+    _import_backend,
+    _to_numpy_without_copy,
+)
 from ivy.func_wrapper import (
     handle_array_function,
     infer_device,
@@ -1568,6 +1575,40 @@ def from_dlpack(
     return current_backend(x).from_dlpack(x, out=out)
 
 
+@handle_nestable
+@inputs_to_native_arrays
+@handle_array_function
+def to_dlpack(x: Union[ivy.Array, ivy.NativeArray], /) -> Any:
+    """Return a DLPack capsule sharing the memory of the input array.
+
+    The capsule can be consumed once, by the ``from_dlpack`` of any framework
+    supporting DLPack, which returns an array sharing the memory of ``x``.
+
+    Parameters
+    ----------
+    x
+        input array.
+
+    Returns
+    -------
+    ret
+        a DLPack capsule wrapping the data of ``x``.
+
+    Both the description and the type hints above assumes an array input for simplicity,
+    but this function is *nestable*, and therefore also accepts :class:`ivy.Container`
+    instances in place of any of the arguments.
+
+    Examples
+    --------
+    >>> import torch
+    >>> x = ivy.array([1., 2., 3.])
+    >>> capsule = ivy.to_dlpack(x)
+    >>> print(torch.utils.dlpack.from_dlpack(capsule))
+    tensor([1., 2., 3.])
+    """
+    return current_backend(x).to_dlpack(x)
+
+
 # Extra #
 # ------#
 
@@ -1575,6 +1616,84 @@ def from_dlpack(
 array = asarray
 
 
+@handle_nestable
+def transfer(
+    x: Union[ivy.Array, ivy.NativeArray],
+    /,
+    *,
+    backend: Union[str, ModuleType],
+) -> Union[ivy.Array, ivy.NativeArray]:
+    """Move an array to another backend, sharing its memory wherever possible.
+
+    Native arrays are exchanged through DLPack, and through the array interface when
+    moving to numpy, rather than through ``to_numpy`` and ``asarray``, which copy.
+    The result is a view of ``x`` in the following cases, and a copy otherwise:
+
+    - to the backend of ``x``, which returns the data of ``x`` unchanged.
+    - to numpy, for arrays in host memory whose dtype numpy supports, except for jax
+      arrays, which are immutable and can only be viewed as read-only numpy arrays.
+    - to jax, paddle, tensorflow or torch, from arrays on a device supported by the
+      target, except for read-only numpy arrays, which DLPack can't export.
+
+    Parameters
+    ----------
+    x
+        input array.
+    backend
+        the backend to move the array to, either as the name of the backend, or as an
+        ivy instance, such as a local one returned by :func:`ivy.with_backend`, whose
+        backend is used.
+
+    Returns
+    -------
+    ret
+        a native array of the backend if given by name, otherwise an array of the ivy
+        instance.
+
+    Both the description and the type hints above assumes an array input for simplicity,
+    but this function is *nestable*, and therefore also accepts :class:`ivy.Container`
+    instances in place of any of the arguments.
+
+    Examples
+    --------
+    >>> x = ivy.array([1., 2., 3.])
+    >>> y = ivy.transfer(x, backend="torch")
+    >>> print(type(y))
+    <class 'torch.Tensor'>
+
+    >>> torch_ivy = ivy.with_backend("torch")
+    >>> y = ivy.transfer(x, backend=torch_ivy)
+    >>> print(torch_ivy.mean(y))
+    ivy.array(2.)
+    """
+    target = (
+        _import_backend(backend)
+        if isinstance(backend, str)
+        else backend.current_backend()
+    )
+    data = x.data if isinstance(x, ivy.Array) else x
+    source = _determine_backend_from_args(data)
+    target_str = target.current_backend_str()
+    if source is not None and source.current_backend_str() == target_str:
+        ret = data
+    elif target_str == "numpy":
+        ret = _to_numpy_without_copy(data)
+    else:
+        try:
+            ret = target.from_dlpack(source.to_dlpack(data))
+        except (AttributeError, BufferError, RuntimeError, TypeError, ValueError):
+            # not exportable through DLPack, such as read-only numpy arrays, which are
+            # copied to host memory DLPack can export
+            data = np.require(_to_numpy_without_copy(data), requirements="W")
+            try:
+                ret = target.from_dlpack(data)
+            except (BufferError, RuntimeError, TypeError, ValueError):
+                # dtypes the target can't import through DLPack, such as bool in
+                # older versions of torch, are copied
+                ret = target.asarray(data)
+    return ret if isinstance(backend, str) else backend.Array(ret)
+
+
 @handle_nestable
 @handle_array_like_without_promotion
 @handle_out_argument
@@ -1,7 +1,9 @@
 # global
 import ast
 import inspect
+import json
 import math
+import os
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable, Iterable, Any
 import numpy as np
@@ -10,6 +12,7 @@ import importlib
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.context import ContextStack
 from ivy.func_wrapper import (
     handle_array_function,
     handle_out_argument,
@@ -212,6 +215,83 @@ def _get_dtypes(fn, complement=True):
     return tuple(supported)
 
 
+# Support Cache #
+# --------------#
+
+# results of the function_(un)supported_* queries, keyed by the query, the
+# function, whether to recurse, and the backend and backend version they were
+# computed with. Cleared whenever the global backend is set or unset.
+_support_cache = dict()
+
+# precomputed table of the queries, dumped with scripts/generate_support_table.py
+_SUPPORT_TABLE_PATH = os.path.join(os.path.dirname(__file__), "support_table.json")
+_support_table = None
+
+
+def _clear_support_cache():
+    _support_cache.clear()
+
+
+def _fn_support_key(fn):
+    return "{}.{}".format(
+        getattr(fn, "__module__", None),
+        getattr(fn, "__qualname__", getattr(fn, "__name__", None)),
+    )
+
+
+def _backend_and_version():
+    version = ivy.backend_version
+    return ivy.backend, version["version"] if isinstance(version, dict) else version
+
+
+def _load_support_table():
+    global _support_table
+    if _support_table is None:
+        _support_table = dict()
+        if os.path.exists(_SUPPORT_TABLE_PATH):
+            with open(_SUPPORT_TABLE_PATH, "r") as f:
+                table = json.load(f)
+            if table.get("ivy_version") == ivy.__version__:
+                _support_table = table["backends"]
+    return _support_table
+
+
+def _lookup_support_table(query, fn, backend, version):
+    ret = (
+        _load_support_table()
+        .get(backend, {})
+        .get(version, {})
+        .get(query, {})
+        .get(_fn_support_key(fn))
+    )
+    if isinstance(ret, dict):
+        return {k: tuple(v) for k, v in ret.items()}
+    return tuple(ret) if ret is not None else None
+
+
+def _cached_support(query, fn, recurse, compute):
+    """
+    Return the result of the support `query` for `fn`, computing it with `compute`
+    only if it's neither cached for the current backend nor found in the
+    precomputed support table.
+    """
+    backend, version = _backend_and_version()
+    key = (query, fn, recurse, backend, version)
+    try:
+        ret = _support_cache.get(key)
+    except TypeError:
+        # unhashable functions can't be cached
+        return compute()
+    if ret is None:
+        if recurse:
+            ret = _lookup_support_table(query, fn, backend, version)
+        if ret is None:
+            ret = compute()
+        _support_cache[key] = ret
+    # device and dtype combinations are dicts, don't hand out the cached one
+    return dict(ret) if isinstance(ret, dict) else ret
+
+
 # Array API Standard #
 # -------------------#
 
@@ -774,11 +854,11 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
-default_complex_dtype_stack = list()
+default_dtype_stack = ContextStack("default_dtype_stack")
+default_float_dtype_stack = ContextStack("default_float_dtype_stack")
+default_int_dtype_stack = ContextStack("default_int_dtype_stack")
+default_uint_dtype_stack = ContextStack("default_uint_dtype_stack")
+default_complex_dtype_stack = ContextStack("default_complex_dtype_stack")
 
 
 class DefaultDtype:
@@ -1593,6 +1673,15 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
             "in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_supported_dtypes",
+        fn,
+        recurse,
+        lambda: _function_supported_dtypes(fn, recurse),
+    )
+
+
+def _function_supported_dtypes(fn: Callable, recurse: bool) -> Tuple:
     supported_dtypes = set(_get_dtypes(fn, complement=False))
     if recurse:
         supported_dtypes = _nested_get(
@@ -1633,6 +1722,15 @@ def function_unsupported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
             "in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_unsupported_dtypes",
+        fn,
+        recurse,
+        lambda: _function_unsupported_dtypes(fn, recurse),
+    )
+
+
+def _function_unsupported_dtypes(fn: Callable, recurse: bool) -> Tuple:
     unsupported_dtypes = set(_get_dtypes(fn, complement=True))
     if recurse:
         unsupported_dtypes = _nested_get(
@@ -5,27 +5,8 @@ import os
 import gc
 import abc
 import math
-import psutil
-import warnings
 import types
 from typing import Type, Optional, Tuple
-
-# noinspection PyUnresolvedReferences
-try:
-    import pynvml
-
-    try:
-        pynvml.nvmlInit()
-    except pynvml.NVMLError:
-        pass
-except ImportError:
-    warnings.warn(
-        "pynvml installation was not found in the environment, functionalities"
-        " of the Ivy's device module will be limited. Please install pynvml if"
-        " you wish to use GPUs with Ivy."
-    )
-    # nvidia-ml-py (pynvml) is not installed in CPU Dockerfile.
-
 from typing import Union, Callable, Iterable, Any
 
 # local
@@ -37,8 +18,23 @@ from ivy.func_wrapper import (
     handle_array_like_without_promotion,
 )
 from ivy.utils.exceptions import handle_exceptions
+from ivy.functional.ivy.data_type import _cached_support
+from ivy.utils.context import ContextStack
+
+
+def _init_nvml(pynvml):
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        pass
 
-default_device_stack = list()
+
+# imported when the memory or utilization of a device is first queried
+psutil = ivy.utils.dynamic_import.LazyModule("psutil")
+# nvidia-ml-py (pynvml) is not installed in CPU Dockerfile.
+pynvml = ivy.utils.dynamic_import.LazyModule("pynvml", on_import=_init_nvml)
+
+default_device_stack = ContextStack("default_device_stack")
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
@@ -1174,6 +1170,15 @@ def function_supported_devices(fn: Callable, recurse: bool = True) -> Tuple:
             "exist in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_supported_devices",
+        fn,
+        recurse,
+        lambda: _function_supported_devices(fn, recurse),
+    )
+
+
+def _function_supported_devices(fn: Callable, recurse: bool) -> Tuple:
     supported_devices = set(_get_devices(fn, complement=False))
 
     if recurse:
@@ -1215,6 +1220,15 @@ def function_unsupported_devices(fn: Callable, recurse: bool = True) -> Tuple:
             "exist in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_unsupported_devices",
+        fn,
+        recurse,
+        lambda: _function_unsupported_devices(fn, recurse),
+    )
+
+
+def _function_unsupported_devices(fn: Callable, recurse: bool) -> Tuple:
     unsupported_devices = set(_get_devices(fn, complement=True))
 
     if recurse:
@@ -18,12 +18,12 @@ from typing import (
     Sequence,
     Literal,
 )
-import einops
 import numpy as np
 
 # local
 import ivy
 from ivy.utils.backend import current_backend, backend_stack
+from ivy.utils.context import ContextStack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
 from ivy.func_wrapper import (
@@ -39,22 +39,25 @@ from ivy.func_wrapper import (
     handle_view_indexing,
 )
 from ivy.functional.ivy.device import dev
+from ivy.functional.ivy.data_type import _cached_support
+
+einops = ivy.utils.dynamic_import.LazyModule("einops")
 
 FN_CACHE = dict()
 INF = float("inf")
 TMP_DIR = "/tmp"
 
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
+queue_timeout_stack = ContextStack("queue_timeout_stack")
+array_mode_stack = ContextStack("array_mode_stack")
+shape_array_mode_stack = ContextStack("shape_array_mode_stack")
+nestable_mode_stack = ContextStack("nestable_mode_stack")
+exception_trace_mode_stack = ContextStack("exception_trace_mode_stack")
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
 trace_mode_dict["none"] = ""
-show_func_wrapper_trace_mode_stack = list()
+show_func_wrapper_trace_mode_stack = ContextStack("show_func_wrapper_trace_mode_stack")
 
 
 # Extra #
@@ -3649,6 +3652,15 @@ def function_supported_devices_and_dtypes(fn: Callable, recurse: bool = True) ->
             "attributes cannot both exist in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_supported_devices_and_dtypes",
+        fn,
+        recurse,
+        lambda: _function_supported_devices_and_dtypes(fn, recurse),
+    )
+
+
+def _function_supported_devices_and_dtypes(fn: Callable, recurse: bool) -> Dict:
     supported_devices_dtype = _get_devices_and_dtypes(fn, complement=False)
 
     if recurse:
@@ -3690,6 +3702,15 @@ def function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool = True)
             "attributes cannot both exist in a particular backend"
         ),
     )
+    return _cached_support(
+        "function_unsupported_devices_and_dtypes",
+        fn,
+        recurse,
+        lambda: _function_unsupported_devices_and_dtypes(fn, recurse),
+    )
+
+
+def _function_unsupported_devices_and_dtypes(fn: Callable, recurse: bool) -> Dict:
     unsupported_devices_dtype = _get_devices_and_dtypes(fn, complement=True)
 
     if recurse:
@@ -6,6 +6,7 @@ from typing import Optional, Tuple, Union, Callable, Sequence
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.context import ContextStack
 from ivy.func_wrapper import (
     handle_array_function,
     inputs_to_ivy_arrays,
@@ -348,6 +349,71 @@ def dropout(
 
 # Attention #
 
+attention_impl_stack = ContextStack("attention_impl_stack")
+_attention_impls = ("default", "chunked")
+_default_attention_chunk_size = 1024
+
+
+@handle_exceptions
+def set_attention_impl(impl: str) -> None:
+    """
+    Set the implementation used by scaled dot product attention.
+
+    Parameters
+    ----------
+    impl
+        str attention implementation, one of ``default``, which computes the full
+        query-key similarity matrix, or ``chunked``, which iterates over blocks of
+        keys with an online softmax.
+
+    Examples
+    --------
+    >>> ivy.set_attention_impl("chunked")
+    >>> ivy.get_attention_impl()
+    'chunked'
+    """
+    global attention_impl_stack
+    ivy.utils.assertions.check_elem_in_list(
+        impl,
+        _attention_impls,
+        False,
+        "attention impl must be one of {}".format(list(_attention_impls)),
+    )
+    attention_impl_stack.append(impl)
+
+
+@handle_exceptions
+def unset_attention_impl() -> None:
+    """
+    Reset the attention implementation to the previously set implementation.
+
+    Examples
+    --------
+    >>> ivy.set_attention_impl("chunked")
+    >>> ivy.unset_attention_impl()
+    >>> ivy.get_attention_impl()
+    'default'
+    """
+    global attention_impl_stack
+    if attention_impl_stack:
+        attention_impl_stack.pop(-1)
+
+
+@handle_exceptions
+def get_attention_impl() -> str:
+    """
+    Get the implementation currently used by scaled dot product attention.
+
+    Examples
+    --------
+    >>> ivy.get_attention_impl()
+    'default'
+    """
+    global attention_impl_stack
+    if not attention_impl_stack:
+        return "default"
+    return attention_impl_stack[-1]
+
 
 @handle_exceptions
 @handle_array_like_without_promotion
@@ -360,6 +426,7 @@ def scaled_dot_product_attention(
     /,
     *,
     mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    chunk_size: Optional[int] = None,
     out: Optional[ivy.Array] = None,
 ) -> ivy.Array:
     """
@@ -385,6 +452,13 @@ def scaled_dot_product_attention(
     mask
         The mask input array. The mask to apply to the query-key values. Default is
         None. The shape of mask input should be in *[batch_shape,num_queries,num_keys]*.
+    chunk_size
+        The number of keys to attend to at a time. If given, the softmax is computed
+        online over blocks of keys, so that only *[batch_shape,num_queries,chunk_size]*
+        similarities are held in memory at once. Default is ``None``, in which case
+        the keys are chunked by 1024 if ``ivy.get_attention_impl()`` is ``chunked``,
+        and are all attended to at once otherwise. When chunked, queries attending to
+        no keys result in zeros.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -536,6 +610,13 @@ def scaled_dot_product_attention(
                     [4.3, 5.3]]])
     }
     """
+    if chunk_size is None and get_attention_impl() == "chunked":
+        chunk_size = _default_attention_chunk_size
+    if chunk_size is not None:
+        return _chunked_scaled_dot_product_attention(
+            q, k, v, scale, mask, chunk_size, out
+        )
+
     # BS x Q x K
     sim = ivy.einsum("... q f, ... k f -> ... q k", q, k) * scale
 
@@ -557,6 +638,53 @@ def scaled_dot_product_attention(
 scaled_dot_product_attention.mixed_function = True
 
 
+def _chunked_scaled_dot_product_attention(q, k, v, scale, mask, chunk_size, out):
+    num_keys = k.shape[-2]
+    ivy.utils.assertions.check_greater(chunk_size, 0, message="chunk_size must be > 0")
+    if num_keys == 0:
+        # the weighted sum of no values
+        return ivy.zeros(
+            tuple(q.shape[:-1]) + (v.shape[-1],),
+            dtype=ivy.dtype(q),
+            device=ivy.dev(q),
+            out=out,
+        )
+    # masked similarities are set to the same value as in the unchunked version
+    if ivy.exists(mask):
+        mask = ivy.logical_not(mask)
+        masked_value = ivy.array(
+            -ivy.finfo(ivy.dtype(q)).max, dtype=ivy.dtype(q), device=ivy.dev(q)
+        )
+    row_max, row_sum, acc = None, None, None
+    for start in range(0, num_keys, chunk_size):
+        stop = min(start + chunk_size, num_keys)
+
+        # BS x Q x C
+        sim = ivy.matmul(q, k[..., start:stop, :], transpose_b=True) * scale
+        if ivy.exists(mask):
+            chunk_mask = mask[..., start:stop] if mask.shape[-1] != 1 else mask
+            sim = ivy.where(chunk_mask, masked_value, sim)
+
+        # running max and softmax normaliser of each query, with the weighted sum of
+        # the values seen so far rescaled whenever the max increases
+        chunk_max = ivy.max(sim, axis=-1, keepdims=True)
+        if row_max is None:
+            row_max = chunk_max
+            weights = ivy.exp(sim - row_max)
+            row_sum = ivy.sum(weights, axis=-1, keepdims=True)
+            acc = ivy.matmul(weights, v[..., start:stop, :])
+            continue
+        new_max = ivy.maximum(row_max, chunk_max)
+        correction = ivy.exp(row_max - new_max)
+        weights = ivy.exp(sim - new_max)
+        row_sum = row_sum * correction + ivy.sum(weights, axis=-1, keepdims=True)
+        acc = acc * correction + ivy.matmul(weights, v[..., start:stop, :])
+        row_max = new_max
+
+    # BS x Q x F
+    return ivy.divide(acc, row_sum, out=out)
+
+
 @handle_exceptions
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
@@ -575,6 +703,7 @@ def multi_head_attention(
     to_q_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_kv_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     to_out_v: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    chunk_size: Optional[int] = None,
     out: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Union[ivy.Array, ivy.NativeArray]:
     """
@@ -608,6 +737,9 @@ def multi_head_attention(
         The variables for function to_kv_fn. Default is ``None``.
     to_out_v
         The variables for function to_out_fn. Default is ``None``.
+    chunk_size
+        The number of keys to attend to at a time in the scaled dot-product
+        attention. Default is ``None``. See ``ivy.scaled_dot_product_attention``.
     out
         optional output array, for writing the result to. It must have a shape that the
         inputs broadcast to.
@@ -775,7 +907,9 @@ def multi_head_attention(
         mask = ivy.einops_repeat(mask, "... q k -> ... h q k", h=num_heads)
 
     # BS x H x Q x F
-    sdpa = ivy.scaled_dot_product_attention(q, k, v, scale, mask=mask)
+    sdpa = ivy.scaled_dot_product_attention(
+        q, k, v, scale, mask=mask, chunk_size=chunk_size
+    )
 
     # BS x Q x (HxF)
     sdpa = ivy.einops_rearrange(sdpa, "... h q f -> ... q (h f)")
@@ -1932,16 +2066,17 @@ def lstm_update(
     input_channels = x_shape[-1]
     x_flat = ivy.reshape(x, (-1, input_channels))
 
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
+    # input kernel, with both biases folded in once for all timesteps
+    Wi_x = ivy.matmul(x_flat, kernel)
+    if bias is not None:
+        Wi_x = Wi_x + bias
+    if recurrent_bias is not None:
+        Wi_x = Wi_x + recurrent_bias
+    Wi_x = ivy.reshape(Wi_x, batch_shape + [timesteps, -1])
 
     # recurrent kernel
     Wh = recurrent_kernel
+    gate_scale = _lstm_gate_scale(Wh.shape[0], Wi_x.dtype)
 
     # lstm states
     ht = init_h
@@ -1951,32 +2086,40 @@ def lstm_update(
     hts_list = list()
 
     # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
-
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
+    for t in range(timesteps):
+        gates = ivy.tanh((Wi_x[..., t, :] + ivy.matmul(ht, Wh)) * gate_scale)
+        it, ft, gt, ot = _lstm_gates(gates)
+        ct = ft * ct + it * gt
         ht = ot * ivy.tanh(ct)
+        hts_list.append(ht)
+
+    return ivy.stack(hts_list, axis=-2), ct
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
+
+
+def _lstm_gate_scale(out_channels, dtype):
+    # all four gates are activated by a single tanh, using
+    # sigmoid(x) = (tanh(x / 2) + 1) / 2 for the input, forget and output gates
+    return ivy.concat(
+        [
+            ivy.full((2 * out_channels,), 0.5, dtype=dtype),
+            ivy.ones((out_channels,), dtype=dtype),
+            ivy.full((out_channels,), 0.5, dtype=dtype),
+        ]
+    )
+
+
+def _lstm_gates(gates):
+    out_channels = gates.shape[-1] // 4
+    sig = gates * 0.5 + 0.5
+    return (
+        sig[..., :out_channels],
+        sig[..., out_channels : 2 * out_channels],
+        gates[..., 2 * out_channels : 3 * out_channels],
+        sig[..., 3 * out_channels :],
+    )
 
 
 # Helpers #
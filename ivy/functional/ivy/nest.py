@@ -4,6 +4,7 @@
 from builtins import map as _map
 from typing import Callable, Any, Union, List, Tuple, Optional, Dict, Iterable, Sequence
 import copy
+import functools
 from collections import UserDict
 
 # local
@@ -1058,124 +1059,260 @@ def nested_map(
     """
     to_ignore = ivy.default(to_ignore, ())
     extra_nest_types = ivy.default(extra_nest_types, ())
+    tuple_check_fn, list_check_fn, dict_check_fn = _nest_check_fns(
+        include_derived, _tuple_check_fn, _list_check_fn, _dict_check_fn
+    )
+
+    def _open(node, depth):
+        # returns (True, mapped node) for nodes which can be resolved straight away,
+        # or (False, frame) for nests whose children must be mapped first, where a
+        # frame is [node, kind, children, keys, mapped children, depth]
+        if max_depth is not None and depth > max_depth:
+            return True, node
+        if not isinstance(node, to_ignore):
+            if tuple_check_fn(node):
+                return False, [node, "tuple", list(node), None, [], depth]
+            if list_check_fn(node) or isinstance(node, extra_nest_types):
+                if isinstance(node, (ivy.Array, ivy.NativeArray)):
+                    ret = fn(node)
+                    return True, ivy.inplace_update(node, ret) if shallow else ret
+                return False, [node, "list", list(node), None, [], depth]
+            if dict_check_fn(node) or isinstance(node, UserDict):
+                return False, [node, "dict", list(node.values()), list(node), [], depth]
+        if isinstance(node, slice):
+            # TODO: add tests for this
+            return True, slice(*nested_map([node.start, node.stop, node.step], fn))
+        return True, fn(node)
+
+    def _close(frame):
+        node, kind, _, keys, ret_list, _ = frame
+        class_instance = type(node)
+        if kind == "tuple":
+            if to_mutable:
+                return ret_list
+            elif hasattr(node, "_fields"):
+                # noinspection PyProtectedMember
+                return class_instance(**dict(zip(node._fields, ret_list)))
+            return class_instance(ret_list)
+        if kind == "list":
+            if shallow:
+                node[:] = ret_list[:]
+                return node
+            return class_instance(ret_list)
+        ret = dict(zip(keys, ret_list))
+        if shallow:
+            node.update(ret)
+            return node
+        return class_instance(ret)
+
+    # the nest is traversed depth first with an explicit stack of frames, each nest
+    # is rebuilt once all of its children have been mapped
+    resolved, ret = _open(x, _depth)
+    if resolved:
+        return ret
+    stack = [ret]
+    while True:
+        frame = stack[-1]
+        children, ret_list = frame[2], frame[4]
+        while len(ret_list) < len(children):
+            resolved, ret = _open(children[len(ret_list)], frame[5] + 1)
+            if not resolved:
+                stack.append(ret)
+                break
+            ret_list.append(ret)
+        else:
+            stack.pop()
+            ret = _close(frame)
+            if not stack:
+                return ret
+            stack[-1][4].append(ret)
+
+
+def _nest_check_fns(
+    include_derived, tuple_check_fn=None, list_check_fn=None, dict_check_fn=None
+):
+    # the type checks are built once per call rather than once per nested level
     if include_derived is True:
         include_derived = {tuple: True, list: True, dict: True}
     elif not include_derived:
         include_derived = {}
-    for t in (tuple, list, dict):
-        if t not in include_derived:
-            include_derived[t] = False
-    if ivy.exists(max_depth) and _depth > max_depth:
-        return x
-    class_instance = type(x)
-    tuple_check_fn = ivy.default(
-        _tuple_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived[tuple]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    list_check_fn = ivy.default(
-        _list_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived[list]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
-    )
-    dict_check_fn = ivy.default(
-        _dict_check_fn,
-        (
-            (lambda x_, t_: isinstance(x_, t_))
-            if include_derived[dict]
-            else (lambda x_, t_: type(x_) is t_)
-        ),
+
+    def _check_fn(t, check_fn):
+        if check_fn is not None:
+            return lambda x_: check_fn(x_, t)
+        if include_derived.get(t, False):
+            return lambda x_: isinstance(x_, t)
+        return lambda x_: type(x_) is t
+
+    return (
+        _check_fn(tuple, tuple_check_fn),
+        _check_fn(list, list_check_fn),
+        _check_fn(dict, dict_check_fn),
     )
 
-    if tuple_check_fn(x, tuple) and not isinstance(x, to_ignore):
-        ret_list = [
-            nested_map(
-                i,
-                fn,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for i in x
-        ]
-        if to_mutable:
-            return ret_list
-        elif hasattr(x, "_fields"):
-            # noinspection PyProtectedMember
-            return class_instance(**dict(zip(x._fields, ret_list)))
+
+@handle_exceptions
+def nested_flatten(
+    x: Union[ivy.Array, ivy.NativeArray, Iterable],
+    /,
+    *,
+    include_derived: Optional[Union[Dict[type, bool], bool]] = None,
+    to_ignore: Optional[Union[type, Tuple[type]]] = None,
+    max_depth: Optional[int] = None,
+    extra_nest_types: Optional[Union[type, Tuple[type]]] = None,
+) -> Tuple[List, Tuple]:
+    """
+    Flatten a nest into a list of its leaves and a hashable description of its
+    structure, which can be passed to :func:`ivy.nested_unflatten` to rebuild the nest.
+    The nest is traversed with the same rules as :func:`ivy.nested_map`.
+
+    Parameters
+    ----------
+    x
+        The nest to flatten.
+    include_derived
+        Whether to also recursive for classes derived from tuple, list and dict.
+        Default is ``False``.
+    to_ignore
+        Types to ignore when deciding whether to go deeper into the nest or not
+    max_depth
+        The maximum nested depth to reach, any nest deeper than this is returned as a
+        single leaf. Default is ``None``.
+    extra_nest_types
+        Types to recursively check when deciding whether to go deeper into the
+        nest or not
+
+    Returns
+    -------
+    ret
+        The leaves of x in depth first order, and the structure of x.
+
+    Examples
+    --------
+    >>> x = {"a": [ivy.array([1.]), 2], "b": (3, 4)}
+    >>> leaves, structure = ivy.nested_flatten(x)
+    >>> print(leaves)
+    [ivy.array([1.]), 2, 3, 4]
+    >>> print(ivy.nested_unflatten(structure, [0, 1, 2, 3]))
+    {'a': [0, 1], 'b': (2, 3)}
+    """
+    to_ignore = ivy.default(to_ignore, ())
+    extra_nest_types = ivy.default(extra_nest_types, ())
+    tuple_check_fn, list_check_fn, dict_check_fn = _nest_check_fns(include_derived)
+    leaves = list()
+
+    def _open(node, depth):
+        # returns None for leaves, or a frame of
+        # [kind, class, keys, children, child structures, depth] for nests
+        if (max_depth is not None and depth > max_depth) or isinstance(
+            node, (to_ignore, ivy.Array, ivy.NativeArray)
+        ):
+            return None
+        if tuple_check_fn(node):
+            kind = "namedtuple" if hasattr(node, "_fields") else "tuple"
+            return [kind, type(node), None, list(node), [], depth]
+        if list_check_fn(node) or isinstance(node, extra_nest_types):
+            return ["list", type(node), None, list(node), [], depth]
+        if dict_check_fn(node) or isinstance(node, UserDict):
+            return ["dict", type(node), tuple(node), list(node.values()), [], depth]
+        return None
+
+    frame = _open(x, 0)
+    if frame is None:
+        return [x], None
+    stack = [frame]
+    while True:
+        frame = stack[-1]
+        children, structures = frame[3], frame[4]
+        while len(structures) < len(children):
+            child = children[len(structures)]
+            child_frame = _open(child, frame[5] + 1)
+            if child_frame is not None:
+                stack.append(child_frame)
+                break
+            leaves.append(child)
+            structures.append(None)
         else:
-            return class_instance(ret_list)
-    elif (list_check_fn(x, list) or isinstance(x, extra_nest_types)) and not isinstance(
-        x, to_ignore
-    ):
-        if isinstance(x, (ivy.Array, ivy.NativeArray)):
-            ret = fn(x)
-            if shallow:
-                return ivy.inplace_update(x, ret)
-            return ret
-        ret_list = [
-            nested_map(
-                i,
-                fn,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for i in x
-        ]
-        if shallow:
-            x[:] = ret_list[:]
-            return x
-        return class_instance(ret_list)
-    elif (dict_check_fn(x, dict) or isinstance(x, UserDict)) and not isinstance(
-        x, to_ignore
-    ):
-        class_instance = type(x)
-        ret = {
-            k: nested_map(
-                v,
-                fn,
-                include_derived,
-                to_ignore,
-                to_mutable,
-                max_depth,
-                _depth + 1,
-                tuple_check_fn,
-                list_check_fn,
-                dict_check_fn,
-                extra_nest_types,
-                shallow,
-            )
-            for k, v in x.items()
-        }
-        if shallow:
-            x.update(ret)
-            return x
-        return class_instance(ret)
-    elif isinstance(x, slice):
-        # TODO: add tests for this
-        return slice(*nested_map([x.start, x.stop, x.step], fn))
-    return fn(x)
+            stack.pop()
+            structure = (frame[0], frame[1], frame[2], tuple(structures))
+            if not stack:
+                return leaves, structure
+            stack[-1][4].append(structure)
+
+
+@functools.lru_cache(maxsize=1024)
+def _nest_structure_plan(structure):
+    # compiles a structure returned by nested_flatten into a post-order list of
+    # rebuild steps, None for a leaf or (number of children, build function) for a
+    # nest, so that repeated unflattening of the same structure is a flat loop
+    plan = list()
+    stack = [(structure, False)]
+    while stack:
+        node, visited = stack.pop()
+        if node is None:
+            plan.append(None)
+            continue
+        kind, class_instance, keys, children = node
+        if visited:
+            if kind == "namedtuple":
+                build = functools.partial(lambda c, cls: cls(*c), cls=class_instance)
+            elif kind == "dict":
+                build = functools.partial(
+                    lambda c, cls, k: cls(dict(zip(k, c))), cls=class_instance, k=keys
+                )
+            else:
+                build = class_instance
+            plan.append((len(children), build))
+            continue
+        stack.append((node, True))
+        stack.extend((child, False) for child in reversed(children))
+    return tuple(plan), plan.count(None)
+
+
+@handle_exceptions
+def nested_unflatten(structure: Optional[Tuple], leaves: Sequence, /) -> Any:
+    """
+    Rebuild a nest from its structure and leaves, as returned by
+    :func:`ivy.nested_flatten`. The rebuild steps are cached per structure, so
+    repeatedly unflattening nests of the same structure is a flat loop over the leaves.
+
+    Parameters
+    ----------
+    structure
+        The structure of the nest, as returned by :func:`ivy.nested_flatten`.
+    leaves
+        The leaves to place into the nest, in depth first order.
+
+    Returns
+    -------
+    ret
+        The nest with the given structure and leaves.
+
+    Examples
+    --------
+    >>> leaves, structure = ivy.nested_flatten([1, (2, 3)])
+    >>> print(ivy.nested_unflatten(structure, [x * 2 for x in leaves]))
+    [2, (4, 6)]
+    """
+    plan, num_leaves = (None,), 1
+    if structure is not None:
+        plan, num_leaves = _nest_structure_plan(structure)
+    if len(leaves) != num_leaves:
+        raise ivy.utils.exceptions.IvyException(
+            "expected {} leaves, got {}".format(num_leaves, len(leaves))
+        )
+    leaves = iter(leaves)
+    values = list()
+    for step in plan:
+        if step is None:
+            values.append(next(leaves))
+            continue
+        num_children, build = step
+        split = len(values) - num_children
+        children = values[split:]
+        del values[split:]
+        values.append(build(children))
+    return values[0]
 
 
 @handle_exceptions
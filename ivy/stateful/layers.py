@@ -199,6 +199,7 @@ class MultiHeadAttention(Module):
         with_to_q_fn=True,
         with_to_kv_fn=True,
         with_to_out_fn=True,
+        chunk_size=None,
         device=None,
         v=None,
         build_mode="on_init",
@@ -234,6 +235,9 @@ class MultiHeadAttention(Module):
             Whether to include fully connected mapping from output scaled dot-product
             attention to final output.
             Default is ``True``.
+        chunk_size
+            The number of keys to attend to at a time, with an online softmax.
+            Default is ``None``, in which case ``ivy.get_attention_impl()`` decides.
         device
             device on which to create the layer's variables 'cuda:0', 'cuda:1', 'cpu'
             etc. Default is cpu.
@@ -259,6 +263,7 @@ class MultiHeadAttention(Module):
         self._with_to_q_fn = with_to_q_fn
         self._with_to_kv_fn = with_to_kv_fn
         self._with_to_out_fn = with_to_out_fn
+        self._chunk_size = chunk_size
         ivy.Module.__init__(
             self,
             device=device,
@@ -347,6 +352,7 @@ class MultiHeadAttention(Module):
             to_q_v=self.v.to_q if self._with_to_q_fn else None,
             to_kv_v=self.v.to_kv if self._with_to_kv_fn else None,
             to_out_v=self.v.to_out if self._with_to_out_fn else None,
+            chunk_size=self._chunk_size,
         )
 
 
@@ -512,21 +512,45 @@ class Module(ModuleConverters, ModuleHelpers):
         self._unset_submod_flags()
         return ret
 
-    def save_weights(self, weights_path, /):
+    def save_weights(
+        self, weights_path, /, *, format="hdf5", compression=None, shard_size=2**30
+    ):
         """
         Save the weights on the Module.
 
+        Uncompressed hdf5 weights are stored contiguously, such that they can be loaded
+        with ``ivy.Container.cont_from_disk_as_hdf5(weights_path, mmap=True)``
+        without reading the whole file. Checkpoint weights are loaded with
+        ``ivy.Container.cont_from_disk_as_checkpoint(weights_path)``, which can also
+        load only the weights below some key chains.
+
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The hdf5 file, or the checkpoint directory, for saving the weights.
+        format
+            The format to save the weights in, either ``"hdf5"`` or ``"checkpoint"``,
+            for the sharded checkpoint of ``Container.cont_to_disk_as_checkpoint``.
+            Default is ``"hdf5"``.
+        compression
+            The compression filter to save hdf5 weights with, such as ``"gzip"``.
+            Default is ``None``, for no compression.
+        shard_size
+            Maximum size in bytes of each shard of checkpoint weights.
+            Default is 1 GiB.
 
         Returns
         -------
         None
         """
+        if format == "checkpoint":
+            self.v.cont_to_disk_as_checkpoint(weights_path, shard_size=shard_size)
+            return
+        ivy.utils.assertions.check_elem_in_list(format, ["hdf5", "checkpoint"])
         os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        self.v.cont_to_disk_as_hdf5(
+            weights_path, mode="w", resizable=False, compression=compression
+        )
 
     def build(
         self,
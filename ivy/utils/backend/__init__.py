@@ -1,2 +1,3 @@
 from . import handler
 from .handler import *
+from .pool import BackendPool
@@ -1,12 +1,15 @@
 import ast
+import marshal
 import os
 import sys
 import traceback
 from ast import parse
 from string import Template
-from importlib.util import spec_from_file_location
+from importlib.util import MAGIC_NUMBER, cache_from_source, spec_from_file_location
 from importlib.abc import Loader, MetaPathFinder
 
+from ivy._version import __version__
+
 
 # AST helpers ##################
 
@@ -21,6 +24,9 @@ _local_import_template = Template(
 )
 _unmodified_ivy_path = sys.modules["ivy"].__path__[0].rpartition("/")[0]
 _compiled_modules_cache = {}
+# bumped whenever the transform changes the code it generates, on top of the stamp
+# of this file below, which covers changes in development checkouts
+_TRANSFORM_VERSION = 1
 
 
 def _retrive_local_modules():
@@ -257,24 +263,92 @@ class IvyPathFinder(MetaPathFinder):
         return None
 
 
+def _cached_path(filename):
+    # next to the standard bytecode of the module, in the __pycache__ directory
+    return cache_from_source(filename, optimization="ivylocal")
+
+
+def _transform_stamp():
+    # the mtime and size of this file, which holds the transformer and the templates
+    stat = os.stat(__file__)
+    return stat.st_mtime_ns, stat.st_size
+
+
+_transform_key = (_TRANSFORM_VERSION,) + _transform_stamp()
+
+
+def _cache_key(filename):
+    stat = os.stat(filename)
+    return __version__, _transform_key, stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached(filename, key):
+    try:
+        with open(_cached_path(filename), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if data[: len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+        return None
+    try:
+        cached_key, compiled_obj = marshal.loads(data[len(MAGIC_NUMBER) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return compiled_obj if cached_key == key else None
+
+
+def _write_cached(filename, key, compiled_obj):
+    if sys.dont_write_bytecode:
+        return
+    path = _cached_path(filename)
+    tmp_path = "{}.{}".format(path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC_NUMBER + marshal.dumps((key, compiled_obj)))
+        os.replace(tmp_path, path)
+    except OSError:
+        # the cache is an optimization, read-only installs transform on every import
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _compile_module(filename, local_ivy_id=None):
+    with open(filename) as f:
+        data = f.read()
+    ast_tree = parse(data)
+    transformer = ImportTransformer()
+    transformer.visit(ast_tree)
+    transformer.impersonate_import(ast_tree, local_ivy_id)
+    ast.fix_missing_locations(ast_tree)
+    return compile(ast_tree, filename=filename, mode="exec")
+
+
 class IvyLoader(Loader):
     def __init__(self, filename):
         self.filename = filename
 
-    def exec_module(self, module, local_ivy_id=None):
+    def _get_code(self, local_ivy_id=None):
+        # the transformed code is cached in memory, and on disk in the style of
+        # __pycache__, keyed by the ivy version, the transform, and the mtime and size
+        # of the source. The code bound to a local ivy instance by its id is not
+        # cached, as each instance imports each module once
+        if local_ivy_id is not None:
+            return _compile_module(self.filename, local_ivy_id)
         if self.filename in _compiled_modules_cache:
-            compiled_obj = _compiled_modules_cache[self.filename]
-        else:
-            with open(self.filename) as f:
-                data = f.read()
-
-            ast_tree = parse(data)
-            transformer = ImportTransformer()
-            transformer.visit(ast_tree)
-            transformer.impersonate_import(ast_tree, local_ivy_id)
-            ast.fix_missing_locations(ast_tree)
-            compiled_obj = compile(ast_tree, filename=self.filename, mode="exec")
-            _compiled_modules_cache[self.filename] = compiled_obj
+            return _compiled_modules_cache[self.filename]
+        key = _cache_key(self.filename)
+        compiled_obj = _load_cached(self.filename, key)
+        if compiled_obj is None:
+            compiled_obj = _compile_module(self.filename)
+            _write_cached(self.filename, key, compiled_obj)
+        _compiled_modules_cache[self.filename] = compiled_obj
+        return compiled_obj
+
+    def exec_module(self, module, local_ivy_id=None):
+        compiled_obj = self._get_code(local_ivy_id)
         try:
             exec(compiled_obj, module.__dict__)
         except Exception as e:
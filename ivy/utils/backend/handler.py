@@ -5,8 +5,10 @@ import types
 import ivy
 import importlib
 import functools
+import sys
 import numpy as np
 import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -19,6 +21,15 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# the wrapped ivy namespace of each backend, built the first time the backend is set
+_backend_namespaces = dict()
+# the ivy arrays and containers alive with a dynamic backend, keyed by id, such that
+# they can be found without scanning the garbage collector when the backend changes.
+# They are only tracked once the backend is first changed dynamically, which scans
+# the garbage collector for them, so that constructing them costs nothing otherwise
+_array_registry = weakref.WeakValueDictionary()
+_container_registry = weakref.WeakValueDictionary()
+_tracking_dynamic_backend = False
 
 
 class ContextManager:
@@ -67,8 +78,7 @@ def prevent_access_locally(fn):
 def _get_backend_for_arg(arg_module_name):
     for backend in _backend_dict:
         if backend in arg_module_name:
-            module_name = _backend_dict[backend]
-            return importlib.import_module(module_name)
+            return _import_backend(backend)
 
 
 def _determine_backend_from_args(args):
@@ -273,6 +283,58 @@ def _set_backend_as_ivy(
             )
 
 
+def _refresh_original_dict():
+    global ivy_original_dict
+    original_dict = ivy.__dict__.copy()
+    # the cached namespaces are wrapped from the original ivy namespace, so they are
+    # rebuilt if any of its entries have been changed since
+    if original_dict.keys() != ivy_original_dict.keys() or any(
+        ivy_original_dict[k] is not v for k, v in original_dict.items()
+    ):
+        _backend_namespaces.clear()
+    ivy_original_dict = original_dict
+
+
+def _set_backend_namespace(backend):
+    """
+    Update the ivy namespace with the wrapped namespace of `backend`.
+
+    The namespace is built with `_set_backend_as_ivy` the first time the backend is
+    set, and cached such that switching to it again is a single dict update.
+
+    Parameters
+    ----------
+    backend
+        the backend module to set the ivy namespace to.
+    """
+    if backend in _backend_namespaces:
+        namespace, invalid_keys = _backend_namespaces[backend]
+        ivy.__dict__.update(namespace)
+        for k in invalid_keys:
+            ivy.__dict__.pop(k, None)
+        return
+    set_backend_to_specific_version(backend)
+    _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+    _backend_namespaces[backend] = (
+        {k: ivy.__dict__[k] for k in ivy_original_dict if k in ivy.__dict__},
+        [k for k in ivy_original_dict if k not in ivy.__dict__],
+    )
+
+
+def _clear_support_cache():
+    # the cached dtype and device support refers to the functions of the
+    # previous global backend
+    ivy.functional.ivy.data_type._clear_support_cache()
+
+
+def _rebind_instance_methods():
+    # the generated array instance methods are bound to the functions of the
+    # previous global backend
+    from ivy.data_classes.array.wrapping import _rebind_ivy_array_instance_methods
+
+    _rebind_ivy_array_instance_methods()
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -280,6 +342,108 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
+def _import_backend(backend: str):
+    # the backends are built on ivy's own implementations, so a backend imported for
+    # the first time needs the original ivy namespace, without any backend set
+    module_name = _backend_dict[backend]
+    if module_name in sys.modules or not backend_stack or ivy.is_local():
+        return importlib.import_module(module_name)
+    with ivy.locks["backend_setter"]:
+        ivy.__dict__.update(ivy_original_dict)
+        try:
+            return importlib.import_module(module_name)
+        finally:
+            _set_backend_namespace(backend_stack[-1])
+
+
+def _to_numpy_without_copy(x):
+    # native arrays in host memory are viewed as numpy arrays through their array
+    # interface, the others are copied, as are read-only views such as those of
+    # immutable jax arrays, since numpy arrays are updated inplace
+    x = x.data if isinstance(x, ivy.Array) else x
+    if isinstance(x, np.ndarray):
+        return x
+    try:
+        ret = np.asarray(x)
+    except (RuntimeError, TypeError, ValueError):
+        ret = None
+    if ret is None or not ret.flags.writeable or ret.dtype == object:
+        return _determine_backend_from_args(x).to_numpy(x)
+    return ret
+
+
+def _native_array_reduce_args(x, backend_str):
+    # the arguments of _rebuild_native_array for a native array pickled as a numpy
+    # array, which numpy pickles out-of-band with protocol 5, or None for native
+    # arrays pickled as they are, such as variables and dtypes numpy doesn't support
+    if backend_str and _import_backend(backend_str).is_variable(x):
+        return None
+    try:
+        data = _to_numpy_without_copy(x)
+    except Exception:
+        return None
+    if data.dtype.hasobject or data.dtype.name == "bfloat16":
+        return None
+    device_str = _import_backend(backend_str).dev(x) if backend_str else None
+    return backend_str, data, device_str
+
+
+def _rebuild_native_array(backend_str, data, device_str):
+    # the numpy array is moved to the backend module directly, without setting it as
+    # the global backend
+    if not backend_str or backend_str == "numpy":
+        return data
+    ret = ivy.transfer(data, backend=backend_str)
+    if device_str is not None and not str(device_str).startswith("cpu"):
+        backend = _import_backend(backend_str)
+        ret = backend.to_device(ret, backend.as_native_dev(device_str))
+    return ret
+
+
+class _NativeArrayReducer:
+    # stands in for a native array when pickling, such that it's rebuilt from the
+    # numpy array it's pickled as
+    __slots__ = ("args",)
+
+    def __init__(self, args):
+        self.args = args
+
+    def __reduce_ex__(self, protocol):
+        return _rebuild_native_array, self.args
+
+
+def _update_dynamic_backend_registry(obj):
+    # called when the dynamic backend of an array or container is changed
+    if not _tracking_dynamic_backend:
+        return
+    registry = (
+        _container_registry if isinstance(obj, ivy.Container) else _array_registry
+    )
+    if obj._dynamic_backend:
+        registry[id(obj)] = obj
+    else:
+        registry.pop(id(obj), None)
+
+
+def _track_dynamic_backend():
+    # fills the registries with the arrays and containers constructed before they
+    # were tracked, which are registered on construction from then on
+    global _tracking_dynamic_backend
+    if _tracking_dynamic_backend:
+        return
+    for obj in gc.get_objects():
+        if isinstance(obj, ivy.Array):
+            # uninitialized arrays have no data
+            if getattr(obj, "_data", None) is not None and getattr(
+                obj, "_dynamic_backend", False
+            ):
+                _array_registry[id(obj)] = obj
+        elif isinstance(obj, ivy.Container):
+            if getattr(obj, "_dynamic_backend", False):
+                _container_registry[id(obj)] = obj
+    _tracking_dynamic_backend = True
+
+
 def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
@@ -327,14 +491,10 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
 
         return list(new_objs.values())
 
-    # get all ivy array and container instances in the project scope
-    array_list, container_list = [
-        [obj for obj in gc.get_objects() if isinstance(obj, obj_type)]
-        for obj_type in (ivy.Array, ivy.Container)
-    ]
-
-    # filter uninitialized arrays
-    array_list = [arr for arr in array_list if arr.__dict__]
+    # get all ivy array and container instances alive with a dynamic backend
+    _track_dynamic_backend()
+    array_list = list(_array_registry.values())
+    container_list = list(_container_registry.values())
 
     # remove numpy intermediate objects
     new_objs = _remove_intermediate_arrays(array_list, container_list)
@@ -343,22 +503,35 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
     # now convert all ivy.Array and ivy.Container instances
     # to numpy using the current backend
     for obj in new_objs:
+        if isinstance(obj, ivy.Array) and not ivy.is_native_array(obj.data):
+            # left behind by an earlier backend, which can't be converted from
+            continue
         if obj.dynamic_backend:
             numpy_objs.append(obj)
-            devices.append(obj.device)
+            if isinstance(obj, ivy.Container):
+                # the devices of the leaves, as the container can hold other objects
+                devices.append(
+                    obj.cont_map(lambda x, kc: ivy.dev(x) if ivy.is_array(x) else None)
+                )
+            else:
+                devices.append(obj.device)
             if _is_var(obj):
                 # add variable object id to set
                 variable_ids.add(id(obj))
-                native_var = _variable_data(obj)
-                np_data = ivy.to_numpy(native_var)
-
+                data = _variable_data(obj)
             else:
-                np_data = obj.to_numpy()
+                data = obj
 
             if isinstance(obj, ivy.Container):
-                obj.cont_inplace_update(np_data)
+                obj.cont_inplace_update(
+                    data.cont_map(
+                        lambda x, kc: (
+                            _to_numpy_without_copy(x) if ivy.is_array(x) else x
+                        )
+                    )
+                )
             else:
-                obj._data = np_data
+                obj._data = _to_numpy_without_copy(data)
 
     return variable_ids, numpy_objs, devices
 
@@ -370,29 +543,24 @@ def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
     # convert all ivy.Array and ivy.Container instances from numpy
     # to native arrays using the newly set backend
     for obj, device in zip(numpy_objs, devices):
-        np_arr = obj.data if isinstance(obj, ivy.Array) else obj
-        # check if object was originally a variable
-        if id(obj) in variable_ids:
-            native_arr = ivy.nested_map(
-                np_arr,
-                lambda x: current_backend().asarray(x, device=device),
-                include_derived=True,
-                shallow=False,
-            )
-            new_data = _variable(native_arr)
+        is_var = id(obj) in variable_ids
+        if isinstance(obj, ivy.Container):
 
-        else:
-            new_data = ivy.nested_map(
-                np_arr,
-                lambda x: current_backend().asarray(x, device=device),
-                include_derived=True,
-                shallow=False,
-            )
+            def _to_native(x, kc):
+                x = x.data if isinstance(x, ivy.Array) else x
+                if not isinstance(x, np.ndarray):
+                    return x
+                x = current_backend().asarray(x, device=device[kc])
+                # check if object was originally a variable
+                return _variable(x) if is_var else x
 
-        if isinstance(obj, ivy.Container):
-            obj.cont_inplace_update(new_data)
-        else:
-            obj.data = new_data.data
+            obj.cont_inplace_update(obj.cont_map(_to_native))
+            continue
+        new_data = current_backend().asarray(obj.data, device=device)
+        # check if object was originally a variable
+        if is_var:
+            new_data = _variable(new_data)
+        obj.data = new_data.data if isinstance(new_data, ivy.Array) else new_data
 
 
 @prevent_access_locally
@@ -437,9 +605,8 @@ def set_backend(backend: str, dynamic: bool = False):
 
     # update the global dict with the new backend
     with ivy.locks["backend_setter"]:
-        global ivy_original_dict
         if not backend_stack:
-            ivy_original_dict = ivy.__dict__.copy()
+            _refresh_original_dict()
 
         _clear_current_sub_backends()
         if isinstance(backend, str):
@@ -454,8 +621,9 @@ def set_backend(backend: str, dynamic: bool = False):
         elif backend.current_backend_str() == "jax":
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
-        set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+        _set_backend_namespace(backend)
+        _clear_support_cache()
+        _rebind_instance_methods()
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -568,16 +736,14 @@ def previous_backend():
                 ivy.set_default_device("cpu")
             elif new_backend.current_backend_str() == "jax":
                 ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
-        new_backend_dict = (
-            backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
-        )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        # add the wrapped functions of the new backend to the ivy namespace if there
+        # still is a backend, otherwise restore the original ivy namespace
+        if backend_stack:
+            _set_backend_namespace(backend_stack[-1])
+        else:
+            ivy.__dict__.update(ivy_original_dict)
+        _clear_support_cache()
+        _rebind_instance_methods()
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -630,6 +796,7 @@ def with_backend(backend: str, cached: bool = False):
         ivy_pack.utils.backend.handler._set_backend_as_ivy(
             ivy_pack.__dict__.copy(), ivy_pack, backend_module
         )
+        ivy_pack.utils.backend.handler._rebind_instance_methods()
         ivy_pack.backend_stack.append(backend_module)
         ivy_pack.utils.backend._importlib.import_cache = copy.copy(
             _importlib.import_cache
@@ -0,0 +1,182 @@
+# global
+import asyncio
+import contextlib
+import functools
+import queue
+from typing import Callable, Dict, Iterable, Optional, Union
+
+# local
+import ivy
+from ivy.utils.backend.handler import prevent_access_locally, with_backend
+
+
+class BackendPool:
+    """
+    A pool of local ivy instances, to run code with different backends concurrently.
+
+    The local ivy instances are built with :func:`ivy.with_backend` when the pool is
+    created, and each is handed out to one worker thread or asyncio task at a time.
+    Functions run with an instance only use its backend, without setting the backend
+    of the global ivy, such that models with different backends can be served side by
+    side in one process.
+
+    Parameters
+    ----------
+    backends
+        the backend, or backends, to build instances of.
+    size
+        the number of instances of each backend, which bounds how many workers can use
+        the backend concurrently.
+
+    Examples
+    --------
+    >>> pool = ivy.BackendPool(["numpy", "torch"], size=2)
+    >>> def mean(local_ivy, x):
+    ...     return local_ivy.mean(local_ivy.array(x))
+    >>> print(pool.run("torch", mean, [1., 2., 3.], native=True))
+    tensor(2.)
+    """
+
+    @prevent_access_locally
+    def __init__(self, backends: Union[str, Iterable[str]], size: int = 1):
+        if isinstance(backends, str):
+            backends = [backends]
+        ivy.utils.assertions.check_true(size > 0, message="size must be positive")
+        self._size = size
+        self._instances: Dict[str, queue.LifoQueue] = dict()
+        for backend in backends:
+            instances = queue.LifoQueue()
+            for _ in range(size):
+                instances.put(with_backend(backend))
+            self._instances[backend] = instances
+
+    @property
+    def backends(self):
+        return list(self._instances)
+
+    @property
+    def size(self):
+        return self._size
+
+    def available(self, backend: str) -> int:
+        """Return the number of instances of the backend not currently in use."""
+        return self._instances[backend].qsize()
+
+    @contextlib.contextmanager
+    def acquire(self, backend: str, /, *, timeout: Optional[float] = None):
+        """
+        Take an instance of the backend from the pool, waiting for one to be returned
+        if they are all in use, and return it to the pool on exit.
+
+        Parameters
+        ----------
+        backend
+            the backend of the instance.
+        timeout
+            the number of seconds to wait for an instance, or None to wait forever.
+
+        Returns
+        -------
+        ret
+            a context manager yielding the local ivy instance.
+        """
+        ivy.utils.assertions.check_elem_in_list(backend, self.backends)
+        instances = self._instances[backend]
+        try:
+            local_ivy = instances.get(timeout=timeout)
+        except queue.Empty:
+            raise ivy.utils.exceptions.IvyException(
+                "no {} instance was returned to the pool within {} seconds".format(
+                    backend, timeout
+                )
+            )
+        try:
+            yield local_ivy
+        finally:
+            instances.put(local_ivy)
+
+    def run(
+        self,
+        backend: str,
+        fn: Callable,
+        /,
+        *args,
+        native: bool = False,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ):
+        """
+        Run a function with an instance of the backend from the pool.
+
+        Parameters
+        ----------
+        backend
+            the backend to run the function with.
+        fn
+            the function to run, called with the local ivy instance followed by
+            ``args`` and ``kwargs``.
+        args
+            positional arguments to the function.
+        native
+            whether to convert the arrays returned by the function to native arrays.
+        timeout
+            the number of seconds to wait for an instance, or None to wait forever.
+        kwargs
+            keyword arguments to the function.
+
+        Returns
+        -------
+        ret
+            the return of the function.
+        """
+        with self.acquire(backend, timeout=timeout) as local_ivy:
+            ret = fn(local_ivy, *args, **kwargs)
+            if native:
+                ret = local_ivy.to_native(ret, nested=True)
+            return ret
+
+    async def run_async(
+        self,
+        backend: str,
+        fn: Callable,
+        /,
+        *args,
+        native: bool = False,
+        timeout: Optional[float] = None,
+        executor=None,
+        **kwargs,
+    ):
+        """
+        Run a function with an instance of the backend from the pool in an executor,
+        without blocking the event loop.
+
+        Parameters
+        ----------
+        backend
+            the backend to run the function with.
+        fn
+            the function to run, called with the local ivy instance followed by
+            ``args`` and ``kwargs``.
+        args
+            positional arguments to the function.
+        native
+            whether to convert the arrays returned by the function to native arrays.
+        timeout
+            the number of seconds to wait for an instance, or None to wait forever.
+        executor
+            the executor to run the function in, or None for the default executor of
+            the event loop.
+        kwargs
+            keyword arguments to the function.
+
+        Returns
+        -------
+        ret
+            the return of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                self.run, backend, fn, *args, native=native, timeout=timeout, **kwargs
+            ),
+        )
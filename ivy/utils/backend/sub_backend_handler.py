@@ -85,6 +85,7 @@ def set_sub_backend(sub_backend_str: str):
         _sub_backend_dict[sub_backend_str]
     )
     _set_sub_backend_as_ivy(ivy.__dict__.copy(), ivy, sub_backend)
+    ivy.utils.backend.handler._rebind_instance_methods()
     ivy.current_backend().sub_backends._current_sub_backends.append(sub_backend_str)
 
 
@@ -141,6 +142,7 @@ def unset_sub_backend(sub_backend_str: str):
     _unset_sub_backend_from_ivy(
         original_backend_dict, ivy, sub_backend, sub_backend.name
     )
+    ivy.utils.backend.handler._rebind_instance_methods()
     ivy.current_backend().sub_backends._current_sub_backends.remove(sub_backend_str)
 
 
@@ -173,6 +175,7 @@ def clear_sub_backends():
     if ivy.current_sub_backends():
         ivy.__dict__.update(original_backend_dict)
         ivy.current_backend().sub_backends._current_sub_backends = []
+        ivy.utils.backend.handler._rebind_instance_methods()
 
 
 # This is only used in set_backend in handler.py
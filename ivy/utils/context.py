@@ -0,0 +1,91 @@
+# global
+import asyncio
+import contextvars
+import threading
+
+
+def _in_main_context():
+    # the main thread, outside of any asyncio task
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+class ContextStack:
+    """
+    A stack of global settings, such as the default device or dtype, which is local to
+    each thread and asyncio task.
+
+    The stack is held in a context variable and copied on write, such that concurrent
+    workers can push and pop their own settings without affecting each other. A
+    context which hasn't changed the stack yet reads the stack of the main thread,
+    outside of asyncio tasks, so threads start with the settings of the main thread,
+    and asyncio tasks with the settings of the context they were created in.
+
+    Parameters
+    ----------
+    name
+        name of the context variable holding the stack.
+    items
+        the items initially on the stack.
+    """
+
+    __slots__ = ("_var", "_root")
+    __hash__ = None
+
+    def __init__(self, name, items=()):
+        self._var = contextvars.ContextVar(name)
+        self._root = tuple(items)
+
+    def _get(self):
+        return self._var.get(self._root)
+
+    def _set(self, items):
+        self._var.set(items)
+        if _in_main_context():
+            self._root = items
+
+    def append(self, item):
+        self._set(self._get() + (item,))
+
+    def extend(self, items):
+        self._set(self._get() + tuple(items))
+
+    def pop(self, index=-1):
+        items = list(self._get())
+        item = items.pop(index)
+        self._set(tuple(items))
+        return item
+
+    def clear(self):
+        self._set(())
+
+    def copy(self):
+        return list(self._get())
+
+    def __getitem__(self, index):
+        return self._get()[index]
+
+    def __len__(self):
+        return len(self._get())
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __contains__(self, item):
+        return item in self._get()
+
+    def __eq__(self, other):
+        if isinstance(other, ContextStack):
+            other = other._get()
+        return isinstance(other, (list, tuple)) and list(self._get()) == list(other)
+
+    def __deepcopy__(self, memo):
+        return ContextStack(self._var.name, self._get())
+
+    def __repr__(self):
+        return repr(list(self._get()))
@@ -1,6 +1,8 @@
 # NOQA
 import ivy
+import types
 from importlib import import_module as builtin_import
+from importlib.util import find_spec
 
 
 def import_module(name, package=None):
@@ -8,3 +10,43 @@ def import_module(name, package=None):
         with ivy.utils._importlib.LocalIvyImporter():
             return ivy.utils._importlib._import_module(name=name, package=package)
     return builtin_import(name=name, package=package)
+
+
+def is_importable(name):
+    """Return whether the module can be imported, without importing it."""
+    return find_spec(name) is not None
+
+
+class LazyModule(types.ModuleType):
+    """
+    A module which is only imported when one of its attributes is first accessed.
+
+    Optional integrations are held as lazy modules, such that ``import ivy`` doesn't
+    pay for importing them, and they are only required once they are used.
+
+    Parameters
+    ----------
+    name
+        the name of the module to import.
+    on_import
+        function called with the module once it is imported, to initialize it.
+    """
+
+    def __init__(self, name, on_import=None):
+        super().__init__(name)
+        self._on_import = on_import
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            module = builtin_import(self.__name__)
+            if self._on_import is not None:
+                self._on_import(module)
+            self._module = module
+        return self._module
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __repr__(self):
+        return "<lazy module {!r}>".format(self.__name__)
@@ -941,6 +941,24 @@ def test_function_unsupported_dtypes(*, func):
     assert set(tuple(exp)) == set(res)
 
 
+# function_dtype_support_cache
+@handle_test(
+    fn_tree="functional.ivy.function_unsupported_dtypes",  # dummy fn_tree
+    func=st.sampled_from([_composition_1, _composition_2]),
+)
+def test_function_dtype_support_cache(*, func):
+    data_type = importlib.import_module("ivy.functional.ivy.data_type")
+    data_type._clear_support_cache()
+    res = ivy.function_unsupported_dtypes(func)
+    key = ("function_unsupported_dtypes", func, True, *data_type._backend_and_version())
+    assert data_type._support_cache[key] == res
+    # cached results are returned as long as the backend doesn't change
+    assert ivy.function_unsupported_dtypes(func) is res
+    assert set(res) == set(data_type._function_unsupported_dtypes(func, True))
+    data_type._clear_support_cache()
+    assert not data_type._support_cache
+
+
 # function_dtype_versioning
 @handle_test(
     fn_tree="functional.ivy.function_unsupported_dtypes",  # dummy fn_tree
@@ -1,6 +1,7 @@
 """Collection of tests for unified general functions."""
 
 # global
+import collections
 import copy
 import warnings
 import pytest
@@ -439,6 +440,55 @@ def test_nested_map_w_extra_nest_types(fn):
     assert ivy.all(x_copy["b"]["c"] == x["b"]["c"])
 
 
+# nested_map_w_max_depth
+@pytest.mark.parametrize("max_depth", [0, 1, 2, 3, None])
+def test_nested_map_w_max_depth(max_depth):
+    x = [1, (2, [3, {"a": 4}])]
+    result = ivy.nested_map(x, lambda x_: x_ * 10, shallow=False, max_depth=max_depth)
+    expected = {
+        0: [1, (2, [3, {"a": 4}])],
+        1: [10, (2, [3, {"a": 4}])],
+        2: [10, (20, [3, {"a": 4}])],
+        3: [10, (20, [30, {"a": 4}])],
+        None: [10, (20, [30, {"a": 40}])],
+    }[max_depth]
+    assert result == expected
+
+
+# nested_flatten
+@pytest.mark.parametrize(
+    ("x", "expected_leaves"),
+    [
+        ({"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}, [0, 1, 2, 3, 0, 1]),
+        (([0, (1, 2)], {"out": None, "axis": (0, 1)}), [0, 1, 2, None, 0, 1]),
+        ([[], (), {}, [[[[5]]]]], [5]),
+        (3, [3]),
+    ],
+)
+def test_nested_flatten(x, expected_leaves):
+    leaves, structure = ivy.nested_flatten(x)
+    assert leaves == expected_leaves
+    assert ivy.nested_unflatten(structure, leaves) == x
+    # the structure is hashable and equal for nests with the same layout
+    x_copy = copy.deepcopy(x)
+    assert hash(structure) == hash(ivy.nested_flatten(x_copy)[1])
+    mapped = ivy.nested_unflatten(structure, [leaf for leaf in leaves])
+    assert mapped == ivy.nested_map(x, lambda x_: x_, shallow=False)
+
+
+# nested_unflatten
+def test_nested_unflatten():
+    point = collections.namedtuple("point", ["x", "y"])
+    x = {"p": point(1, [2, 3]), "q": (4,)}
+    leaves, structure = ivy.nested_flatten(x, include_derived=True)
+    assert leaves == [1, 2, 3, 4]
+    result = ivy.nested_unflatten(structure, [5, 6, 7, 8])
+    assert result == {"p": point(5, [6, 7]), "q": (8,)}
+    assert isinstance(result["p"], point)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.nested_unflatten(structure, [5, 6, 7])
+
+
 # nested_any
 @pytest.mark.parametrize("x", [{"a": [[0, 1], [2, 3]], "b": {"c": [[0], [1]]}}])
 @pytest.mark.parametrize("fn", [lambda x: True if x % 2 == 0 else False])
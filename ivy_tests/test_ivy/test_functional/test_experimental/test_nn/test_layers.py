@@ -1,4 +1,6 @@
 # global
+import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
@@ -230,6 +232,30 @@ def test_avg_pool3d(
     )
 
 
+# numpy pooling with out
+@pytest.mark.parametrize("dims", [1, 2, 3])
+@pytest.mark.parametrize("pool", ["max", "avg"])
+@pytest.mark.parametrize("channel_first", [False, True])
+def test_numpy_pool_out(dims, pool, channel_first):
+    numpy_layers = pytest.importorskip(
+        "ivy.functional.backends.numpy.experimental.layers"
+    )
+    fn = getattr(numpy_layers, "{}_pool{}d".format(pool, dims))
+    data_format = ["NWC", "NHWC", "NDHWC"][dims - 1]
+    if channel_first:
+        data_format = data_format[0] + "C" + data_format[1:-1]
+    x = np.random.default_rng(0).standard_normal([2, *[6] * dims, 3])
+    x = x.astype("float32")
+    if channel_first:
+        x = np.moveaxis(x, -1, 1)
+    ret = fn(x, 3, 2, "SAME", data_format=data_format)
+    out = np.zeros_like(ret)
+    ret_out = fn(x, 3, 2, "SAME", data_format=data_format, out=out)
+    # the result is written directly to out
+    assert ret_out is out
+    assert np.allclose(ret, out)
+
+
 @st.composite
 def valid_dct(draw):
     dtype, x = draw(
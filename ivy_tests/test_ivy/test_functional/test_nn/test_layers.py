@@ -1,11 +1,16 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+from collections import OrderedDict
+import numpy as np
+import pytest
 from hypothesis import strategies as st, assume
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
+from ivy.functional.ivy import layers as ivy_layers
 from ivy.functional.ivy.layers import _deconv_length
 
 # Linear #
@@ -306,6 +311,60 @@ def test_multi_head_attention(
     )
 
 
+@pytest.mark.parametrize("chunk_size", [1, 4, 13, 64])
+@pytest.mark.parametrize("mask_shape", [None, (2, 7, 13), (7, 13), (2, 7, 1)])
+def test_chunked_scaled_dot_product_attention(chunk_size, mask_shape):
+    rng = np.random.default_rng(0)
+    q = ivy.array(rng.standard_normal((2, 7, 6)).astype("float32"))
+    k = ivy.array(rng.standard_normal((2, 13, 6)).astype("float32"))
+    v = ivy.array(rng.standard_normal((2, 13, 5)).astype("float32"))
+    mask = None
+    if mask_shape is not None:
+        mask = ivy.array(rng.random(mask_shape) > 0.5)
+    ret = ivy.scaled_dot_product_attention(
+        q, k, v, 0.4, mask=mask, chunk_size=chunk_size
+    )
+    ret_ref = ivy.scaled_dot_product_attention(q, k, v, 0.4, mask=mask)
+    assert ret.shape == ret_ref.shape
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_ref), atol=1e-5)
+
+    # the chunked implementation is also used by multi-head attention
+    x = ivy.array(rng.standard_normal((2, 7, 6)).astype("float32"))
+    context = ivy.array(rng.standard_normal((2, 13, 12)).astype("float32"))
+    ret = ivy.multi_head_attention(x, 0.4, 2, context=context, chunk_size=chunk_size)
+    ret_ref = ivy.multi_head_attention(x, 0.4, 2, context=context)
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_ref), atol=1e-5)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4])
+def test_chunked_scaled_dot_product_attention_no_keys(chunk_size):
+    q = ivy.ones((2, 7, 6))
+    k = ivy.ones((2, 0, 6))
+    v = ivy.ones((2, 0, 5))
+    ret = ivy.scaled_dot_product_attention(q, k, v, 0.4, chunk_size=chunk_size)
+    assert ret.shape == (2, 7, 5)
+    assert np.array_equal(ivy.to_numpy(ret), np.zeros((2, 7, 5)))
+
+
+def test_attention_impl():
+    assert ivy.get_attention_impl() == "default"
+    rng = np.random.default_rng(0)
+    q, k, v = (
+        ivy.array(rng.standard_normal((1, 3000, 4)).astype("float32")) for _ in range(3)
+    )
+    ret_ref = ivy.scaled_dot_product_attention(q, k, v, 0.5)
+    ivy.set_attention_impl("chunked")
+    try:
+        assert ivy.get_attention_impl() == "chunked"
+        ret = ivy.scaled_dot_product_attention(q, k, v, 0.5)
+    finally:
+        ivy.unset_attention_impl()
+    assert ivy.get_attention_impl() == "default"
+    assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(ret_ref), atol=1e-5)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.set_attention_impl("flash")
+
+
 # Convolutions #
 # -------------#
 
@@ -846,6 +905,84 @@ def test_conv_general_transpose(
     )
 
 
+# numpy convolution algorithms
+@pytest.mark.parametrize(
+    ("algorithm", "dims", "kernel", "dilation"),
+    [
+        ("winograd", 2, 3, 1),
+        ("fft", 1, 7, 1),
+        ("fft", 2, 5, 1),
+        ("fft", 2, 5, 2),
+        ("fft", 3, 5, 1),
+    ],
+)
+@pytest.mark.parametrize("spatial_size", [15, 16])
+@pytest.mark.parametrize(
+    ("dtype", "tolerance"), [("float32", 1e-5), ("float64", 1e-12)]
+)
+def test_numpy_conv_algorithms(
+    algorithm, dims, kernel, dilation, spatial_size, dtype, tolerance
+):
+    numpy_layers = pytest.importorskip("ivy.functional.backends.numpy.layers")
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal([2, *[spatial_size] * dims, 3]).astype(dtype)
+    filters = rng.standard_normal([kernel] * dims + [3, 4]).astype(dtype)
+    strides, dilations = [1] * dims, [dilation] * dims
+    ret = numpy_layers._conv_algorithms[algorithm](x, filters, strides, dilations, dims)
+    ret_ref = numpy_layers._conv_gemm(x, filters, strides, dilations, dims)
+    assert ret.shape == ret_ref.shape
+    assert ret.dtype == ret_ref.dtype
+    assert np.abs(ret - ret_ref).max() <= tolerance * np.abs(ret_ref).max()
+
+
+def test_numpy_conv_algorithm_cache_is_bounded(monkeypatch):
+    numpy_layers = pytest.importorskip("ivy.functional.backends.numpy.layers")
+    monkeypatch.setattr(numpy_layers, "_conv_algorithm_cache", OrderedDict())
+    monkeypatch.setattr(numpy_layers, "_CONV_ALGORITHM_CACHE_SIZE", 2)
+    filters = np.ones([3, 3, 1, 1], "float32")
+    for size in [6, 7, 8, 6]:
+        x = np.ones([1, size, size, 1], "float32")
+        numpy_layers._conv_autotuned(x, filters, [1, 1], [1, 1], 2)
+    # the least recently used configuration is evicted
+    assert [key[0] for key in numpy_layers._conv_algorithm_cache] == [
+        (8, 8, 1),
+        (6, 6, 1),
+    ]
+
+
+def test_numpy_conv_autotuner(monkeypatch):
+    numpy_layers = pytest.importorskip("ivy.functional.backends.numpy.layers")
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal([1, 12, 12, 2]).astype("float32")
+    filters = rng.standard_normal([3, 3, 2, 2]).astype("float32")
+    key = numpy_layers._conv_algorithm_key(x, filters, [1, 1], [1, 1], 1)
+    numpy_layers._conv_algorithm_cache.pop(key, None)
+    ret = numpy_layers._conv_autotuned(x, filters, [1, 1], [1, 1], 2)
+    # the first call caches one of the applicable algorithms
+    assert numpy_layers._conv_algorithm_cache[key] in ("gemm", "winograd")
+    ret_again = numpy_layers._conv_autotuned(x, filters, [1, 1], [1, 1], 2)
+    assert np.allclose(ret, ret_again, atol=1e-5)
+    ret_ref = numpy_layers._conv_gemm(x, filters, [1, 1], [1, 1], 2)
+    assert np.allclose(ret, ret_ref, atol=1e-5)
+    # the algorithm is shared by inputs of any batch size
+    x_batch = np.concatenate([x] * 3)
+    num_cached = len(numpy_layers._conv_algorithm_cache)
+    numpy_layers._conv_autotuned(x_batch, filters, [1, 1], [1, 1], 2)
+    assert len(numpy_layers._conv_algorithm_cache) == num_cached
+    # without autotuning, the results are the ones of gemm
+    monkeypatch.setattr(numpy_layers, "_conv_autotune", False)
+    ret = numpy_layers._conv_autotuned(x_batch, filters, [1, 1], [1, 1], 2)
+    ret_ref = numpy_layers._conv_gemm(x_batch, filters, [1, 1], [1, 1], 2)
+    assert np.array_equal(ret, ret_ref)
+    # grouped and integer convolutions only use the gemm path
+    assert numpy_layers._conv_algorithm_candidates(
+        x, filters[..., :1, :], [1, 1], [1, 1], 2, 2
+    ) == ["gemm"]
+    assert numpy_layers._conv_algorithm_candidates(
+        x.astype("int32"), filters.astype("int32"), [1, 1], [1, 1], 2, 1
+    ) == ["gemm"]
+
+
 # LSTM #
 # -----#
 
@@ -956,3 +1093,45 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+@pytest.mark.parametrize("batch_shape", [[], [2], [2, 3]])
+@pytest.mark.parametrize("num_biases", [0, 1, 2])
+def test_lstm_update_backend_kernel(batch_shape, num_biases):
+    rng = np.random.default_rng(0)
+    in_channels, out_channels, timesteps = 3, 4, 5
+
+    def _random(*shape):
+        return rng.standard_normal(shape).astype("float32")
+
+    x = _random(*batch_shape, timesteps, in_channels)
+    init_h = _random(*batch_shape, out_channels)
+    init_c = _random(*batch_shape, out_channels)
+    kernel = _random(in_channels, 4 * out_channels)
+    recurrent_kernel = _random(out_channels, 4 * out_channels)
+    biases = [_random(4 * out_channels) for _ in range(num_biases)]
+    biases += [None] * (2 - num_biases)
+
+    # reference lstm with separately activated gates
+    def _sigmoid(v):
+        return 1 / (1 + np.exp(-v))
+
+    ht, ct, hts = init_h, init_c, []
+    for t in range(timesteps):
+        gates = x[..., t, :] @ kernel + ht @ recurrent_kernel
+        gates += sum(b for b in biases if b is not None)
+        it, ft, gt, ot = np.split(gates, 4, axis=-1)
+        ct = _sigmoid(ft) * ct + _sigmoid(it) * np.tanh(gt)
+        ht = _sigmoid(ot) * np.tanh(ct)
+        hts.append(ht)
+    hts = np.stack(hts, axis=-2)
+
+    args = [ivy.array(v) for v in (x, init_h, init_c, kernel, recurrent_kernel)]
+    bias, recurrent_bias = [None if b is None else ivy.array(b) for b in biases]
+    for fn in (ivy.lstm_update, ivy_layers.lstm_update):
+        ret_hts, ret_ct = fn(*args, bias=bias, recurrent_bias=recurrent_bias)
+        assert isinstance(ret_hts, ivy.Array)
+        assert ret_hts.shape == hts.shape
+        assert ret_ct.shape == ct.shape
+        assert np.allclose(ivy.to_numpy(ret_hts), hts, atol=1e-5)
+        assert np.allclose(ivy.to_numpy(ret_ct), ct, atol=1e-5)
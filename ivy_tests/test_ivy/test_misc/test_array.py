@@ -15,6 +15,7 @@ from ivy_tests.test_ivy.test_functional.test_core.test_linalg import (
     _get_second_matrix_and_dtype,
 )
 from ivy.data_classes.array import Array
+from ivy.data_classes.array.wrapping import _make_trampoline
 
 
 # getitem and setitem helper
@@ -70,6 +71,42 @@ def test_array_function():
     assert all(y1 == ivy.array([1, 1]))
 
 
+def test_array_lazy_metadata():
+    native = ivy.native_array([[1.0, 2.0], [3.0, 4.0]], dtype="float32")
+    x = Array(native)
+    # instances only carry their slots, and metadata is computed on first access
+    assert Array.__dictoffset__ == 0
+    assert x._dtype is None and x._device is None and x._size is None
+    assert x.dtype == ivy.dtype(native)
+    assert x.device == ivy.dev(native)
+    assert x.size == 4
+    assert x.itemsize == 4
+    assert x.strides == ivy.to_numpy(x).strides
+    assert x._dtype is not None and x._size == 4
+    # replacing the data resets the cached metadata
+    x.data = ivy.native_array([1, 2, 3], dtype="int64")
+    assert x.dtype == "int64"
+    assert x.size == 3
+    assert x.itemsize == 8
+
+
+def test_array_instance_method_trampolines():
+    x = ivy.array([1.0, 2.0])
+    # the generated methods are bound to the functions of the current backend
+    assert Array.to_native.__closure__[0].cell_contents is ivy.to_native
+    assert ivy.is_native_array(x.to_native())
+
+    def fn(a=None, b=None, c=None):
+        return a, b, c
+
+    # the data is spliced into the positional or keyword slot of the array
+    method = _make_trampoline([[(1, "b")]])(fn)
+    assert method(x, 0, 2) == (0, x.data, 2)
+    assert method(x, c=2) == (None, x.data, 2)
+    method = _make_trampoline([[(0, "a"), "optional"]])(fn)
+    assert method(x, 1) == (x.data, 1, None)
+
+
 # TODO: avoid using dummy fn_tree in property tests
 
 
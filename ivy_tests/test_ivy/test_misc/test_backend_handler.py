@@ -88,13 +88,18 @@ def test_set_backend(backend, array_type):
 
     ivy.set_backend(backend)
     stack_after = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
-    ivy.utils.assertions.check_equal(func_address_before, id(ivy.sum), inverse=True)
+    backend_module = importlib.import_module(_backend_dict[backend])
+    # check that the function id has changed as inverse=True, unless the backend was
+    # already set, in which case its cached namespace is set again
+    ivy.utils.assertions.check_equal(
+        func_address_before,
+        id(ivy.sum),
+        inverse=stack_before[-1:] != [backend_module],
+    )
     # using ivy assertions to ensure the desired backend is set
     ivy.utils.assertions.check_less(len(stack_before), len(stack_after))
     ivy.utils.assertions.check_equal(ivy.current_backend_str(), backend)
-    backend = importlib.import_module(_backend_dict[backend])
-    ivy.utils.assertions.check_equal(stack_after[-1], backend)
+    ivy.utils.assertions.check_equal(stack_after[-1], backend_module)
     x = ivy.array([1, 2, 3])
     ivy.utils.assertions.check_equal(str(type(ivy.to_native(x))), array_type)
 
@@ -111,9 +116,12 @@ def test_previous_backend(backend):
 
     previous_backend = ivy.previous_backend()
     stack_after_unset = ivy.backend_stack
-    # check that the function id has changed as inverse=True.
+    # check that the function id has changed as inverse=True, unless the backend is
+    # also the one now set
     ivy.utils.assertions.check_equal(
-        func_address_before_unset, id(ivy.sum), inverse=True
+        func_address_before_unset,
+        id(ivy.sum),
+        inverse=stack_after_unset[-1:] != stack_before_unset[-1:],
     )
     ivy.utils.assertions.check_equal(
         previous_backend, importlib.import_module(_backend_dict[backend])
@@ -135,6 +143,37 @@ def test_unset_backend():
     ivy.utils.assertions.check_equal(ivy.backend_stack, [])
 
 
+def test_cached_backend_namespaces():
+    ivy.unset_backend()
+    original_sum = ivy.sum
+    for backend in available_frameworks():
+        ivy.set_backend(backend)
+        backend_sum = ivy.sum
+        ivy.previous_backend()
+        assert ivy.sum is original_sum
+        # the wrapped namespace of the backend is only built once
+        ivy.set_backend(backend)
+        assert ivy.sum is backend_sum
+        ivy.previous_backend()
+
+
+def test_context_manager_does_not_leak():
+    namespace = ivy.__dict__.copy()
+    stack = list(ivy.backend_stack)
+    device_stack = list(ivy.functional.ivy.device.default_device_stack)
+    for _ in range(3):
+        for backend in available_frameworks():
+            with ivy.utils.backend.ContextManager(backend):
+                with ivy.utils.backend.ContextManager("numpy"):
+                    assert ivy.current_backend_str() == "numpy"
+                assert ivy.current_backend_str() == backend
+    # the backend stack, the ivy namespace and the default device are restored
+    assert ivy.backend_stack == stack
+    assert ivy.__dict__.keys() == namespace.keys()
+    assert all(ivy.__dict__[k] is v for k, v in namespace.items())
+    assert ivy.functional.ivy.device.default_device_stack == device_stack
+
+
 @pytest.mark.parametrize(
     ("backend", "array_type"),
     available_array_types_input,
@@ -259,6 +298,53 @@ def test_dynamic_backend_setter():
     assert isinstance(a.data, torch.Tensor)
 
 
+def test_dynamic_backend_registry(monkeypatch):
+    handler = ivy.utils.backend.handler
+    # clear the backend stack
+    ivy.unset_backend()
+
+    # arrays aren't tracked until the backend is first changed dynamically
+    monkeypatch.setattr(handler, "_tracking_dynamic_backend", False)
+    ivy.set_backend("torch")
+    a = ivy.array([1.0, 2.0])
+    assert id(a) not in handler._array_registry
+    ivy.set_backend("torch", dynamic=True)
+    assert handler._tracking_dynamic_backend
+    assert handler._array_registry[id(a)] is a
+
+    # from then on, only the ones with a dynamic backend are tracked
+    b = ivy.array([3.0])
+    cont = ivy.Container({"w": ivy.array([4.0])})
+    assert handler._array_registry[id(b)] is b
+    assert handler._container_registry[id(cont)] is cont
+    static = ivy.array([5.0])
+    static.dynamic_backend = False
+    assert id(static) not in handler._array_registry
+    static.dynamic_backend = True
+    assert handler._array_registry[id(static)] is static
+    static.dynamic_backend = False
+    assert id(static) not in handler._array_registry
+    cont.dynamic_backend = False
+    assert id(cont) not in handler._container_registry
+    cont.dynamic_backend = True
+    assert handler._container_registry[id(cont)] is cont
+    b_id, cont_id = id(b), id(cont)
+    del b, cont
+    assert b_id not in handler._array_registry
+    assert cont_id not in handler._container_registry
+
+    # arrays in host memory are converted without a copy
+    data_ptr = a.data.data_ptr()
+    ivy.set_backend("numpy", dynamic=True)
+    assert isinstance(a.data, np.ndarray)
+    assert a.data.__array_interface__["data"][0] == data_ptr
+    assert isinstance(static.data, torch.Tensor)
+    ivy.set_backend("torch", dynamic=True)
+    assert isinstance(a.data, torch.Tensor)
+    assert a.data.data_ptr() == data_ptr
+    ivy.unset_backend()
+
+
 def test_variables():
     # clear the backend stack
     ivy.unset_backend()
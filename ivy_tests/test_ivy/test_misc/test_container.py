@@ -1,4 +1,5 @@
 # global
+import gc
 import os
 import queue
 import pytest
@@ -6,6 +7,8 @@ import random
 import numpy as np
 import multiprocessing
 import pickle
+import shutil
+import weakref
 
 # local
 import ivy
@@ -1900,6 +1903,91 @@ def test_container_from_flat_list(on_device):
     assert np.allclose(ivy.to_numpy(container.b.d), np.array([6]))
 
 
+def test_container_cont_flatten(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": ivy.array([3], device=on_device),
+            },
+            "e": {},
+        },
+        print_limit=5,
+    )
+    flat = container.cont_flatten()
+    assert flat.key_chains == ["a", "b/c", "b/d"]
+    assert len(flat) == 3
+    mapped = flat.map(lambda x, kc: x + 1)
+    assert mapped.identical_structure(flat)
+    assert [ivy.to_numpy(x).item() for x in mapped.leaves] == [2, 3, 4]
+    # leaves are looked up by key chain in the index shared by the mapped views
+    assert "b/d" in mapped and "b" not in mapped and "e" not in mapped
+    assert ivy.to_numpy(mapped["b/d"]).item() == 4
+    with pytest.raises(IvyException):
+        mapped["b"]
+    # the nested container is built once, with the config of the original
+    nested = mapped.to_container()
+    assert nested is mapped.to_container()
+    assert list(nested.keys()) == ["a", "b", "e"]
+    assert len(nested.e) == 0 and nested.b.cont_config["print_limit"] == 5
+    assert np.allclose(ivy.to_numpy(nested.b.d), np.array([4]))
+    # nested values returned for leaves become containers
+    nested = flat.map(lambda x, kc: {"v": x}).to_container()
+    assert isinstance(nested.b.c, Container)
+    assert nested.cont_all_key_chains() == ["a/v", "b/c/v", "b/d/v"]
+
+
+def test_container_map_frees_source(on_device):
+    # the flat map leaves no reference cycles holding on to the mapped container
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device)},
+        }
+    )
+    ref = weakref.ref(container)
+    gc.disable()
+    try:
+        mapped = container.cont_map(lambda x, kc: x + 1)
+        del container
+        assert ref() is None
+    finally:
+        gc.enable()
+    assert mapped.cont_all_key_chains() == ["a", "b/c"]
+
+
+def test_container_map_equals_recursive_map(on_device):
+    container = Container(
+        {
+            "b": {"d": ivy.array([3], device=on_device), "c": [1, 2]},
+            "a": ivy.array([1], device=on_device),
+            "e": {},
+        },
+        print_indent=2,
+    )
+    # updates the sub-container inplace, which leaves its config partially updated
+    container.cont_inplace_update({"b": Container(f=ivy.array([4], device=on_device))})
+    container["z"] = 1
+    container["y"] = 2
+    # maps over the flat leaves, and the recursive map when pruning
+    flat_mapped = container.cont_map(lambda x, kc: kc)
+    mapped = container.cont_map(lambda x, kc: kc, prune_unapplied=True)
+    assert flat_mapped.cont_all_key_chains() == mapped.cont_all_key_chains()
+    assert flat_mapped.b.c == "b/c" and "e" in flat_mapped and "e" not in mapped
+    assert list(flat_mapped.keys()) == ["a", "b", "e", "y", "z"]
+    assert flat_mapped.b.f == "b/f" and flat_mapped.cont_config == mapped.cont_config
+    # containers with different structures are mapped recursively
+    other = Container(a=ivy.array([1], device=on_device))
+    summed = Container.cont_multi_map(
+        lambda xs, _: sum(xs), [other, Container(a=1, b=2)]
+    )
+    assert summed.cont_all_key_chains() == ["a", "b"] and summed.b == 2
+    # empty sub-containers are dropped by multi maps
+    multi_mapped = Container.cont_multi_map(lambda xs, _: xs[0], [container, 1])
+    assert "e" not in multi_mapped and multi_mapped.b.c == [1, 2]
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map(inplace, on_device):
     # without key_chains specification
@@ -2008,6 +2096,26 @@ def test_container_map(inplace, on_device):
     assert np.allclose(ivy.to_numpy(container_mapped["b"][1]), np.array([4]))
 
 
+def test_container_map_config_not_shared(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device)},
+        }
+    )
+    for ret in [
+        container.cont_map(lambda x, kc: x + 1),
+        Container.cont_multi_map(lambda xs, kc: xs[0] + xs[1], [container] * 2),
+        container[0:1],
+    ]:
+        assert ret._config is not container._config
+        assert ret._config_in is not container._config_in
+        ret.cont_with_ivy_backend("numpy", inplace=True)
+        assert container._config["ivyh"] is None
+        ret.b.cont_with_ivy_backend("numpy", inplace=True)
+        assert container.b._config["ivyh"] is None
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map_sub_conts(inplace, on_device):
     # without key_chains specification
@@ -2541,6 +2649,119 @@ def test_container_to_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_to_and_from_disk_as_hdf5_mmap(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([1, 2], dtype="int32", device=on_device),
+                "d": ivy.array([True, False], device=on_device),
+            },
+        }
+    )
+
+    # contiguous datasets are memory-mapped
+    container.cont_to_disk_as_hdf5(save_filepath, resizable=False)
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, mmap=True)
+    for key_chain, value in container.cont_to_iterator():
+        loaded_value = loaded_container[key_chain]
+        assert loaded_value.dtype == value.dtype
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # writing to the loaded arrays doesn't change the file
+    loaded_container.a[0, 0] = 9.0
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, slice(1))
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), np.array([[1.0, 2.0]]))
+    os.remove(save_filepath)
+
+    # compressed datasets are read
+    container.cont_to_disk_as_hdf5(save_filepath, compression="gzip")
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, mmap=True)
+    for key_chain, value in container.cont_to_iterator():
+        assert np.array_equal(
+            ivy.to_numpy(loaded_container[key_chain]), ivy.to_numpy(value)
+        )
+    os.remove(save_filepath)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("mmap", [False, True])
+def test_container_to_and_from_disk_as_npz(compress, mmap, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.npz"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([1, 2], dtype="int32", device=on_device),
+                "d": ivy.array([True, False], device=on_device),
+            },
+        }
+    )
+    container.cont_to_disk_as_npz(save_filepath, compress=compress)
+    loaded_container = Container.cont_from_disk_as_npz(save_filepath, mmap=mmap)
+    assert loaded_container.cont_all_key_chains() == container.cont_all_key_chains()
+    for key_chain, value in container.cont_to_iterator():
+        loaded_value = loaded_container[key_chain]
+        assert loaded_value.dtype == value.dtype
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+    os.remove(save_filepath)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("num_workers", [None, 2])
+def test_container_to_and_from_disk_as_checkpoint(mmap, num_workers, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_dirpath = "container_on_disk_checkpoint"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device),
+            "b": {
+                "c": ivy.array([1, 2], dtype="int32", device=on_device),
+                "d": ivy.array([True, False], device=on_device),
+                "e": ivy.array(5.0, device=on_device),
+            },
+            "f": {"g": ivy.zeros((0, 3), device=on_device), "h": "hello"},
+        }
+    )
+
+    # each array is larger than the shard size, so is saved in a shard of its own
+    container.cont_to_disk_as_checkpoint(save_dirpath, shard_size=4)
+    assert len(os.listdir(save_dirpath)) == 5
+    loaded_container = Container.cont_from_disk_as_checkpoint(
+        save_dirpath, mmap=mmap, num_workers=num_workers
+    )
+    assert loaded_container.cont_all_key_chains() == container.cont_all_key_chains()
+    assert loaded_container.f.h == "hello"
+    for key_chain, value in container.cont_to_iterator():
+        if key_chain == "f/h":
+            continue
+        loaded_value = loaded_container[key_chain]
+        assert loaded_value.dtype == value.dtype
+        assert loaded_value.shape == value.shape
+        assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # writing to the loaded arrays doesn't change the file
+    loaded_container.a[0, 0] = 9.0
+    loaded_container = Container.cont_from_disk_as_checkpoint(save_dirpath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), ivy.to_numpy(container.a))
+
+    # partial loading by key chain
+    loaded_container = Container.cont_from_disk_as_checkpoint(
+        save_dirpath, key_chains=["b/c", "f"]
+    )
+    assert loaded_container.cont_all_key_chains() == ["b/c", "f/g", "f/h"]
+    shutil.rmtree(save_dirpath)
+
+
 def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     if ivy.current_backend_str() == "tensorflow":
         # container disk saving requires eager execution
@@ -2580,6 +2801,55 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+@pytest.mark.parametrize("out_of_place", [False, True])
+def test_container_shuffle_h5_file_out_of_core(out_of_place, on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    out_filepath = "container_on_disk_shuffled.hdf5" if out_of_place else None
+    data = np.arange(100)
+    container = Container(
+        {
+            "a": ivy.array(data, dtype="float32", device=on_device),
+            "b": {
+                "c": ivy.array(data * 2, dtype="int32", device=on_device),
+                "d": ivy.array(np.stack([data] * 3, -1), device=on_device),
+            },
+        }
+    )
+    container.cont_to_disk_as_hdf5(save_filepath)
+
+    # the budget only holds 10 rows of b/d, their permuted copy and their indices
+    Container.shuffle_h5_file(save_filepath, out_filepath=out_filepath, max_memory=560)
+    container_shuffled = Container.cont_from_disk_as_hdf5(
+        out_filepath if out_of_place else save_filepath
+    )
+    a = ivy.to_numpy(container_shuffled.a)
+    assert not np.array_equal(a, data)
+    assert np.array_equal(np.sort(a), data)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.c), a * 2)
+    assert np.array_equal(ivy.to_numpy(container_shuffled.b.d), np.stack([a] * 3, -1))
+    if out_of_place:
+        container_loaded = Container.cont_from_disk_as_hdf5(save_filepath)
+        assert np.array_equal(ivy.to_numpy(container_loaded.a), data)
+        os.remove(out_filepath)
+    os.remove(save_filepath)
+
+
+def test_container_shuffle_h5_file_budget_counts_indices():
+    h5py = pytest.importorskip("h5py")
+    from ivy.data_classes.container.base import _h5_shuffle_plans
+
+    save_filepath = "container_on_disk.hdf5"
+    with h5py.File(save_filepath, "w") as f:
+        dataset = f.create_dataset("a", data=np.arange(100, dtype=np.uint8))
+        # 2 bytes of rows and 8 bytes of indices for each of the 100 rows
+        assert _h5_shuffle_plans([dataset], 1000)[100] is None
+        assert _h5_shuffle_plans([dataset], 999)[100] is not None
+    os.remove(save_filepath)
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -3386,6 +3656,21 @@ def test_container_trim_key(on_device):
     assert trimmed_key == "adg"
 
 
+def test_container_instance_method_trampolines(on_device):
+    container = Container(
+        a=ivy.array([1.0], device=on_device), b=ivy.array([2.0, 3.0], device=on_device)
+    )
+    # self is spliced in the slot of the container argument, here the second one
+    ret = container.default_device()
+    assert ret.a == ivy.dev(container.a) and ret.b == ivy.dev(container.b)
+    # and here the first one, matching the static method
+    x2 = ivy.array([1], device=on_device)
+    ret = container.promote_types_of_inputs(x2)
+    static_ret = Container.static_promote_types_of_inputs(container, x2)
+    assert ivy.all(ret.b[0] == static_ret.b[0])
+    assert ivy.dtype(ret.b[1]) == ivy.dtype(static_ret.b[1])
+
+
 def test_container_inplace(on_device):
     container0 = Container(
         {
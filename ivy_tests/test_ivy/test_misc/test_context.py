@@ -0,0 +1,104 @@
+# global
+import asyncio
+import threading
+
+# local
+import ivy
+from ivy.utils.context import ContextStack
+
+
+def test_context_stack():
+    stack = ContextStack("stack", [1])
+    stack.append(2)
+    stack.extend([3, 4])
+    assert stack == [1, 2, 3, 4]
+    assert stack[-1] == 4 and len(stack) == 4 and 3 in stack
+    assert stack.pop() == 4
+    assert stack.pop(0) == 1
+    assert list(stack) == stack.copy() == [2, 3]
+    stack.clear()
+    assert not stack
+
+    # threads start from the stack of the main thread, and don't change it
+    stack.append("main")
+
+    def push():
+        assert stack == ["main"]
+        stack.append("thread")
+        assert stack == ["main", "thread"]
+
+    thread = threading.Thread(target=push)
+    thread.start()
+    thread.join()
+    assert stack == ["main"]
+
+
+def test_context_stacks_in_asyncio_tasks():
+    async def task(dtype):
+        ivy.set_default_float_dtype(dtype)
+        await asyncio.sleep(0)
+        ret = ivy.default_float_dtype()
+        ivy.unset_default_float_dtype()
+        return ret
+
+    async def main():
+        return await asyncio.gather(*(task(d) for d in ["float16", "float64"] * 8))
+
+    stack = list(ivy.default_float_dtype_stack)
+    assert asyncio.run(main()) == ["float16", "float64"] * 8
+    assert ivy.default_float_dtype_stack == stack
+
+
+def test_context_stacks_across_threads():
+    num_threads = 32
+    iterations = 50
+    float_dtypes = ["float16", "float32", "float64"]
+    int_dtypes = ["int8", "int16", "int32", "int64"]
+    barrier = threading.Barrier(num_threads)
+    errors = []
+    stacks = [
+        ivy.default_device_stack,
+        ivy.default_dtype_stack,
+        ivy.default_float_dtype_stack,
+        ivy.default_int_dtype_stack,
+        ivy.nan_policy_stack,
+        ivy.array_mode_stack,
+        ivy.nestable_mode_stack,
+    ]
+    before = [list(stack) for stack in stacks]
+
+    def worker(i):
+        float_dtype = float_dtypes[i % len(float_dtypes)]
+        int_dtype = int_dtypes[i % len(int_dtypes)]
+        mode = i % 2 == 0
+        try:
+            barrier.wait()
+            for _ in range(iterations):
+                ivy.set_default_device("cpu")
+                ivy.set_default_float_dtype(float_dtype)
+                ivy.set_default_int_dtype(int_dtype)
+                ivy.set_nan_policy("warns" if mode else "nothing")
+                ivy.set_array_mode(mode)
+                ivy.set_nestable_mode(mode)
+                x = ivy.array([1.0, 2.0])
+                assert ivy.dtype(x) == float_dtype
+                assert ivy.default_int_dtype() == int_dtype
+                assert ivy.get_nan_policy() == ("warns" if mode else "nothing")
+                assert ivy.get_array_mode() is mode
+                assert ivy.get_nestable_mode() is mode
+                ivy.unset_nestable_mode()
+                ivy.unset_array_mode()
+                ivy.unset_nan_policy()
+                ivy.unset_default_int_dtype()
+                ivy.unset_default_float_dtype()
+                ivy.unset_default_device()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors[0]
+    assert [list(stack) for stack in stacks] == before
@@ -0,0 +1,84 @@
+# global
+import numpy as np
+import pytest
+
+# local
+import ivy
+
+
+def _producer(i):
+    return {
+        "x": np.full((2, 3), i, np.float32),
+        "y": {"z": np.arange(i + 1, dtype=np.int64)},
+        "i": i,
+    }
+
+
+def _producer_until_5(i):
+    return None if i == 5 else {"x": np.array([i])}
+
+
+def _failing_producer(i):
+    if i == 2:
+        raise ValueError("bad batch")
+    return {"x": np.array([i])}
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+@pytest.mark.parametrize("prefetch", [2, 4])
+def test_loader(num_workers, prefetch):
+    # the slots fit the largest batch, whose y/z has 8 elements
+    loader = ivy.data.Loader(
+        _producer,
+        num_batches=8,
+        num_workers=num_workers,
+        prefetch=prefetch,
+        slot_size=256,
+    )
+    assert len(loader) == 8
+    for epoch in range(2):
+        num_batches = 0
+        for i, batch in enumerate(loader):
+            assert isinstance(batch, ivy.Container)
+            assert batch.i == i
+            assert batch.x.shape == (2, 3)
+            assert np.array_equal(ivy.to_numpy(batch.x), np.full((2, 3), i))
+            assert np.array_equal(ivy.to_numpy(batch.y.z), np.arange(i + 1))
+            num_batches += 1
+        assert num_batches == 8
+    loader.close()
+
+
+def test_loader_until_none():
+    with ivy.data.Loader(_producer_until_5, num_workers=2) as loader:
+        xs = [ivy.to_numpy(batch.x)[0] for batch in loader]
+    assert xs == [0, 1, 2, 3, 4]
+
+
+def test_loader_batch_larger_than_slot():
+    # the slots are sized to the first batch, with a y/z of a single element, which
+    # fits 8 elements once aligned, unlike the 9 of the last batch
+    with ivy.data.Loader(_producer, num_batches=9) as loader:
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            for _ in loader:
+                pass
+
+
+def test_loader_worker_error():
+    with ivy.data.Loader(_failing_producer, num_batches=4) as loader:
+        with pytest.raises(ivy.utils.exceptions.IvyException, match="bad batch"):
+            for _ in loader:
+                pass
+
+
+def test_loader_keeps_referenced_batches():
+    # the last 3 batches are kept while iterating, which the 4 slots fit, and their
+    # slots must not be reused until they are dropped
+    with ivy.data.Loader(_producer, num_batches=8, prefetch=4, slot_size=256) as loader:
+        kept = list()
+        for i, batch in enumerate(loader):
+            kept = (kept + [(i, batch)])[-3:]
+            for j, kept_batch in kept:
+                assert kept_batch.i == j
+                assert np.array_equal(ivy.to_numpy(kept_batch.x), np.full((2, 3), j))
+                assert np.array_equal(ivy.to_numpy(kept_batch.y.z), np.arange(j + 1))
@@ -37,6 +37,20 @@ def test_handle_array_like_without_promotion(fn, x, expected_type):
     assert isinstance(handle_array_like_without_promotion(fn)(x), expected_type)
 
 
+@pytest.mark.parametrize(
+    ("fn", "x", "expected_type"),
+    [
+        (_fn1, (1, 2), tuple),
+        (_fn2, (1, 2), ivy.Array),
+        (_fn2, None, type(None)),
+        (_fn2, ivy.Container(a=ivy.array([1, 2])), ivy.Container),
+        (_fn3, [1, 2], list),
+    ],
+)
+def test_handle_array_like_without_promotion_kwargs(fn, x, expected_type):
+    assert isinstance(handle_array_like_without_promotion(fn)(x=x), expected_type)
+
+
 def test_outputs_to_ivy_arrays():
     assert isinstance(
         ivy.outputs_to_ivy_arrays(_fn1)(ivy.to_native(ivy.array([2.0]))), ivy.Array
@@ -145,3 +159,108 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+def _fn8(x, /, *, out=None):
+    return ivy.native_array(x) + 1
+
+
+@pytest.mark.parametrize(
+    ("fn", "expected"),
+    [(_fn1, False), (_fn2, True), (_fn3, False), (_fn4, False), (_fn8, False)],
+)
+def test_has_array_like_params(fn, expected):
+    assert ivy.func_wrapper._has_array_like_params(fn) == expected
+
+
+def test_fuse_decorators():
+    decorators = [
+        "inputs_to_native_arrays",
+        "outputs_to_ivy_arrays",
+        "handle_out_argument",
+        "handle_nestable",
+    ]
+    fused = ivy.func_wrapper._fuse_decorators(_fn8, decorators)
+    for attr in decorators:
+        assert getattr(fused, attr)
+
+    # plain arrays go through the lean chain
+    x = ivy.array([1.0, 2.0])
+    assert ivy.array_equal(fused(x), ivy.array([2.0, 3.0]))
+
+    # containers and out arguments go through the full chain
+    ret = fused(ivy.Container(a=x, b=[x]))
+    assert isinstance(ret, ivy.Container)
+    assert ivy.array_equal(ret.a, ivy.array([2.0, 3.0]))
+    out = ivy.zeros(2)
+    ret = fused(x, out=out)
+    assert ret is out
+    assert ivy.array_equal(out, ivy.array([2.0, 3.0]))
+
+
+def test_overrides_array_function():
+    class _Overriding:
+        def __ivy_array_function__(self, func, types, args, kwargs):
+            return NotImplemented
+
+    x = ivy.array([1.0, 2.0])
+    assert ivy.func_wrapper._overrides_array_function(_Overriding())
+    for arg in (None, 1.0, x, ivy.to_native(x), ivy.Container(a=x, b={"c": x})):
+        assert not ivy.func_wrapper._overrides_array_function(arg)
+
+
+def _nests_with_containers():
+    x = ivy.array([1.0, 2.0])
+    cont = ivy.Container(a=x)
+    return [
+        ((x,), {}),
+        ((x, [x, (x, None)]), {"axis": 0}),
+        (([x, {"k": [x]}],), {"out": None}),
+        ((cont,), {}),
+        ((x,), {"y": cont}),
+        (([x, (x, [cont])],), {}),
+        (({"a": {"b": cont}},), {}),
+        ((x, {"a": [1, 2]}), {"y": [[[cont]]]}),
+        (((), [], {}), {}),
+        (("abc", 1, 2.0, None), {"dtype": "float32"}),
+    ]
+
+
+@pytest.mark.parametrize("args_kwargs", _nests_with_containers())
+def test_contains_container(args_kwargs):
+    args, kwargs = args_kwargs
+    for nest in (args, kwargs):
+        assert ivy.func_wrapper._contains_container(nest) == ivy.nested_any(
+            nest, ivy.is_ivy_container, check_nests=True
+        )
+
+
+def _fn9(x, y=None):
+    return x + 1 if y is None else x + y
+
+
+@pytest.mark.parametrize("nestable_mode", [True, False])
+def test_handle_nestable(nestable_mode):
+    fn = ivy.func_wrapper.handle_nestable(_fn9)
+    x = ivy.array([1.0, 2.0])
+    cont = ivy.Container(a=x, b=ivy.array([3.0]))
+    ivy.set_nestable_mode(nestable_mode)
+    try:
+        assert ivy.array_equal(fn(x), ivy.array([2.0, 3.0]))
+        if nestable_mode:
+            # containers are detected positionally, by keyword and inside nests
+            ret = fn(cont)
+            assert ivy.array_equal(ret.a, ivy.array([2.0, 3.0]))
+            assert ivy.array_equal(ret.b, ivy.array([4.0]))
+            ret = fn(x, y=cont)
+            assert ivy.array_equal(ret.a, ivy.array([2.0, 4.0]))
+            # repeated container calls reuse the same dispatch
+            ret = fn(cont)
+            assert ivy.array_equal(ret.b, ivy.array([4.0]))
+        else:
+            # containers are passed straight through to the function
+            with patch.object(ivy.Container, "cont_multi_map_in_function") as multi_map:
+                fn(cont)
+                multi_map.assert_not_called()
+    finally:
+        ivy.unset_nestable_mode()
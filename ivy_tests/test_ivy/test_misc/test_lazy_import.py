@@ -0,0 +1,40 @@
+# global
+import os
+import subprocess
+import sys
+
+# local
+import ivy
+from ivy.utils.dynamic_import import LazyModule
+
+
+def test_lazy_module():
+    initialized = list()
+    json = LazyModule("json", on_import=initialized.append)
+    assert json.__name__ == "json" and not initialized
+    assert json.loads("[1, 2]") == [1, 2]
+    assert json.dumps([]) == "[]"
+    assert len(initialized) == 1 and initialized[0] is sys.modules["json"]
+
+
+def test_import_ivy_is_lazy():
+    # the repository root, as ivy.__file__ is the one of the backend which is set
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), *[".."] * 3))
+    script = (
+        "import sys, ivy; import ivy.functional.frontends.numpy; "
+        "print(' '.join(m for m in ['einops', 'h5py', 'psutil', 'pynvml', "
+        "'ivy.functional.frontends.torch', 'ivy.functional.frontends.jax'] "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", script],
+        cwd=root,
+        env=dict(os.environ, PYTHONPATH=root),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert out.strip() == ""
+    # the lazy modules are imported on first use
+    assert ivy.functional.ivy.device.psutil.cpu_count() >= 1
+    assert "psutil" in sys.modules
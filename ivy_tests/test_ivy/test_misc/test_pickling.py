@@ -61,3 +61,31 @@ def test_pickle_to_and_from_disk(dtype_and_x, on_device):
 
     # check for equality
     assert np.allclose(ivy.to_numpy(x), ivy.to_numpy(unpickled_arr))
+
+
+# pickling array and container test with out-of-band buffers
+def test_pickle_out_of_band(on_device):
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]], device=on_device)
+    cont = ivy.Container(
+        {
+            "a": x,
+            "b": {"c": ivy.to_native(ivy.copy_array(x)), "d": "text"},
+        }
+    )
+    backend_stack_len = len(ivy.backend_stack)
+    for obj in [x, cont]:
+        buffers = list()
+        pickled = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        unpickled = pickle.loads(pickled, buffers=buffers)
+        assert len(buffers) == (1 if obj is x else 2)
+        assert len(ivy.backend_stack) == backend_stack_len
+        if obj is x:
+            assert isinstance(unpickled, ivy.Array)
+            assert unpickled.backend == x.backend
+            assert np.array_equal(ivy.to_numpy(unpickled), ivy.to_numpy(x))
+        else:
+            assert isinstance(unpickled.a, ivy.Array)
+            assert ivy.is_native_array(unpickled.b.c)
+            assert unpickled.b.d == "text"
+            assert np.array_equal(ivy.to_numpy(unpickled.a), ivy.to_numpy(x))
+            assert np.array_equal(ivy.to_numpy(unpickled.b.c), ivy.to_numpy(x))
@@ -1,11 +1,16 @@
 # Global
+import asyncio
+import os
+import sys
 import pytest
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 from hypothesis import strategies as st, given, settings, HealthCheck
 
 # Local
 import ivy
 import numpy as np
+from ivy.utils.backend import ast_helpers
 from ivy.utils.backend.handler import _backend_dict
 
 
@@ -62,3 +67,90 @@ def test_with_backend_array(backend_fw):
     ivy.set_backend(backend_fw.backend)
     x = ivy.array([1, 2, 3, 4])
     assert np.allclose(x._data, local_x._data)
+
+
+def test_transfer(backend_fw):
+    local_ivy = ivy.with_backend(backend_fw.backend, cached=True)
+    x = np.arange(6, dtype=np.float32).reshape(2, 3)
+    native = ivy.transfer(x, backend=backend_fw.backend)
+    assert local_ivy.is_native_array(native)
+    local_x = ivy.transfer(x, backend=local_ivy)
+    assert isinstance(local_x, local_ivy.Array)
+    assert np.allclose(local_ivy.to_numpy(local_x), x)
+    # and back to numpy, sharing memory with the input for host arrays
+    ret = local_ivy.transfer(local_x, backend="numpy")
+    assert isinstance(ret, np.ndarray)
+    assert np.allclose(ret, x)
+    if backend_fw.backend in ("numpy", "torch"):
+        assert np.shares_memory(ret, x)
+    # read-only arrays can't be exported through dlpack, and are copied
+    x.flags.writeable = False
+    assert np.allclose(ivy.transfer(x, backend=local_ivy).to_numpy(), x)
+
+
+def test_backend_pool(backend_fw):
+    pool = ivy.BackendPool(backend_fw.backend, size=2)
+    assert pool.backends == [backend_fw.backend] and pool.size == 2
+    backend_stack = list(ivy.backend_stack)
+
+    def mean(local_ivy, x):
+        assert local_ivy.is_local()
+        assert local_ivy.current_backend_str() == backend_fw.backend
+        return local_ivy.mean(local_ivy.array(x))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(pool.run, backend_fw.backend, mean, [i, i + 2.0])
+            for i in range(32)
+        ]
+        rets = [future.result() for future in futures]
+    assert [float(ret.to_numpy()) for ret in rets] == [i + 1.0 for i in range(32)]
+
+    async def run_all():
+        return await asyncio.gather(
+            *(
+                pool.run_async(backend_fw.backend, mean, [i, i + 2.0], native=True)
+                for i in range(8)
+            )
+        )
+
+    rets = asyncio.run(run_all())
+    assert all(not isinstance(ret, ivy.Array) for ret in rets)
+    assert pool.available(backend_fw.backend) == 2
+    assert ivy.backend_stack == backend_stack
+
+    with pool.acquire(backend_fw.backend), pool.acquire(backend_fw.backend):
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            with pool.acquire(backend_fw.backend, timeout=0.01):
+                pass
+
+
+def test_with_backend_bytecode_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "dont_write_bytecode", False)
+    filename = str(tmp_path / "module.py")
+    with open(filename, "w") as f:
+        f.write("import ivy\nx = 1\n")
+    code = ast_helpers.IvyLoader(filename)._get_code()
+    ast_helpers._compiled_modules_cache.pop(filename)
+    assert os.path.exists(ast_helpers._cached_path(filename))
+    key = ast_helpers._cache_key(filename)
+    assert ast_helpers._load_cached(filename, key) == code
+
+    # the cached code is invalidated when the source changes
+    with open(filename, "w") as f:
+        f.write("import ivy\nx = 22\n")
+    assert ast_helpers._load_cached(filename, ast_helpers._cache_key(filename)) is None
+    assert ast_helpers.IvyLoader(filename)._get_code() != code
+    ast_helpers._compiled_modules_cache.pop(filename)
+
+    # and when the transform changes
+    key = ast_helpers._cache_key(filename)
+    assert ast_helpers._load_cached(filename, key) is not None
+    monkeypatch.setattr(
+        ast_helpers, "_transform_key", ast_helpers._transform_key + ("changed",)
+    )
+    assert ast_helpers._load_cached(filename, ast_helpers._cache_key(filename)) is None
+
+    # the code bound to local ivy instances is not kept in memory
+    ast_helpers.IvyLoader(filename)._get_code(local_ivy_id=123)
+    assert filename not in ast_helpers._compiled_modules_cache
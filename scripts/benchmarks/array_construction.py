@@ -0,0 +1,82 @@
+"""
+Benchmark of the wall time and memory of constructing many ``ivy.Array`` instances.
+
+A list of ``ivy.Array`` instances wrapping small native arrays is built and kept
+alive, reporting the construction time and the growth in resident set size, which
+covers both the instances and the metadata they hold. Optionally, the metadata of
+each array is then read, which is computed lazily on first access. With
+``--dynamic-backend`` the backend is set dynamically first, after which the arrays
+with a dynamic backend are tracked when constructed, to be converted when the backend
+changes again.
+
+Usage: python scripts/benchmarks/array_construction.py --num-arrays 1000000
+"""
+import argparse
+import time
+
+import ivy
+
+
+def _rss():
+    # resident set size in bytes, from the second field of /proc/self/statm
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def array_construction_benchmark(
+    num_arrays=1_000_000, backend="numpy", access_metadata=False, dynamic=False
+):
+    """
+    Time the construction of ``ivy.Array`` instances and measure their memory.
+
+    Parameters
+    ----------
+    num_arrays
+        the number of arrays to construct.
+    backend
+        the backend to construct the arrays with.
+    access_metadata
+        whether to also read the dtype, device, size, itemsize and strides of
+        every array after constructing them.
+    dynamic
+        whether to set the backend dynamically, such that the arrays are tracked.
+
+    Returns
+    -------
+    ret
+        dict with the construction time in seconds, the time to access the
+        metadata in seconds if ``access_metadata`` is set, and the growth in
+        resident set size in bytes.
+    """
+    ivy.set_backend(backend, dynamic=dynamic)
+    native = [ivy.to_native(ivy.ones((2,))) for _ in range(16)]
+    rss = _rss()
+    start = time.perf_counter()
+    arrays = [ivy.Array(native[i % 16]) for i in range(num_arrays)]
+    results = {"construction": time.perf_counter() - start}
+    if access_metadata:
+        start = time.perf_counter()
+        for x in arrays:
+            x.dtype, x.device, x.size, x.itemsize, x.strides
+        results["metadata"] = time.perf_counter() - start
+    results["rss"] = _rss() - rss
+    del arrays
+    ivy.unset_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-arrays", type=int, default=1_000_000)
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--access-metadata", action="store_true")
+    parser.add_argument("--dynamic-backend", action="store_true")
+    args = parser.parse_args()
+    results = array_construction_benchmark(
+        args.num_arrays, args.backend, args.access_metadata, args.dynamic_backend
+    )
+    print("construction: {:.2f} s".format(results["construction"]))
+    if "metadata" in results:
+        print("metadata:     {:.2f} s".format(results["metadata"]))
+    print("rss growth:   {:.1f} MB".format(results["rss"] / 2**20))
+    print("per array:    {:.0f} B".format(results["rss"] / args.num_arrays))
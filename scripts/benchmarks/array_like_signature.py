@@ -0,0 +1,86 @@
+"""
+Benchmark of `handle_array_like_without_promotion` over the elementwise ops.
+
+For every function in `ivy/functional/ivy/elementwise.py` carrying the decorator,
+the per-call time of the decorator layer is measured on a stub sharing the
+signature of the op, alongside the cost of inspecting the signature of the
+decorated op, which used to be paid on every call.
+
+Usage: python scripts/benchmarks/array_like_signature.py
+"""
+import argparse
+import inspect
+import timeit
+
+import ivy
+from ivy.func_wrapper import handle_array_like_without_promotion
+from ivy.functional.ivy import elementwise
+
+
+def _stub_with_signature(fn):
+    def _stub(*args, **kwargs):
+        return args
+
+    _stub.__signature__ = inspect.signature(fn)
+    return _stub
+
+
+def _time_per_call(fn, args, number):
+    return min(timeit.repeat(lambda: fn(*args), number=number, repeat=5)) / number
+
+
+def array_like_signature_benchmark(number=2000):
+    """
+    Time the decorator layer and the avoided signature inspection for each op.
+
+    Parameters
+    ----------
+    number
+        number of calls to average over for each timing.
+
+    Returns
+    -------
+    ret
+        dict mapping each op to its (decorator overhead, signature inspection)
+        time per call in seconds.
+    """
+    ivy.set_backend("numpy")
+    x = ivy.array([1.0, 2.0])
+    results = dict()
+    for name, fn in vars(elementwise).items():
+        if not inspect.isfunction(fn) or not getattr(
+            fn, "handle_array_like_without_promotion", False
+        ):
+            continue
+        stub = _stub_with_signature(fn)
+        args = tuple(
+            x
+            for param in inspect.signature(fn).parameters.values()
+            if param.kind == param.POSITIONAL_ONLY
+        )
+        wrapped = handle_array_like_without_promotion(stub)
+        results[name] = (
+            _time_per_call(wrapped, args, number) - _time_per_call(stub, args, number),
+            _time_per_call(inspect.signature, (fn,), number),
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+    results = array_like_signature_benchmark(args.number)
+    print("{:<28}{:>16}{:>20}".format("op", "decorator (us)", "signature (us)"))
+    for name, (overhead, signature) in results.items():
+        print("{:<28}{:>16.2f}{:>20.2f}".format(name, overhead * 1e6, signature * 1e6))
+    total_overhead = sum(r[0] for r in results.values())
+    total_signature = sum(r[1] for r in results.values())
+    print(
+        "\n{} ops, mean decorator overhead {:.2f} us, mean saving {:.2f} us".format(
+            len(results),
+            total_overhead / len(results) * 1e6,
+            total_signature / len(results) * 1e6,
+        )
+    )
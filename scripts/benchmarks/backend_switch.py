@@ -0,0 +1,87 @@
+"""
+Benchmark of the latency of switching the global backend.
+
+The wrapped ivy namespace of each backend is built the first time the backend is set,
+and cached such that later switches only update the ivy namespace. The set and unset
+cycle is timed both from an empty backend stack and on top of another backend, as is
+done by ``ivy.Module`` when it switches to numpy with ``ContextManager("numpy")``,
+with the cache and with the cache cleared before every switch, which rebuilds the
+namespace from scratch as every switch used to.
+
+Usage: python scripts/benchmarks/backend_switch.py --backend numpy torch
+"""
+import argparse
+import time
+
+import ivy
+from ivy.utils.backend import handler
+
+
+def _measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def backend_switch_benchmark(backend="numpy", base_backend=None, repeat=100):
+    """
+    Time the set and unset cycle of a backend, with and without the cached namespaces.
+
+    Parameters
+    ----------
+    backend
+        the backend to set and unset.
+    base_backend
+        the backend to set underneath, or None to switch from an empty backend stack.
+    repeat
+        number of cycles to average the latency over.
+
+    Returns
+    -------
+    ret
+        the (cached, uncached) latency of a set and unset cycle.
+    """
+    if base_backend is not None:
+        ivy.set_backend(base_backend)
+
+    def cycle():
+        with ivy.utils.backend.ContextManager(backend):
+            pass
+
+    def uncached_cycle():
+        handler._backend_namespaces.clear()
+        ivy.set_backend(backend)
+        handler._backend_namespaces.clear()
+        ivy.previous_backend()
+
+    results = (_measure(cycle, repeat), _measure(uncached_cycle, repeat))
+    ivy.unset_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", nargs="*", default=["numpy"])
+    parser.add_argument("--base-backend", default=None)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:<10}{:>14}{:>16}{:>10}".format(
+            "backend", "base", "cached (ms)", "uncached (ms)", "speedup"
+        )
+    )
+    for backend in args.backend:
+        cached, uncached = backend_switch_benchmark(
+            backend, args.base_backend, args.repeat
+        )
+        print(
+            "{:<10}{:<10}{:>14.3f}{:>16.3f}{:>10.1f}".format(
+                backend,
+                str(args.base_backend),
+                cached * 1e3,
+                uncached * 1e3,
+                uncached / cached,
+            )
+        )
@@ -0,0 +1,129 @@
+"""
+Benchmark of the latency and peak memory of chunked scaled dot product attention.
+
+Long-sequence CPU inference is benchmarked with the numpy backend, comparing the
+default ``scaled_dot_product_attention``, which materialises the full query-key
+similarity matrix, against the chunked implementation, which iterates over blocks
+of keys with an online softmax. Peak memory is measured with ``tracemalloc``, which
+numpy reports its array allocations to.
+
+Usage: python scripts/benchmarks/chunked_attention.py --seq-lengths 2048 8192
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+
+
+def _measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    latency = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def chunked_attention_benchmark(
+    seq_lengths=(2048, 8192),
+    chunk_sizes=(256, 1024),
+    batch=1,
+    num_heads=8,
+    head_dim=64,
+    masked=False,
+    repeat=1,
+):
+    """
+    Time the default and chunked attention and measure their peak memory.
+
+    Parameters
+    ----------
+    seq_lengths
+        the number of queries and keys to benchmark.
+    chunk_sizes
+        the chunk sizes to benchmark the chunked implementation with.
+    batch
+        the batch size of the inputs.
+    num_heads
+        the number of attention heads, folded into the batch dimensions.
+    head_dim
+        the feature dimension of each head.
+    masked
+        whether to pass a causal mask.
+    repeat
+        number of calls to average the latency over.
+
+    Returns
+    -------
+    ret
+        dict mapping each sequence length to a dict of the (latency, peak memory)
+        of the default implementation, keyed by ``None``, and of the chunked
+        implementation, keyed by its chunk size.
+    """
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    results = dict()
+    for seq_length in seq_lengths:
+        q, k, v = (
+            ivy.array(
+                rng.standard_normal(
+                    (batch, num_heads, seq_length, head_dim), dtype=np.float32
+                )
+            )
+            for _ in range(3)
+        )
+        mask = None
+        if masked:
+            mask = ivy.array(np.tril(np.ones((seq_length, seq_length), dtype=bool)))
+        results[seq_length] = {
+            chunk_size: _measure(
+                lambda: ivy.scaled_dot_product_attention(
+                    q, k, v, head_dim**-0.5, mask=mask, chunk_size=chunk_size
+                ),
+                repeat,
+            )
+            for chunk_size in (None, *chunk_sizes)
+        }
+    ivy.unset_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seq-lengths", nargs="*", type=int, default=[2048, 8192])
+    parser.add_argument("--chunk-sizes", nargs="*", type=int, default=[256, 1024])
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--num-heads", type=int, default=8)
+    parser.add_argument("--head-dim", type=int, default=64)
+    parser.add_argument("--masked", action="store_true")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:>10}{:>14}{:>14}".format("length", "chunk", "time (ms)", "peak (MB)")
+    )
+    results = chunked_attention_benchmark(
+        args.seq_lengths,
+        args.chunk_sizes,
+        args.batch,
+        args.num_heads,
+        args.head_dim,
+        args.masked,
+        args.repeat,
+    )
+    for seq_length, impls in results.items():
+        for chunk_size, (latency, peak) in impls.items():
+            print(
+                "{:<10}{:>10}{:>14.1f}{:>14.1f}".format(
+                    seq_length,
+                    "full" if chunk_size is None else chunk_size,
+                    latency * 1e3,
+                    peak / 2**20,
+                )
+            )
@@ -0,0 +1,89 @@
+"""
+Benchmark of mapping over the leaves of a container with many leaves.
+
+A parameter container like the ones of large models is built, with a weight and a
+bias for each of the layers of a number of blocks, and small arrays as leaves, such
+that the time is spent in the container bookkeeping rather than in the arrays. The
+maps time ``cont_map``, ``cont_multi_map`` through container arithmetic, a gradient
+descent step through a nestable function, and slicing each leaf with ``__getitem__``.
+The flat view of the container is timed as well, mapping over its leaves without
+materialising the nested container, and materialising it.
+
+Usage: python scripts/benchmarks/container_flat.py --leaves 20000 --backend torch
+"""
+import argparse
+import time
+
+import ivy
+
+
+def _measure(fn, repeat):
+    fn()
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def _params(leaves, layers_per_block=10):
+    blocks = dict()
+    for i in range(leaves // (2 * layers_per_block)):
+        blocks["block_{}".format(i)] = {
+            "layer_{}".format(j): {"w": ivy.ones((4, 4)), "b": ivy.zeros((4,))}
+            for j in range(layers_per_block)
+        }
+    return ivy.Container(blocks)
+
+
+def container_flat_benchmark(leaves=20000, backend="torch", repeat=3):
+    """
+    Time maps over the leaves of a parameter container.
+
+    Parameters
+    ----------
+    leaves
+        the number of leaves of the container.
+    backend
+        the backend of the arrays.
+    repeat
+        number of times to repeat each map, taking the best time.
+
+    Returns
+    -------
+    ret
+        dict from the name of each map to its time in seconds.
+    """
+    ivy.set_backend(backend)
+    params = _params(leaves)
+    grads = params.cont_map(lambda x, kc: x * 0.1)
+    results = {
+        "cont_map": _measure(lambda: params.cont_map(lambda x, kc: x), repeat),
+        "cont_multi_map": _measure(lambda: params - grads, repeat),
+        "gradient_descent_update": _measure(
+            lambda: ivy.gradient_descent_update(params, grads, 0.1), repeat
+        ),
+        "__getitem__": _measure(lambda: params[0:2], repeat),
+    }
+    if hasattr(params, "cont_flatten"):
+        flat = params.cont_flatten()
+        results["cont_flatten"] = _measure(params.cont_flatten, repeat)
+        results["flat map"] = _measure(lambda: flat.map(lambda x, kc: x), repeat)
+        results["flat map + to_container"] = _measure(
+            lambda: flat.map(lambda x, kc: x).to_container(), repeat
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leaves", type=int, default=20000)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print("{:<28}{:>12}".format("map", "time (ms)"))
+    results = container_flat_benchmark(args.leaves, args.backend, args.repeat)
+    for name, latency in results.items():
+        print("{:<28}{:>12.1f}".format(name, latency * 1e3))
@@ -0,0 +1,140 @@
+"""
+Benchmark of loading a checkpoint container from disk.
+
+A checkpoint of float32 leaves is saved as an uncompressed hdf5 file, laid out
+contiguously as ``Module.save_weights`` writes it, as an npz file, and as a sharded
+checkpoint. It's then loaded with ``cont_from_disk_as_hdf5``, reading each dataset
+directly and by memory-mapping it, with ``cont_from_disk_as_npz`` memory-mapping each
+array, and with ``cont_from_disk_as_checkpoint`` memory-mapping each shard. For
+each loader the time to load the container, the resident memory it takes, and the
+time to then read every leaf once are reported. The memory-mapped leaves are only
+read from disk when accessed, so their load is cheap and their memory stays in the
+page cache. The loader which built each array from a list of its elements is timed
+with ``--legacy``, which needs several times the size of the checkpoint in memory.
+
+Usage: python scripts/benchmarks/container_io.py --size-gb 2 --backend torch
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _rss():
+    # resident set size in bytes, from the second field of /proc/self/statm
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def _legacy_from_disk_as_hdf5(filepath):
+    # the loader before the datasets were read directly into numpy arrays
+    import h5py
+
+    def _load(group):
+        return {
+            key: _load(value)
+            if isinstance(value, h5py.Group)
+            else ivy.array(list(value[:]), dtype=str(value.dtype))
+            for key, value in group.items()
+        }
+
+    with h5py.File(filepath, "r") as f:
+        return ivy.Container(_load(f))
+
+
+def container_io_benchmark(size_gb=2.0, num_leaves=64, backend="torch", legacy=False):
+    """
+    Time loading a checkpoint container from disk with each of the loaders.
+
+    Parameters
+    ----------
+    size_gb
+        the size of the checkpoint in gigabytes.
+    num_leaves
+        the number of leaves of the checkpoint, split evenly between two blocks.
+    backend
+        the backend of the loaded arrays.
+    legacy
+        whether to also time the loader which built arrays from lists.
+
+    Returns
+    -------
+    ret
+        dict from the name of each loader to a dict of the load time in seconds, the
+        resident memory taken in bytes, and the time in seconds to read every leaf.
+    """
+    ivy.set_backend(backend)
+    leaf_size = int(size_gb * 2**30) // (num_leaves * 4)
+    checkpoint = ivy.Container(
+        {
+            "block_{}".format(i): {
+                "w_{}".format(j): np.full((leaf_size,), j, np.float32)
+                for j in range(num_leaves // 2)
+            }
+            for i in range(2)
+        }
+    )
+    loaders = {
+        "hdf5": lambda path: ivy.Container.cont_from_disk_as_hdf5(path + ".hdf5"),
+        "hdf5 mmap": lambda path: ivy.Container.cont_from_disk_as_hdf5(
+            path + ".hdf5", mmap=True
+        ),
+        "npz mmap": lambda path: ivy.Container.cont_from_disk_as_npz(
+            path + ".npz", mmap=True
+        ),
+        "checkpoint mmap": lambda path: ivy.Container.cont_from_disk_as_checkpoint(
+            path + "_checkpoint"
+        ),
+        "checkpoint read": lambda path: ivy.Container.cont_from_disk_as_checkpoint(
+            path + "_checkpoint", mmap=False, num_workers=4
+        ),
+    }
+    if legacy:
+        loaders["hdf5 from lists"] = lambda path: _legacy_from_disk_as_hdf5(
+            path + ".hdf5"
+        )
+    results = dict()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "checkpoint")
+        checkpoint.cont_to_disk_as_hdf5(path + ".hdf5", mode="w", resizable=False)
+        checkpoint.cont_to_disk_as_npz(path + ".npz")
+        checkpoint.cont_to_disk_as_checkpoint(path + "_checkpoint", shard_size=2**28)
+        del checkpoint
+        for name, loader in loaders.items():
+            rss = _rss()
+            start = time.perf_counter()
+            loaded = loader(path)
+            load_time = time.perf_counter() - start
+            load_rss = _rss() - rss
+            start = time.perf_counter()
+            loaded.cont_map(lambda x, kc: float(ivy.sum(x[::1024])))
+            read_time = time.perf_counter() - start
+            results[name] = {"load": load_time, "rss": load_rss, "read": read_time}
+            del loaded
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-gb", type=float, default=2.0)
+    parser.add_argument("--leaves", type=int, default=64)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+    print(
+        "{:<18}{:>12}{:>12}{:>12}".format("loader", "load (s)", "rss (MB)", "read (s)")
+    )
+    results = container_io_benchmark(
+        args.size_gb, args.leaves, args.backend, args.legacy
+    )
+    for name, result in results.items():
+        print(
+            "{:<18}{:>12.3f}{:>12.1f}{:>12.3f}".format(
+                name, result["load"], result["rss"] / 2**20, result["read"]
+            )
+        )
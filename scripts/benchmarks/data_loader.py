@@ -0,0 +1,119 @@
+"""
+Benchmark of loading batches produced by worker processes.
+
+Batches of a float32 image array and int64 labels are produced by worker processes,
+and consumed by summing one element of each. They're passed through multiprocessing
+queues, which pickle every batch, and through ``ivy.data.Loader``, which copies them
+into shared memory ring buffers and returns views of them. The throughput of each in
+batches and megabytes per second is reported.
+
+Usage: python scripts/benchmarks/data_loader.py --batch-mb 64 --workers 4
+"""
+import argparse
+import multiprocessing
+import time
+
+import numpy as np
+
+import ivy
+
+
+class _Producer:
+    def __init__(self, batch_bytes):
+        self.num_rows = max(1, batch_bytes // (3 * 224 * 224 * 4))
+
+    def __call__(self, i):
+        return {
+            "images": np.full((self.num_rows, 3, 224, 224), i, np.float32),
+            "labels": np.full((self.num_rows,), i, np.int64),
+        }
+
+
+def _queue_worker(producer, worker_idx, num_workers, num_batches, q):
+    for i in range(worker_idx, num_batches, num_workers):
+        q.put(producer(i))
+
+
+def _queues(producer, num_batches, num_workers, prefetch):
+    queues = [multiprocessing.Queue(prefetch) for _ in range(num_workers)]
+    workers = [
+        multiprocessing.Process(
+            target=_queue_worker,
+            args=(producer, w, num_workers, num_batches, queues[w]),
+            daemon=True,
+        )
+        for w in range(num_workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for i in range(num_batches):
+        yield ivy.Container(queues[i % num_workers].get()).to_ivy()
+    for worker in workers:
+        worker.join()
+
+
+def data_loader_benchmark(
+    batch_mb=64, num_batches=100, num_workers=4, prefetch=2, backend="numpy"
+):
+    """
+    Time consuming batches from worker processes.
+
+    Parameters
+    ----------
+    batch_mb
+        the size of each batch in megabytes.
+    num_batches
+        the number of batches.
+    num_workers
+        the number of worker processes.
+    prefetch
+        the number of batches each worker can run ahead of the consumer.
+    backend
+        the backend of the consumed arrays.
+
+    Returns
+    -------
+    ret
+        dict from the name of each pipeline to its throughput in batches per second.
+    """
+    ivy.set_backend(backend)
+    producer = _Producer(batch_mb * 2**20)
+    pipelines = {
+        "multiprocessing queues": lambda: _queues(
+            producer, num_batches, num_workers, prefetch
+        ),
+        "ivy.data.Loader": lambda: ivy.data.Loader(
+            producer,
+            num_batches=num_batches,
+            num_workers=num_workers,
+            prefetch=prefetch,
+        ),
+    }
+    results = dict()
+    for name, pipeline in pipelines.items():
+        start = time.perf_counter()
+        for batch in pipeline():
+            float(ivy.sum(batch.labels[:1]))
+        results[name] = num_batches / (time.perf_counter() - start)
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-mb", type=int, default=64)
+    parser.add_argument("--batches", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--prefetch", type=int, default=2)
+    parser.add_argument("--backend", default="numpy")
+    args = parser.parse_args()
+    results = data_loader_benchmark(
+        args.batch_mb, args.batches, args.workers, args.prefetch, args.backend
+    )
+    print("{:<26}{:>12}{:>12}".format("pipeline", "batches/s", "MB/s"))
+    for name, batches_per_second in results.items():
+        print(
+            "{:<26}{:>12.1f}{:>12.1f}".format(
+                name, batches_per_second, batches_per_second * args.batch_mb
+            )
+        )
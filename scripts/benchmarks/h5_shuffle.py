@@ -0,0 +1,106 @@
+"""
+Benchmark of shuffling hdf5 files of containers on disk.
+
+A file of two aligned datasets, together of the given size, is shuffled with
+``Container.shuffle_h5_file``, both into a new file and in place, for each of the
+given memory budgets. The throughput of each shuffle in megabytes per second of the
+file is reported. The shuffle which swapped the rows of each dataset one at a time
+through h5py is timed with ``--legacy``, which is only feasible for small files.
+
+Usage: python scripts/benchmarks/h5_shuffle.py --size-gb 4 --max-memory-mb 256 1024
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import h5py
+import numpy as np
+
+import ivy
+
+
+def _legacy_shuffle_h5_file(filepath, seed_value=0):
+    # the shuffle before it was done out-of-core
+    with h5py.File(filepath, "a") as f:
+        for dataset in f.values():
+            random.seed(seed_value)
+            random.shuffle(dataset)
+
+
+def _write_file(filepath, size_gb, row_size):
+    num_rows = int(size_gb * 2**30) // (row_size * 4 + 8)
+    write_rows = max(1, 2**26 // (row_size * 4))
+    with h5py.File(filepath, "w") as f:
+        x = f.create_dataset("x", (num_rows, row_size), dtype=np.float32)
+        y = f.create_dataset("y", (num_rows,), dtype=np.int64)
+        for i in range(0, num_rows, write_rows):
+            rows = np.arange(i, min(i + write_rows, num_rows))
+            x[i : i + len(rows)] = rows[:, None].astype(np.float32)
+            y[i : i + len(rows)] = rows
+    return os.path.getsize(filepath)
+
+
+def h5_shuffle_benchmark(size_gb=4.0, row_size=256, max_memories=None, legacy=False):
+    """
+    Time shuffling an hdf5 file into a new file and in place.
+
+    Parameters
+    ----------
+    size_gb
+        the size of the file in gigabytes.
+    row_size
+        the number of float32 elements of each row of the larger dataset.
+    max_memories
+        the memory budgets in bytes to shuffle with. Default is 256 MiB only.
+    legacy
+        whether to also time the shuffle which swapped rows one at a time.
+
+    Returns
+    -------
+    ret
+        dict from the name of each shuffle to its throughput in megabytes per second.
+    """
+    max_memories = [2**28] if max_memories is None else max_memories
+    results = dict()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, "data.hdf5")
+        out_filepath = os.path.join(tmpdir, "shuffled.hdf5")
+        size = _write_file(filepath, size_gb, row_size)
+        for max_memory in max_memories:
+            budget = "{} MB".format(max_memory // 2**20)
+            start = time.perf_counter()
+            ivy.Container.shuffle_h5_file(
+                filepath, out_filepath=out_filepath, max_memory=max_memory
+            )
+            seconds = time.perf_counter() - start
+            results["new file, " + budget] = size / 2**20 / seconds
+            os.remove(out_filepath)
+            start = time.perf_counter()
+            ivy.Container.shuffle_h5_file(filepath, max_memory=max_memory)
+            seconds = time.perf_counter() - start
+            results["in place, " + budget] = size / 2**20 / seconds
+        if legacy:
+            start = time.perf_counter()
+            _legacy_shuffle_h5_file(filepath)
+            results["legacy"] = size / 2**20 / (time.perf_counter() - start)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-gb", type=float, default=4.0)
+    parser.add_argument("--row-size", type=int, default=256)
+    parser.add_argument("--max-memory-mb", type=int, nargs="+", default=[256])
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+    results = h5_shuffle_benchmark(
+        args.size_gb,
+        args.row_size,
+        [mb * 2**20 for mb in args.max_memory_mb],
+        args.legacy,
+    )
+    print("{:<24}{:>14}".format("shuffle", "MB/s"))
+    for name, throughput in results.items():
+        print("{:<24}{:>14.1f}".format(name, throughput))
@@ -0,0 +1,90 @@
+"""
+Benchmark of the time and the number of modules it takes to import ivy.
+
+Each import runs in a fresh interpreter with ``-X importtime``, and the import time
+is the sum of the cumulative times of the modules it imports at the top level.
+Frontends and optional integrations such as einops, h5py, psutil and pynvml are
+imported lazily, when they are first used, so the modules loaded by each import are
+reported as well.
+
+Usage: python scripts/benchmarks/import_time.py --modules ivy ivy.functional.frontends
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+_script = """
+import json, sys
+before = set(sys.modules)
+sys.stderr.write("{marker}\\n")
+sys.stderr.flush()
+import {module}
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+_marker = "-- import --"
+_optional = ["einops", "h5py", "psutil", "pynvml", "ivy.functional.frontends.torch"]
+
+
+def _run(module):
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=root)
+    script = _script.format(module=module, marker=_marker)
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", script],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    modules = json.loads(out.stdout.strip().splitlines()[-1])
+    # lines are "import time: self [us] | cumulative | imported package", with the
+    # package indented by its depth in the tree of imports
+    report = out.stderr.split(_marker)[-1]
+    latency = 0
+    for line in report.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and not fields[2].startswith("  "):
+            latency += int(fields[1])
+    return latency / 1e6, modules
+
+
+def import_time_benchmark(module="ivy", repeat=5):
+    """
+    Time importing a module in fresh processes, and list the modules it loads.
+
+    Parameters
+    ----------
+    module
+        the module to import.
+    repeat
+        number of processes to take the best import time of.
+
+    Returns
+    -------
+    ret
+        the import time in seconds, and the names of the modules loaded.
+    """
+    times = list()
+    for _ in range(repeat):
+        latency, modules = _run(module)
+        times.append(latency)
+    return min(times), modules
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modules", nargs="*", default=["ivy"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    print("{:<36}{:>12}{:>10}  {}".format("module", "time (s)", "modules", "optional"))
+    for module in args.modules:
+        latency, modules = import_time_benchmark(module, args.repeat)
+        optional = [m for m in _optional if m in modules and m != module]
+        print(
+            "{:<36}{:>12.3f}{:>10}  {}".format(
+                module, latency, len(modules), ", ".join(optional) or "-"
+            )
+        )
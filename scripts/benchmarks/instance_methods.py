@@ -0,0 +1,83 @@
+"""
+Benchmark of the call overhead of the generated ``ivy.Array`` instance methods.
+
+Functions without a handwritten instance method get one generated at import time,
+which passes the data of the array as the argument given by the array spec of the
+function. The generated trampolines are compared against the generic method, which
+copies the arguments and inserts the data at the nested index on every call, and
+against calling the function directly.
+
+Usage: python scripts/benchmarks/instance_methods.py --backend numpy torch
+"""
+import argparse
+import time
+
+import ivy
+from ivy.data_classes.array.wrapping import _make_trampoline
+
+
+def _measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def instance_methods_benchmark(
+    backend="numpy", function_names=("to_native", "to_ivy"), repeat=100_000
+):
+    """
+    Time the generated instance methods against the generic method and the function.
+
+    Parameters
+    ----------
+    backend
+        the backend to benchmark.
+    function_names
+        the functions whose generated instance methods to benchmark, which are called
+        without any further arguments.
+    repeat
+        number of calls to average the latency over.
+
+    Returns
+    -------
+    ret
+        dict mapping each function name to the (function, trampoline, generic)
+        latency.
+    """
+    ivy.set_backend(backend)
+    x = ivy.array([1.0, 2.0, 3.0])
+    results = dict()
+    for name in function_names:
+        function = ivy.__dict__[name]
+        slot = function.array_spec[0][0]
+        generic = _make_trampoline(None)(function)
+        results[name] = (
+            _measure(lambda: function(**{slot[1]: x.data}), repeat),
+            _measure(lambda: getattr(x, name)(), repeat),
+            _measure(lambda: generic(x), repeat),
+        )
+    ivy.unset_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", nargs="*", default=["numpy"])
+    parser.add_argument("--functions", nargs="*", default=["to_native", "to_ivy"])
+    parser.add_argument("--repeat", type=int, default=100_000)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:<18}{:>16}{:>18}{:>16}".format(
+            "backend", "function", "function (us)", "trampoline (us)", "generic (us)"
+        )
+    )
+    for backend in args.backend:
+        results = instance_methods_benchmark(backend, args.functions, args.repeat)
+        for name, latencies in results.items():
+            print(
+                "{:<10}{:<18}{:>16.2f}{:>18.2f}{:>16.2f}".format(
+                    backend, name, *(latency * 1e6 for latency in latencies)
+                )
+            )
@@ -0,0 +1,108 @@
+"""
+Benchmark of the backend LSTM kernels against the compositional ``lstm_update``.
+
+``ivy.lstm_update`` dispatches to a fused backend kernel where one exists, such as
+``torch._VF.lstm`` for torch or a single-tanh loop writing into a preallocated
+output for numpy. Both are compared against the compositional implementation,
+which unrolls the time dimension through ivy functions, over sequence lengths of
+128 to 2048.
+
+Usage: python scripts/benchmarks/lstm_update.py --backend torch numpy
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+from ivy.functional.ivy import layers as ivy_layers
+
+
+def _measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def lstm_update_benchmark(
+    backend="numpy",
+    seq_lengths=(128, 256, 512, 1024, 2048),
+    batch=16,
+    channels=128,
+    repeat=3,
+):
+    """
+    Time the backend and compositional ``lstm_update`` over several sequence lengths.
+
+    Parameters
+    ----------
+    backend
+        the backend to benchmark.
+    seq_lengths
+        the lengths of the time dimension to benchmark.
+    batch
+        the batch size of the inputs.
+    channels
+        the number of input and output channels of the LSTM.
+    repeat
+        number of calls to average the latency over.
+
+    Returns
+    -------
+    ret
+        dict mapping each sequence length to the (backend, compositional) latency.
+    """
+    ivy.set_backend(backend)
+    rng = np.random.default_rng(0)
+
+    def _random(*shape):
+        return ivy.array(rng.standard_normal(shape).astype("float32") * 0.1)
+
+    kernel = _random(channels, 4 * channels)
+    recurrent_kernel = _random(channels, 4 * channels)
+    bias = _random(4 * channels)
+    init_h = _random(batch, channels)
+    init_c = _random(batch, channels)
+    results = dict()
+    for seq_length in seq_lengths:
+        x = _random(batch, seq_length, channels)
+        args = (x, init_h, init_c, kernel, recurrent_kernel)
+        results[seq_length] = tuple(
+            _measure(lambda: fn(*args, bias=bias), repeat)
+            for fn in (ivy.lstm_update, ivy_layers.lstm_update)
+        )
+    ivy.unset_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", nargs="*", default=["numpy"])
+    parser.add_argument(
+        "--seq-lengths", nargs="*", type=int, default=[128, 256, 512, 1024, 2048]
+    )
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--channels", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:>10}{:>16}{:>20}{:>10}".format(
+            "backend", "length", "kernel (ms)", "compositional (ms)", "speedup"
+        )
+    )
+    for backend in args.backend:
+        results = lstm_update_benchmark(
+            backend, args.seq_lengths, args.batch, args.channels, args.repeat
+        )
+        for seq_length, (kernel, compositional) in results.items():
+            print(
+                "{:<10}{:>10}{:>16.1f}{:>20.1f}{:>10.2f}".format(
+                    backend,
+                    seq_length,
+                    kernel * 1e3,
+                    compositional * 1e3,
+                    compositional / kernel,
+                )
+            )
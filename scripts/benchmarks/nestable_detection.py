@@ -0,0 +1,99 @@
+"""
+Micro-benchmark of the container detection done by ``handle_nestable``.
+
+Each op is timed on plain arrays with nestable mode enabled, where every call scans
+its arguments for containers, and with ``ivy.set_nestable_mode(False)``, where the
+scan is skipped entirely. The detection cost of the shallow scan is also compared
+against the generic ``ivy.nested_any`` traversal it replaces.
+
+Usage: python scripts/benchmarks/nestable_detection.py --backend numpy
+"""
+import argparse
+import timeit
+
+import ivy
+from ivy.func_wrapper import _contains_container
+
+
+_OPS = {
+    "add": lambda x: ((x, x), {}),
+    "sum": lambda x: ((x,), {"axis": 0}),
+    "concat": lambda x: (([x, x, x, x],), {"axis": 0}),
+    "stack": lambda x: (([x] * 16,), {}),
+}
+
+
+def _time_per_call(fn, args, kwargs, number):
+    return (
+        min(timeit.repeat(lambda: fn(*args, **kwargs), number=number, repeat=5))
+        / number
+    )
+
+
+def _nested_any_detection(args, kwargs):
+    return ivy.nested_any(
+        args, ivy.is_ivy_container, check_nests=True
+    ) or ivy.nested_any(kwargs, ivy.is_ivy_container, check_nests=True)
+
+
+def _shallow_detection(args, kwargs):
+    return _contains_container(args) or _contains_container(kwargs)
+
+
+def nestable_detection(backend="numpy", number=2000, ops=None):
+    """
+    Time ops with nestable mode on and off, and the detection on its own.
+
+    Parameters
+    ----------
+    backend
+        the backend to benchmark with.
+    number
+        number of calls to average over for each timing.
+    ops
+        names of the ops to benchmark, defaults to all ops in ``_OPS``.
+
+    Returns
+    -------
+    ret
+        dict mapping each op to its (nestable on, nestable off, nested_any
+        detection, shallow detection) time per call in seconds.
+    """
+    ops = ivy.default(ops, list(_OPS.keys()))
+    ivy.set_backend(backend)
+    x = ivy.random_uniform(shape=(4, 4))
+    results = dict()
+    for op in ops:
+        args, kwargs = _OPS[op](x)
+        fn = ivy.__dict__[op]
+        on = _time_per_call(fn, args, kwargs, number)
+        ivy.set_nestable_mode(False)
+        off = _time_per_call(fn, args, kwargs, number)
+        ivy.unset_nestable_mode()
+        results[op] = (
+            on,
+            off,
+            _time_per_call(_nested_any_detection, (args, kwargs), {}, number),
+            _time_per_call(_shallow_detection, (args, kwargs), {}, number),
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--ops", nargs="*", default=None)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:>12}{:>12}{:>16}{:>16}".format(
+            "op", "on (us)", "off (us)", "nested_any (us)", "shallow (us)"
+        )
+    )
+    for op, times in nestable_detection(args.backend, args.number, args.ops).items():
+        print(
+            "{:<10}{:>12.2f}{:>12.2f}{:>16.2f}{:>16.2f}".format(
+                op, *[t * 1e6 for t in times]
+            )
+        )
@@ -0,0 +1,133 @@
+"""
+Benchmark of the latency and peak memory of the numpy backend convolutions.
+
+The im2col + GEMM ``conv2d`` of the numpy backend is compared against a reference
+of the previous implementation, which tiled the sliding windows once per output
+channel before summing them, on typical ResNet layer shapes. Peak memory is measured
+with ``tracemalloc``, which numpy reports its array allocations to.
+
+Usage: python scripts/benchmarks/numpy_conv.py --batch 1
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy.functional.backends.numpy as ivy_np
+from ivy.functional.backends.numpy.layers import _pad_conv
+
+
+# name: (input height and width, input channels, kernel size, output channels, stride)
+_RESNET_SHAPES = {
+    "stem": (224, 3, 7, 64, 2),
+    "conv2_x": (56, 64, 3, 64, 1),
+    "conv3_x": (28, 128, 3, 128, 1),
+    "conv4_x": (14, 256, 3, 256, 1),
+    "conv5_x": (7, 512, 3, 512, 1),
+    "downsample": (56, 64, 1, 128, 2),
+}
+
+
+def _tiled_conv2d(x, filters, strides, padding):
+    # the previous numpy conv2d, which builds a B x OH x OW x KH x KW x I x O tensor
+    x = _pad_conv(x, filters.shape[:2], strides, padding, 2, [1, 1])
+    kh, kw, input_dim, output_dim = filters.shape
+    new_h = (x.shape[1] - kh) // strides[0] + 1
+    new_w = (x.shape[2] - kw) // strides[1] + 1
+    sub_matrices = np.lib.stride_tricks.as_strided(
+        x,
+        [x.shape[0], new_h, new_w, kh, kw, x.shape[-1]],
+        (
+            x.strides[0],
+            x.strides[1] * strides[0],
+            x.strides[2] * strides[1],
+            x.strides[1],
+            x.strides[2],
+            x.strides[3],
+        ),
+        writeable=False,
+    )
+    sub_matrices_w_output_dim = np.tile(
+        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
+    )
+    mult = sub_matrices_w_output_dim * filters.reshape(
+        [1] * 3 + [kh, kw, input_dim, output_dim]
+    )
+    return np.sum(mult, (3, 4, 5))
+
+
+def _measure(fn, repeat):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    latency = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return latency, peak
+
+
+def numpy_conv_benchmark(batch=1, repeat=3, shapes=None, reference=True):
+    """
+    Time the numpy backend conv2d and measure its peak memory on ResNet shapes.
+
+    Parameters
+    ----------
+    batch
+        the batch size of the inputs.
+    repeat
+        number of calls to average the latency over.
+    shapes
+        names of the shapes to benchmark, defaults to all shapes in
+        ``_RESNET_SHAPES``.
+    reference
+        whether to also benchmark the previous tiled implementation, which needs
+        several GB of memory for the larger shapes.
+
+    Returns
+    -------
+    ret
+        dict mapping each shape to its (latency, peak memory) for the current
+        implementation and, if ``reference`` is set, for the previous one.
+    """
+    shapes = shapes if shapes is not None else list(_RESNET_SHAPES.keys())
+    rng = np.random.default_rng(0)
+    results = dict()
+    for name in shapes:
+        size, input_dim, kernel, output_dim, stride = _RESNET_SHAPES[name]
+        x = rng.standard_normal((batch, size, size, input_dim), dtype=np.float32)
+        filters = rng.standard_normal(
+            (kernel, kernel, input_dim, output_dim), dtype=np.float32
+        )
+        results[name] = [
+            _measure(lambda: ivy_np.conv2d(x, filters, stride, "SAME"), repeat)
+        ]
+        if reference:
+            results[name].append(
+                _measure(
+                    lambda: _tiled_conv2d(x, filters, [stride] * 2, "SAME"), repeat
+                )
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--shapes", nargs="*", default=None)
+    parser.add_argument("--no-reference", action="store_true")
+    args = parser.parse_args()
+    print(
+        "{:<12}{:>14}{:>14}{:>14}{:>14}".format(
+            "shape", "gemm (ms)", "gemm (MB)", "tiled (ms)", "tiled (MB)"
+        )
+    )
+    for name, times in numpy_conv_benchmark(
+        args.batch, args.repeat, args.shapes, not args.no_reference
+    ).items():
+        row = [v for latency, peak in times for v in (latency * 1e3, peak / 2**20)]
+        print(("{:<12}" + "{:>14.1f}" * len(row)).format(name, *row))
@@ -0,0 +1,91 @@
+"""
+Benchmark matrix of the convolution algorithms of the numpy backend.
+
+Every applicable algorithm (im2col + GEMM, Winograd F(2x2, 3x3) and FFT) is timed
+over a matrix of input sizes, channels and kernel sizes, alongside the algorithm the
+autotuner of ``conv_general_dilated`` caches for that configuration.
+
+Usage: python scripts/benchmarks/numpy_conv_algorithms.py --dtype float32
+"""
+import argparse
+import itertools
+import timeit
+
+import numpy as np
+
+from ivy.functional.backends.numpy import layers as numpy_layers
+
+
+def numpy_conv_algorithms_benchmark(
+    sizes=(32, 128), channels=(4, 64), kernels=(3, 7, 15), batch=1, dtype="float32"
+):
+    """
+    Time each applicable convolution algorithm over a matrix of 2D configurations.
+
+    Parameters
+    ----------
+    sizes
+        spatial heights and widths of the inputs.
+    channels
+        numbers of input and output channels.
+    kernels
+        kernel heights and widths.
+    batch
+        the batch size of the inputs.
+    dtype
+        the dtype of the inputs and filters.
+
+    Returns
+    -------
+    ret
+        dict mapping each (size, channels, kernel) configuration to a dict of the
+        time per call in seconds of every applicable algorithm, and the name of the
+        algorithm picked by the autotuner.
+    """
+    rng = np.random.default_rng(0)
+    results = dict()
+    for size, channel, kernel in itertools.product(sizes, channels, kernels):
+        x = rng.standard_normal((batch, size, size, channel)).astype(dtype)
+        filters = rng.standard_normal((kernel, kernel, channel, channel)).astype(dtype)
+        args = (x, filters, [1, 1], [1, 1], 2)
+        times = dict()
+        for algorithm in numpy_layers._conv_algorithm_candidates(*args, 1):
+            fn = numpy_layers._conv_algorithms[algorithm]
+            times[algorithm] = min(timeit.repeat(lambda: fn(*args), number=1, repeat=3))
+        numpy_layers._conv_autotuned(*args)
+        key = numpy_layers._conv_algorithm_key(x, filters, [1, 1], [1, 1], 1)
+        results[(size, channel, kernel)] = (
+            times,
+            numpy_layers._conv_algorithm_cache[key],
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="*", type=int, default=[32, 128])
+    parser.add_argument("--channels", nargs="*", type=int, default=[4, 64])
+    parser.add_argument("--kernels", nargs="*", type=int, default=[3, 7, 15])
+    parser.add_argument("--batch", type=int, default=1)
+    parser.add_argument("--dtype", default="float32")
+    args = parser.parse_args()
+    row_format = "{:<8}{:>10}{:>8}{:>12}{:>16}{:>12}{:>12}"
+    print(
+        row_format.format(
+            "size",
+            "channels",
+            "kernel",
+            "gemm (ms)",
+            "winograd (ms)",
+            "fft (ms)",
+            "picked",
+        )
+    )
+    for (size, channel, kernel), (times, picked) in numpy_conv_algorithms_benchmark(
+        args.sizes, args.channels, args.kernels, args.batch, args.dtype
+    ).items():
+        row = [
+            "{:.2f}".format(times[a] * 1e3) if a in times else "-"
+            for a in ("gemm", "winograd", "fft")
+        ]
+        print(row_format.format(size, channel, kernel, *row, picked))
@@ -0,0 +1,123 @@
+"""
+Benchmark of sending containers of arrays between processes.
+
+A child process builds a container of the given size and sends it to the parent
+through a pipe, pickled with protocol 4, where the buffers of the arrays are copied
+into the pickle, and with protocol 5, where they are sent out-of-band as raw bytes
+next to the pickle. The time to send and unpickle each is reported. With ``--legacy``
+the arrays are also pickled through their state, as they were before they had
+``__reduce_ex__``, which sets the backend globally for every array unpickled.
+
+Usage: python scripts/benchmarks/pickle_transfer.py --size-gb 1 --backend torch
+"""
+import argparse
+import io
+import multiprocessing
+import pickle
+import time
+
+import ivy
+
+
+def _from_state(state):
+    ret = ivy.Array.__new__(ivy.Array)
+    ret.__setstate__(state)
+    return ret
+
+
+class _StatePickler(pickle.Pickler):
+    # pickles arrays through __getstate__ and __setstate__
+    def reducer_override(self, obj):
+        if isinstance(obj, ivy.Array):
+            return _from_state, (obj.__getstate__(),)
+        return NotImplemented
+
+
+def _sender(conn, size_gb, num_leaves, backend, mode):
+    ivy.set_backend(backend)
+    leaf_size = int(size_gb * 2**30) // (num_leaves * 4)
+    cont = ivy.Container(
+        {"w_{}".format(i): ivy.ones((leaf_size,)) for i in range(num_leaves)}
+    )
+    conn.send("ready")
+    conn.recv()
+    if mode == "protocol 5":
+        buffers = list()
+        conn.send_bytes(pickle.dumps(cont, protocol=5, buffer_callback=buffers.append))
+        conn.send(len(buffers))
+        for buffer in buffers:
+            conn.send_bytes(buffer.raw())
+    elif mode == "legacy":
+        f = io.BytesIO()
+        _StatePickler(f, protocol=4).dump(cont)
+        conn.send_bytes(f.getbuffer())
+    else:
+        conn.send_bytes(pickle.dumps(cont, protocol=4))
+    conn.close()
+
+
+def _receive(conn, mode):
+    data = conn.recv_bytes()
+    if mode == "protocol 5":
+        num_buffers = conn.recv()
+        buffers = [bytearray(conn.recv_bytes()) for _ in range(num_buffers)]
+        return pickle.loads(data, buffers=buffers)
+    return pickle.loads(data)
+
+
+def pickle_transfer_benchmark(
+    size_gb=1.0, num_leaves=16, backend="torch", legacy=False
+):
+    """
+    Time sending a container between processes with each way of pickling it.
+
+    Parameters
+    ----------
+    size_gb
+        the size of the container in gigabytes.
+    num_leaves
+        the number of leaves of the container.
+    backend
+        the backend of the arrays of the container.
+    legacy
+        whether to also time pickling arrays through their state.
+
+    Returns
+    -------
+    ret
+        dict from each way of pickling to the seconds to send and unpickle.
+    """
+    ivy.set_backend(backend)
+    modes = ["protocol 4", "protocol 5"] + (["legacy"] if legacy else [])
+    results = dict()
+    for mode in modes:
+        parent_conn, child_conn = multiprocessing.Pipe()
+        sender = multiprocessing.Process(
+            target=_sender, args=(child_conn, size_gb, num_leaves, backend, mode)
+        )
+        sender.start()
+        parent_conn.recv()
+        start = time.perf_counter()
+        parent_conn.send("go")
+        cont = _receive(parent_conn, mode)
+        results[mode] = time.perf_counter() - start
+        sender.join()
+        assert len(cont.cont_all_key_chains()) == num_leaves
+        del cont
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-gb", type=float, default=1.0)
+    parser.add_argument("--leaves", type=int, default=16)
+    parser.add_argument("--backend", default="torch")
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+    results = pickle_transfer_benchmark(
+        args.size_gb, args.leaves, args.backend, args.legacy
+    )
+    print("{:<14}{:>12}".format("pickling", "time (s)"))
+    for mode, seconds in results.items():
+        print("{:<14}{:>12.3f}".format(mode, seconds))
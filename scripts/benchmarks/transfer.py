@@ -0,0 +1,90 @@
+"""
+Benchmark of the latency and memory of moving large arrays between backends.
+
+``ivy.transfer`` exchanges native arrays through DLPack and the array interface, and
+is compared against going through ``to_numpy`` and ``asarray`` of the target backend,
+as arrays used to be moved. The growth in resident set size shows whether the moved
+array shares the memory of the input, or doubles it.
+
+Usage: python scripts/benchmarks/transfer.py --pairs numpy:torch torch:numpy
+"""
+import argparse
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _rss():
+    # resident set size in bytes, from the second field of /proc/self/statm
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * 4096
+
+
+def _measure(fn):
+    rss = _rss()
+    start = time.perf_counter()
+    ret = fn()
+    latency = time.perf_counter() - start
+    growth = _rss() - rss
+    del ret
+    return latency, growth
+
+
+def transfer_benchmark(source="numpy", target="torch", size=2**30):
+    """
+    Time moving an array between two backends, and measure the memory it takes.
+
+    Parameters
+    ----------
+    source
+        the backend of the array to move.
+    target
+        the backend to move the array to.
+    size
+        the size of the array in bytes.
+
+    Returns
+    -------
+    ret
+        the (latency, resident set size growth) of ``ivy.transfer`` and of going
+        through numpy with ``to_numpy`` and ``asarray``.
+    """
+    source_ivy = ivy.with_backend(source, cached=True)
+    target_ivy = ivy.with_backend(target, cached=True)
+    x = source_ivy.to_native(
+        source_ivy.asarray(np.ones(size // 4, dtype=np.float32), copy=True)
+    )
+    ivy.transfer(x[:1], backend=target_ivy)
+    results = (
+        _measure(lambda: ivy.transfer(x, backend=target_ivy)),
+        _measure(lambda: target_ivy.asarray(source_ivy.to_numpy(x))),
+    )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", nargs="*", default=["numpy:torch", "torch:numpy"])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    args = parser.parse_args()
+    print(
+        "{:<16}{:>16}{:>16}{:>16}{:>16}".format(
+            "pair", "transfer (ms)", "transfer (MB)", "copy (ms)", "copy (MB)"
+        )
+    )
+    for pair in args.pairs:
+        source, target = pair.split(":")
+        (transfer, transfer_rss), (copy, copy_rss) = transfer_benchmark(
+            source, target, args.size_mb * 2**20
+        )
+        print(
+            "{:<16}{:>16.2f}{:>16.1f}{:>16.2f}{:>16.1f}".format(
+                pair,
+                transfer * 1e3,
+                transfer_rss / 2**20,
+                copy * 1e3,
+                copy_rss / 2**20,
+            )
+        )
@@ -0,0 +1,95 @@
+"""
+Benchmark of the startup latency of ``ivy.with_backend`` in a fresh process.
+
+Local ivy instances execute the source of every ivy module with its imports
+transformed, which is cached on disk next to the standard bytecode in
+``__pycache__``. Each measurement runs in a new interpreter, cold after removing
+the cached code, and warm with the code cached by the previous run. The latency of a
+second ``with_backend`` call in the same process, which reuses the code cached in
+memory, is reported as well.
+
+Usage: python scripts/benchmarks/with_backend_startup.py --backend numpy --repeat 3
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+import ivy
+
+_script = """
+import json, sys, time
+import ivy
+start = time.perf_counter()
+ivy.with_backend(sys.argv[1])
+first = time.perf_counter() - start
+start = time.perf_counter()
+ivy.with_backend(sys.argv[1])
+print(json.dumps([first, time.perf_counter() - start]))
+"""
+
+
+def _clear_cache():
+    root = os.path.dirname(ivy.__file__)
+    pattern = os.path.join(root, "**", "__pycache__", "*.opt-ivylocal.pyc")
+    for path in glob.glob(pattern, recursive=True):
+        os.remove(path)
+
+
+def _run(backend):
+    env = dict(os.environ)
+    # the cache is written like standard bytecode, which this would disable
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    out = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", _script, backend],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def with_backend_startup_benchmark(backend="numpy", repeat=3):
+    """
+    Time ``ivy.with_backend`` in fresh processes, with and without the cached code.
+
+    Parameters
+    ----------
+    backend
+        the backend of the local ivy instance.
+    repeat
+        number of processes to take the best latency of.
+
+    Returns
+    -------
+    ret
+        the cold, warm and in-process latency of ``ivy.with_backend`` in seconds.
+    """
+    cold, warm, in_process = [], [], []
+    for _ in range(repeat):
+        _clear_cache()
+        cold.append(_run(backend)[0])
+        first, second = _run(backend)
+        warm.append(first)
+        in_process.append(second)
+    return min(cold), min(warm), min(in_process)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", nargs="*", default=["numpy"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    print(
+        "{:<10}{:>12}{:>12}{:>16}".format(
+            "backend", "cold (s)", "warm (s)", "in-process (s)"
+        )
+    )
+    for backend in args.backend:
+        cold, warm, in_process = with_backend_startup_benchmark(backend, args.repeat)
+        print(
+            "{:<10}{:>12.3f}{:>12.3f}{:>16.3f}".format(backend, cold, warm, in_process)
+        )
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of the per-call overhead added by ivy's function wrapping.
+
+Each op is timed once through the wrapped function in the ivy namespace and once
+through the raw implementation of the backend, both on small arrays so that the
+difference is dominated by the wrapping.
+
+Usage: python scripts/benchmarks/wrapper_overhead.py --backend numpy
+"""
+import argparse
+import timeit
+
+import ivy
+
+
+_OPS = {
+    "add": lambda x: (x, x),
+    "sin": lambda x: (x,),
+    "sum": lambda x: (x,),
+    "reshape": lambda x: (x, (-1,)),
+    "matmul": lambda x: (x, x),
+}
+
+
+def _time_per_call(fn, args, number):
+    return min(timeit.repeat(lambda: fn(*args), number=number, repeat=5)) / number
+
+
+def wrapper_overhead(backend="numpy", number=2000, ops=None):
+    """
+    Time the wrapped ivy functions against the raw backend functions.
+
+    Parameters
+    ----------
+    backend
+        the backend to benchmark with.
+    number
+        number of calls to average over for each timing.
+    ops
+        names of the ops to benchmark, defaults to all ops in ``_OPS``.
+
+    Returns
+    -------
+    ret
+        dict mapping each op to its (wrapped, raw) time per call in seconds.
+    """
+    ops = ivy.default(ops, list(_OPS.keys()))
+    ivy.set_backend(backend)
+    backend_module = ivy.current_backend()
+    x = ivy.random_uniform(shape=(4, 4))
+    results = dict()
+    for op in ops:
+        ivy_args = _OPS[op](x)
+        native_args = ivy.to_native(ivy_args, nested=True)
+        raw_fn = backend_module.__dict__[op]
+        while hasattr(raw_fn, "__wrapped__"):
+            raw_fn = raw_fn.__wrapped__
+        results[op] = (
+            _time_per_call(ivy.__dict__[op], ivy_args, number),
+            _time_per_call(raw_fn, native_args, number),
+        )
+    ivy.previous_backend()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="numpy")
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--ops", nargs="*", default=None)
+    args = parser.parse_args()
+    print("{:<10}{:>14}{:>14}{:>14}".format("op", "wrapped (us)", "raw (us)", "ratio"))
+    for op, (wrapped, raw) in wrapper_overhead(
+        args.backend, args.number, args.ops
+    ).items():
+        print(
+            "{:<10}{:>14.2f}{:>14.2f}{:>14.1f}".format(
+                op, wrapped * 1e6, raw * 1e6, wrapped / raw
+            )
+        )
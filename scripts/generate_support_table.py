@@ -0,0 +1,85 @@
+"""
+Precompute the dtype and device support of every function in the ivy namespace.
+
+The results of the ``function_(un)supported_*`` queries are dumped to
+``ivy/functional/ivy/support_table.json``, keyed by backend, backend version and
+function, which ivy then reads instead of recursing through the source of each
+function on first use. Entries of other backends and versions already present in
+the table are preserved.
+
+Usage: python scripts/generate_support_table.py --backends numpy torch
+"""
+import argparse
+import json
+import os
+from types import FunctionType
+
+import ivy
+from ivy.functional.ivy import data_type
+
+
+_QUERIES = (
+    "function_supported_dtypes",
+    "function_unsupported_dtypes",
+    "function_supported_devices",
+    "function_unsupported_devices",
+    "function_supported_devices_and_dtypes",
+    "function_unsupported_devices_and_dtypes",
+)
+
+
+def _to_json(ret):
+    if isinstance(ret, dict):
+        return {str(k): _to_json(v) for k, v in ret.items()}
+    return sorted(str(v) for v in ret)
+
+
+def generate_support_table(backend):
+    """
+    Compute the support table of all the public functions for `backend`.
+
+    Parameters
+    ----------
+    backend
+        the backend to compute the table for.
+
+    Returns
+    -------
+    ret
+        the backend version and the table, mapping each query to the results
+        for every function.
+    """
+    ivy.set_backend(backend)
+    _, version = data_type._backend_and_version()
+    table = {query: dict() for query in _QUERIES}
+    for name, fn in ivy.__dict__.items():
+        if name.startswith("_") or not isinstance(fn, FunctionType):
+            continue
+        for query in _QUERIES:
+            try:
+                ret = ivy.__dict__[query](fn)
+            except Exception:
+                continue
+            table[query][data_type._fn_support_key(fn)] = _to_json(ret)
+    ivy.previous_backend()
+    return version, table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["numpy"])
+    parser.add_argument("--output", default=data_type._SUPPORT_TABLE_PATH)
+    args = parser.parse_args()
+    support_table = {"ivy_version": ivy.__version__, "backends": dict()}
+    if os.path.exists(args.output):
+        with open(args.output, "r") as f:
+            existing = json.load(f)
+        if existing.get("ivy_version") == ivy.__version__:
+            support_table = existing
+    for backend in args.backends:
+        version, table = generate_support_table(backend)
+        support_table["backends"].setdefault(backend, dict())[version] = table
+        print("{} {}: {} functions".format(backend, version, len(table[_QUERIES[0]])))
+    with open(args.output, "w") as f:
+        json.dump(support_table, f, indent=1, sort_keys=True)
+    print("support table written to {}".format(args.output))